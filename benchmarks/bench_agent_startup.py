@@ -0,0 +1,99 @@
+"""Benchmark: per-context specialist agents via deepcopy vs. the agent factory.
+
+Each measurement runs in a fresh interpreter. After importing the three
+specialist modules, it creates the 15 per-context agents (5 orchestrators x
+Business/ValueSoul/TeamSpirit) either
+
+* ``deepcopy`` - the previous approach: ``copy.deepcopy`` of a built agent
+  (including its model client), or
+* ``factory``  - ``AgentSpec.build()`` sharing the model handle and tools,
+
+and reports wall time and memory allocated (tracemalloc) for that step. It
+also reports the time and peak RSS of importing the whole agent tree
+(``test_agents.agent``), which uses the factory.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_agent_startup --repeat 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+CONTEXTS = 5
+
+
+def _worker(mode: str) -> dict:
+    import copy
+    import gc
+    import resource
+    import time
+    import tracemalloc
+
+    if mode == "import":
+        started = time.perf_counter()
+        import test_agents.agent  # noqa: F401
+        seconds = time.perf_counter() - started
+        return {"seconds": seconds, "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024}
+
+    from test_agents.business_agent import business_agent, business_agent_spec
+    from test_agents.value_soul_agent_base import value_soul_agent_base, value_soul_agent_spec
+    from test_agents.team_spirit_agent_base import team_spirit_agent_base, team_spirit_agent_spec
+    from google.adk.models.lite_llm import LiteLlm
+
+    if mode == "deepcopy":
+        # As before: every base agent owned its own model client
+        bases = [business_agent, value_soul_agent_base, team_spirit_agent_base]
+        for base in bases:
+            base.model = LiteLlm(model="openai/gpt-4.1-mini")
+        make = lambda: [copy.deepcopy(base) for base in bases]
+    else:
+        specs = [business_agent_spec, value_soul_agent_spec, team_spirit_agent_spec]
+        make = lambda: [spec.build() for spec in specs]
+
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    agents = [agent for _ in range(CONTEXTS) for agent in make()]
+    seconds = time.perf_counter() - started
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {"seconds": seconds, "allocated_bytes": allocated, "agents": len(agents)}
+
+
+def _run(mode: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_agent_startup", "--worker", mode],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--worker", choices=["deepcopy", "factory", "import"], help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    # Must be set before test_agents is imported (inherited by the workers)
+    os.environ.setdefault("DOCUMENTS_DIR", tempfile.mkdtemp(prefix="bench_documents_"))
+    if args.worker:
+        print(json.dumps(_worker(args.worker)))
+        return 0
+
+    for mode in ("deepcopy", "factory"):
+        runs = [_run(mode) for _ in range(args.repeat)]
+        best = min(run["seconds"] for run in runs)
+        allocated = min(run["allocated_bytes"] for run in runs)
+        print(f"{mode:<9} {runs[0]['agents']} agents: best {best * 1000:8.1f} ms   "
+              f"allocated {allocated / 2**20:7.2f} MiB")
+    runs = [_run("import") for _ in range(args.repeat)]
+    print(f"{'import':<9} test_agents.agent: best {min(r['seconds'] for r in runs) * 1000:8.1f} ms   "
+          f"peak RSS {min(r['max_rss_bytes'] for r in runs) / 2**20:7.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""Benchmark suite: the document tools on synthetic DOCUMENTS_DIR trees.
+
+Generates a documents tree for a ``--scale`` (task files from 10 up to 100k
+rows, thousands of meeting logs, large partnership documents, a long pirate
+code) from a fixed seed, then measures each tool on it:
+
+    read_task_list, write_task, edit_task            (one scenario per task file size)
+    read_meeting_log, write_meeting_log, edit_pirate_code, read_partnership_documents
+
+Every scenario runs in a fresh interpreter on a fresh copy of the tree, so
+caches, indexes and writes of one scenario never affect another. It reports
+the first call (cold: parsing, index building) separately from the following
+``--calls`` calls (p50/p95/mean latency, throughput), and memory as the growth
+of the worker's peak RSS while the tool ran.
+
+Results are written as JSON (``--output``) with the commit they were measured
+on; ``--compare`` checks them against an earlier file and exits with status 1
+if any scenario's p50 got slower by more than ``--tolerance``.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_document_tools --scale medium --output before.json
+    python -m benchmarks.bench_document_tools --scale medium --compare before.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SCALES = {
+    "small": {"task_rows": (10, 1_000), "meetings": 200, "partnership_kb": 64, "pirate_articles": 200},
+    "medium": {"task_rows": (10, 1_000, 10_000), "meetings": 2_000, "partnership_kb": 1_024,
+               "pirate_articles": 2_000},
+    "large": {"task_rows": (10, 1_000, 10_000, 100_000), "meetings": 5_000, "partnership_kb": 8_192,
+              "pirate_articles": 10_000},
+}
+TASK_TOOLS = ("read_task_list", "write_task", "edit_task")
+OTHER_TOOLS = ("read_meeting_log", "write_meeting_log", "edit_pirate_code", "read_partnership_documents")
+FIRST_MEETING = datetime.date(2000, 1, 1)
+PARTICIPANTS = ["Philipp", "Guillaume", "Alex", "Sam", "Robin"]
+WORDS = ("governance roadmap budget hiring partnership review deadline values feedback retro release customer "
+         "pricing launch onboarding metrics risk alignment strategy sprint").split()
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+# --- Synthetic documents ---
+
+def generate_tree(root: Path, scale: dict, seed: int) -> Path:
+    """Writes the documents of a scale under ``root/documents`` and returns that directory."""
+    from benchmarks.bench_task_parser import write_task_file
+
+    rng = random.Random(seed)
+    documents = root / "documents"
+    meetings = documents / "meetings"
+    meetings.mkdir(parents=True)
+    (documents / "profiles").mkdir()
+
+    for rows in scale["task_rows"]:
+        write_task_file(documents / f"tasks_Rows{rows}.md", rows)
+
+    for day in range(scale["meetings"]):
+        date = (FIRST_MEETING + datetime.timedelta(days=day)).isoformat()
+        participants = "\n".join(f"- {name}" for name in rng.sample(PARTICIPANTS, 3))
+        notes = "\n".join(f"- {_sentence(rng)}" for _ in range(15))
+        (meetings / f"{date}.md").write_text(
+            f"# Meeting Log: {date}\n\n## Participants\n{participants}\n\n## Notes\n{notes}\n", encoding="utf-8")
+
+    for name in ("partnership_agreement.md", "partnership_companion.md"):
+        parts, size, section = [f"# {name[:-3].replace('_', ' ').title()}\n"], 0, 0
+        while size < scale["partnership_kb"] * 1024:
+            section += 1
+            text = f"\n## {section}. Section {section}\n\n" + "\n".join(
+                f"*   **Value {section}.{i}:** {_sentence(rng, 20)}" for i in range(10)) + "\n"
+            parts.append(text)
+            size += len(text)
+        (documents / name).write_text("".join(parts), encoding="utf-8")
+
+    articles = "".join(f"\n\n## Article {i}: Rule {i}\n- {_sentence(rng)}\n"
+                       for i in range(1, scale["pirate_articles"] + 1))
+    (documents / "pirate_code_101.md").write_text(f"# Pirate Code 101\n{articles}", encoding="utf-8")
+    return documents
+
+
+# --- Worker (one scenario, in its own interpreter) ---
+
+def _tool_calls(tools, spec: dict, rng: random.Random):
+    """The function making the scenario's i-th call."""
+    tool, rows, meetings = spec["tool"], spec.get("rows"), spec["meetings"]
+    user = f"Rows{rows}"
+    if tool == "read_task_list":
+        return lambda i: tools.read_task_list(user_name=user)
+    if tool == "write_task":
+        return lambda i: tools.write_task(task_title=f"Bench task {i}", assignee=rng.choice(PARTICIPANTS),
+                                          deadline="2026-12-31", description=_sentence(rng), user_name=user)
+    if tool == "edit_task":
+        return lambda i: tools.edit_task(rng.randint(1, rows), "modify", user,
+                                         {"status": rng.choice(["Pending", "In Progress", "Done"])})
+    if tool == "read_meeting_log":
+        return lambda i: tools.read_meeting_log(
+            (FIRST_MEETING + datetime.timedelta(days=rng.randrange(meetings))).isoformat())
+    if tool == "write_meeting_log":
+        return lambda i: tools.write_meeting_log(
+            (FIRST_MEETING + datetime.timedelta(days=meetings + i)).isoformat(),
+            rng.sample(PARTICIPANTS, 3), "\n".join(f"- {_sentence(rng)}" for _ in range(15)))
+    if tool == "edit_pirate_code":
+        def edit_article(i):
+            article = rng.randint(1, spec["pirate_articles"])
+            return tools.edit_pirate_code(f"## Article {article}: Rule {article}", "modify", f"- {_sentence(rng)}")
+        return edit_article
+    if tool == "read_partnership_documents":
+        return lambda i: tools.read_partnership_documents(rng.choice(["agreement", "companion"]))
+    raise ValueError(f"Unknown tool '{tool}'")
+
+
+def _worker(spec: dict) -> dict:
+    import resource
+
+    from test_agents import tools
+    from test_agents.config import ensure_document_dirs
+
+    ensure_document_dirs()
+    # Import the tool's module first, so the first call measures the tool (parsing, indexes)
+    getattr(tools, spec["tool"])
+    call = _tool_calls(tools, spec, random.Random(spec["seed"]))
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    seconds, errors = [], 0
+    for i in range(spec["calls"] + 1):
+        started = time.perf_counter()
+        result = call(i)
+        seconds.append(time.perf_counter() - started)
+        errors += result.get("status") != "success"
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    first, rest = seconds[0], sorted(seconds[1:])
+    return {
+        "calls": len(rest),
+        "errors": errors,
+        "first_ms": round(first * 1000, 3),
+        "p50_ms": round(statistics.median(rest) * 1000, 3),
+        "p95_ms": round(rest[max(0, round(0.95 * len(rest)) - 1)] * 1000, 3),
+        "mean_ms": round(statistics.fmean(rest) * 1000, 3),
+        "ops_per_s": round(len(rest) / sum(rest), 1),
+        # ru_maxrss is in KiB on Linux
+        "rss_growth_bytes": (rss_after - rss_before) * 1024,
+        "max_rss_bytes": rss_after * 1024,
+    }
+
+
+def _run_scenario(pristine: Path, spec: dict) -> dict:
+    """Runs one scenario in a new interpreter on a copy of the pristine tree."""
+    with tempfile.TemporaryDirectory(prefix="bench_tools_") as workdir:
+        shutil.copytree(pristine, Path(workdir) / "documents")
+        env = {**os.environ, "DOCUMENTS_DIR": str(Path(workdir) / "documents"), "TRACING_ENABLED": "false",
+               "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")]))}
+        # The pirate code path is relative to the working directory (documents/pirate_code_101.md)
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_document_tools", "--worker", json.dumps(spec)],
+            cwd=workdir, env=env, check=True, capture_output=True, text=True,
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+# --- Results ---
+
+def _commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[dict]:
+    """Rows of scenarios measured in both runs, with the p50 change and whether it regressed."""
+    before = {row["scenario"]: row for row in baseline}
+    rows = []
+    for row in results:
+        old = before.get(row["scenario"])
+        if old is None:
+            continue
+        change = row["p50_ms"] / old["p50_ms"] - 1 if old["p50_ms"] else 0.0
+        rows.append({"scenario": row["scenario"], "baseline_p50_ms": old["p50_ms"], "p50_ms": row["p50_ms"],
+                     "change": round(change, 3), "regressed": change > tolerance})
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="medium")
+    parser.add_argument("--calls", type=int, default=50, help="Measured calls per scenario (after the first)")
+    parser.add_argument("--tools", nargs="+", choices=TASK_TOOLS + OTHER_TOOLS, help="Only these tools")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Results JSON of an earlier run to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed p50 slow-down before a scenario counts as a regression (0.25 = 25%%)")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(_worker(json.loads(args.worker))))
+        return 0
+
+    scale = SCALES[args.scale]
+    selected = args.tools or TASK_TOOLS + OTHER_TOOLS
+    with tempfile.TemporaryDirectory(prefix="bench_tree_") as root:
+        # Must be set before test_agents is imported (by the task file generator)
+        os.environ.setdefault("DOCUMENTS_DIR", os.path.join(root, "unused"))
+        started = time.perf_counter()
+        pristine = generate_tree(Path(root), scale, args.seed)
+        print(f"Generated the '{args.scale}' tree in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+        scenarios = [(f"{tool}[rows={rows}]", {"tool": tool, "rows": rows})
+                     for tool in TASK_TOOLS if tool in selected for rows in scale["task_rows"]]
+        scenarios += [(tool, {"tool": tool}) for tool in OTHER_TOOLS if tool in selected]
+        results = []
+        print(f"{'scenario':<34} {'first':>9} {'p50':>9} {'p95':>9} {'ops/s':>9} {'RSS +MiB':>9} {'errors':>6}")
+        for name, spec in scenarios:
+            spec.update(calls=args.calls, seed=args.seed, meetings=scale["meetings"],
+                        pirate_articles=scale["pirate_articles"])
+            row = {"scenario": name, **_run_scenario(pristine, spec)}
+            results.append(row)
+            print(f"{name:<34} {row['first_ms']:>7.2f}ms {row['p50_ms']:>7.2f}ms {row['p95_ms']:>7.2f}ms "
+                  f"{row['ops_per_s']:>9.1f} {row['rss_growth_bytes'] / 2**20:>9.1f} {row['errors']:>6}")
+
+    report = {
+        "meta": {"commit": _commit(), "scale": args.scale, "calls": args.calls, "seed": args.seed,
+                 "python": platform.python_version(), "platform": platform.platform(),
+                 "created": datetime.datetime.now().isoformat(timespec="seconds")},
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if not args.compare:
+        return 0
+
+    baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+    if baseline["meta"]["scale"] != args.scale:
+        print(f"Warning: the baseline was measured at scale '{baseline['meta']['scale']}'")
+    rows = compare(results, baseline["results"], args.tolerance)
+    print(f"\nCompared with {baseline['meta']['commit']} (tolerance {args.tolerance:.0%}):")
+    for row in rows:
+        print(f"{row['scenario']:<34} {row['baseline_p50_ms']:>8.2f}ms -> {row['p50_ms']:>8.2f}ms "
+              f"{row['change']:>+8.1%}{'  REGRESSION' if row['regressed'] else ''}")
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
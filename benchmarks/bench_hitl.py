@@ -0,0 +1,123 @@
+"""Benchmark: sessions waiting for a human do not hold up the others.
+
+Starts ``--sessions`` conversations at once on one runner. Each one is routed
+to the ResolutionOrchestrator, which asks the user to choose an option (a
+HITL tool), and one more session just chats. A local model answers after
+``--latency`` seconds and scripts the calls. The benchmark measures
+
+* how long until every HITL session is paused with a pending request (with
+  the old blocking ``input()`` the first one would never return),
+* that the chatting session finishes meanwhile, and
+* how long ``FakeResponder`` + ``HitlResponder`` take to answer and resume all
+  the paused sessions, which must then have received the chosen option.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_hitl --sessions 20 --latency 0.2
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+
+def _scripted_model(latency: float):
+    from google.adk.models.base_llm import BaseLlm
+    from google.adk.models.llm_response import LlmResponse
+    from google.genai import types
+
+    def reply(*parts):
+        return LlmResponse(content=types.Content(role="model", parts=list(parts)))
+
+    class ScriptedModel(BaseLlm):
+        """Routes to Resolution, asks the user to choose, then reports the choice."""
+
+        async def generate_content_async(self, llm_request, stream=False):
+            await asyncio.sleep(latency)
+            instruction = str(llm_request.config.system_instruction)
+            last = llm_request.contents[-1]
+            responses = [part.function_response for part in last.parts or [] if part.function_response]
+            user_text = "".join(part.text or "" for part in last.parts or [])
+            if responses:
+                yield reply(types.Part(text=json.dumps(responses[0].response)))
+            elif "main Governance Orchestrator" in instruction and "choose" in user_text:
+                yield reply(types.Part(function_call=types.FunctionCall(
+                    name="transfer_to_agent", args={"agent_name": "ResolutionOrchestrator"})))
+            elif "Resolution Orchestrator" in instruction:
+                yield reply(types.Part(function_call=types.FunctionCall(
+                    name="ask_user_to_choose_option", args={"prompt": "Which host?", "options": ["AWS", "GCP"]})))
+            else:
+                yield reply(types.Part(text="Hello!"))
+
+    return ScriptedModel(model="scripted")
+
+
+async def _run(sessions: int, latency: float) -> dict:
+    from google.adk.runners import InMemoryRunner
+    from google.genai import types
+
+    from test_agents.agent import root_agent
+    from test_agents.config import LLM_MODEL
+    from test_agents.hitl import FakeResponder, HitlResponder, hitl_store
+    from test_agents.llm import register_model
+
+    register_model(LLM_MODEL, _scripted_model(latency))
+    runner = InMemoryRunner(agent=root_agent, app_name="bench_hitl")
+
+    async def converse(text: str) -> tuple[str, float]:
+        session = await runner.session_service.create_session(app_name="bench_hitl", user_id="bench")
+        started = time.perf_counter()
+        async for _ in runner.run_async(user_id="bench", session_id=session.id,
+                                        new_message=types.Content(role="user", parts=[types.Part(text=text)])):
+            pass
+        return session.id, time.perf_counter() - started
+
+    started = time.perf_counter()
+    waiting = [asyncio.ensure_future(converse("Help us choose a hosting provider")) for _ in range(sessions)]
+    _, chat_seconds = await converse("Hi there")
+    paused = await asyncio.gather(*waiting)
+    all_paused = time.perf_counter() - started
+    pending = hitl_store.requests(status="pending", app_name="bench_hitl")
+
+    resumed_started = time.perf_counter()
+    FakeResponder().answer_pending(app_name="bench_hitl")
+    delivered = await HitlResponder(runner).deliver_answered()
+    resume_seconds = time.perf_counter() - resumed_started
+
+    received = 0
+    for session_id, _ in paused:
+        session = await runner.session_service.get_session(app_name="bench_hitl", user_id="bench",
+                                                           session_id=session_id)
+        received += any('"selected_option": "AWS"' in (part.text or "")
+                        for event in session.events if event.content for part in event.content.parts or [])
+    return {
+        "sessions": sessions,
+        "model_latency_s": latency,
+        "pending_requests": len(pending),
+        "all_paused_s": round(all_paused, 3),
+        "max_session_until_pause_s": round(max(seconds for _, seconds in paused), 3),
+        "chat_session_s": round(chat_seconds, 3),
+        "delivered": delivered,
+        "resume_all_s": round(resume_seconds, 3),
+        "sessions_with_answer": received,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds per model call")
+    args = parser.parse_args(argv)
+
+    # Before test_agents is imported: a fresh store, and no cached or locally routed answers
+    os.environ.setdefault("DOCUMENTS_DIR", tempfile.mkdtemp(prefix="bench_documents_"))
+    os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+    os.environ["ROUTER_ENABLED"] = "false"
+    print(json.dumps(asyncio.run(_run(args.sessions, args.latency)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
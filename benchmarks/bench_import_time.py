@@ -0,0 +1,107 @@
+"""Benchmark: cold-start cost of importing the agent tree.
+
+Runs ``python -X importtime -c "import test_agents.agent"`` in fresh
+interpreters and parses its report (self/cumulative microseconds per module)
+to show
+
+* the total time of ``import test_agents.agent`` (best of ``--repeat`` runs),
+* the time spent in the top-level packages it pulls in (by self time), and
+* the slowest ``test_agents`` modules (by cumulative time),
+
+and, in another fresh interpreter, how long the first routing into a context
+takes (building one orchestrator's specialists, which imports the tool
+modules; LiteLLM itself is imported by the first model request).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_import_time --repeat 5 --top 10
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+
+MODULE = "test_agents.agent"
+
+
+def _import_report(module: str) -> list[tuple[str, int, int]]:
+    """Imports ``module`` in a fresh interpreter; returns (module, self us, cumulative us) per import."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True, capture_output=True, text=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        # "import time:       123 |       4567 |   package.module"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def _first_routing_worker() -> dict:
+    import time
+
+    started = time.perf_counter()
+    import test_agents.agent
+    imported = time.perf_counter()
+    orchestrator = test_agents.agent.root_agent.find_agent("PlanningOrchestrator")
+    orchestrator.load_sub_agents()
+    loaded = time.perf_counter()
+    return {"import_seconds": imported - started, "first_routing_seconds": loaded - imported,
+            "sub_agents": len(orchestrator.sub_agents)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10, help="Rows to show per table")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    # Must be set before test_agents is imported (inherited by the subprocesses)
+    os.environ.setdefault("DOCUMENTS_DIR", tempfile.mkdtemp(prefix="bench_documents_"))
+    if args.worker:
+        print(json.dumps(_first_routing_worker()))
+        return 0
+
+    def total_us(rows: list[tuple[str, int, int]]) -> int:
+        # The package __init__ may import the module too, so it can be listed twice
+        return max(cumulative for name, _, cumulative in rows if name == MODULE)
+
+    best = min((_import_report(MODULE) for _ in range(args.repeat)), key=total_us)
+    print(f"import {MODULE}: best {total_us(best) / 1000:8.1f} ms of {args.repeat} runs "
+          f"({len(best)} modules imported)")
+
+    by_package: dict[str, int] = defaultdict(int)
+    for name, self_us, _ in best:
+        by_package[name.split(".")[0]] += self_us
+    print(f"\nTop {args.top} packages by self time:")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+
+    own: dict[str, int] = {}
+    for name, _, cumulative_us in best:
+        if name.split(".")[0] == "test_agents":
+            own[name] = max(own.get(name, 0), cumulative_us)
+    print(f"\nTop {args.top} test_agents modules by cumulative time:")
+    for name, cumulative_us in sorted(own.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    runs = [
+        json.loads(subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_import_time", "--worker"],
+            check=True, capture_output=True, text=True,
+        ).stdout.strip().splitlines()[-1])
+        for _ in range(args.repeat)
+    ]
+    print(f"\nfirst routing into a context ({runs[0]['sub_agents']} specialists): "
+          f"best {min(run['first_routing_seconds'] for run in runs) * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
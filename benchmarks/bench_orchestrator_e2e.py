@@ -0,0 +1,189 @@
+"""Benchmark: the whole agent tree under concurrent sessions, offline.
+
+Runs ``root_agent`` with the local stub model (``LLM_MODEL=stub``, see
+``test_agents/stub_llm.py``), so every request takes the full path root ->
+context orchestrator -> specialist -> tool -> answer. For each level of
+``--concurrency`` that many clients start at once and each sends the
+scripted ``MESSAGES`` one after the other (listing, adding and completing
+tasks, the latest meeting, the relevant values), each in a new session: in
+an existing session ADK hands the next message straight to the agent that
+answered the last one, which would skip the root and the orchestrator.
+It reports
+
+* requests/second and the p50/p95 latency of a request,
+* model calls, transfers and tool calls per request,
+* the overhead of each hop: the time an agent run (or model call, or tool
+  call) spends outside its children, from the tracing spans, so the stub's
+  ``--latency`` is not counted,
+* the memory per session (``tracemalloc``, in a separate pass: the growth
+  with all the sessions and their histories in memory, divided by their
+  number, and the peak while they run).
+
+The stub answers after ``--latency`` seconds (default 0: pure framework
+overhead). The response cache and the local router are off unless ``--cache``
+or ``--router`` are given; a fresh document directory is used.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_orchestrator_e2e --concurrency 1,10,50 --latency 0.05
+"""
+import argparse
+import asyncio
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+MESSAGES = (
+    "Show my tasks",
+    "Add a task to review the Q4 budget",
+    "Mark task 1 as done",
+    "Summarize the latest meeting",
+    "Are we aligned with our values on pricing?",
+)
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+async def _clients(runner, count: int, messages: tuple, label: str) -> list[float]:
+    """Runs ``count`` clients at once; returns the seconds of every request."""
+    from google.genai import types
+
+    async def converse(index: int) -> list[float]:
+        seconds = []
+        for text in messages:
+            session = await runner.session_service.create_session(app_name="bench_e2e", user_id=f"{label}-{index}")
+            started = time.perf_counter()
+            async for event in runner.run_async(user_id=f"{label}-{index}", session_id=session.id,
+                                                new_message=types.Content(role="user", parts=[types.Part(text=text)])):
+                if event.error_code:
+                    raise RuntimeError(f"{event.author}: {event.error_code} {event.error_message}")
+            seconds.append(time.perf_counter() - started)
+        return seconds
+
+    results = await asyncio.gather(*(converse(index) for index in range(count)))
+    return [seconds for client in results for seconds in client]
+
+
+def _hops(spans: list[dict], latency: float) -> dict:
+    """Per component: calls and p50/p95 self time (duration minus its child spans and, for model
+    calls, the stub's latency), in ms."""
+    children = defaultdict(float)
+    for span in spans:
+        if span["parentSpanId"]:
+            children[span["parentSpanId"]] += span["endTimeUnixNano"] - span["startTimeUnixNano"]
+    self_ms = defaultdict(list)
+    for span in spans:
+        duration = span["endTimeUnixNano"] - span["startTimeUnixNano"]
+        if span["attributes"]["component.kind"] == "model":
+            duration -= latency * 1e9
+        self_ms[span["name"]].append(max(0.0, duration - children[span["spanId"]]) / 1e6)
+    hops = {}
+    for component, values in sorted(self_ms.items()):
+        values.sort()
+        hops[component] = {"calls": len(values), "self_p50_ms": round(_percentile(values, 0.5), 3),
+                           "self_p95_ms": round(_percentile(values, 0.95), 3)}
+    return hops
+
+
+async def _run(levels: list[int], messages: tuple, latency: float) -> dict:
+    from google.adk.runners import InMemoryRunner
+
+    from test_agents import tracing
+    from test_agents.agent import root_agent
+    from test_agents.config import TRACE_FILE
+
+    runner = InMemoryRunner(agent=root_agent, app_name="bench_e2e")
+    # Warm-up: the first request builds the lazy agents and imports the tools
+    await _clients(runner, 1, messages, "warm-up")
+
+    rows = []
+    for level in levels:
+        # The tracer keeps the file open and appends: this level's spans are the ones after these
+        traced = len(tracing.read_spans(TRACE_FILE)) if os.path.exists(TRACE_FILE) else 0
+        started = time.perf_counter()
+        seconds = sorted(await _clients(runner, level, messages, f"c{level}"))
+        elapsed = time.perf_counter() - started
+        spans = tracing.read_spans(TRACE_FILE)[traced:]
+        calls = lambda kind: sum(span["attributes"]["component.kind"] == kind for span in spans)
+        transfers = sum(span["name"] == "tool:transfer_to_agent" for span in spans)
+        rows.append({
+            "concurrency": level,
+            "requests": len(seconds),
+            "requests_per_s": round(len(seconds) / elapsed, 1),
+            "p50_ms": round(_percentile(seconds, 0.5) * 1000, 2),
+            "p95_ms": round(_percentile(seconds, 0.95) * 1000, 2),
+            "model_calls_per_request": round(calls("model") / len(seconds), 2),
+            "transfers_per_request": round(transfers / len(seconds), 2),
+            "tool_calls_per_request": round((calls("tool") - transfers) / len(seconds), 2),
+            "hops": _hops(spans, latency),
+        })
+
+    memory = []
+    for level in levels:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        sessions = len(await _clients(runner, level, messages, f"m{level}"))
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory.append({"concurrency": level, "sessions": sessions,
+                       "kib_per_session": round((after - before) / sessions / 1024, 1),
+                       "peak_kib": round((peak - before) / 1024, 1)})
+    return {"runs": rows, "memory": memory}
+
+
+def _print_table(result: dict, latency: float):
+    print(f"stub latency {latency * 1000:.0f} ms, {len(MESSAGES)} requests per client")
+    print(f"{'clients':>8} {'requests':>8} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'models/req':>10} "
+          f"{'transfers/req':>13} {'tools/req':>9}")
+    for row in result["runs"]:
+        print(f"{row['concurrency']:>8} {row['requests']:>8} {row['requests_per_s']:>8} {row['p50_ms']:>9} "
+              f"{row['p95_ms']:>9} {row['model_calls_per_request']:>10} {row['transfers_per_request']:>13} "
+              f"{row['tool_calls_per_request']:>9}")
+    for row in result["runs"]:
+        print(f"\nper-hop overhead at {row['concurrency']} clients (self time, ms)")
+        print(f"{'component':<45} {'calls':>6} {'p50':>8} {'p95':>8}")
+        for component, hop in row["hops"].items():
+            print(f"{component:<45} {hop['calls']:>6} {hop['self_p50_ms']:>8} {hop['self_p95_ms']:>8}")
+    print(f"\n{'clients':>8} {'sessions':>8} {'KiB/session':>12} {'peak KiB':>9}")
+    for row in result["memory"]:
+        print(f"{row['concurrency']:>8} {row['sessions']:>8} {row['kib_per_session']:>12} {row['peak_kib']:>9}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,10,50", help="Comma-separated numbers of concurrent clients")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per stub model call")
+    parser.add_argument("--cache", action="store_true", help="Keep the response cache on")
+    parser.add_argument("--router", action="store_true", help="Keep the local router on")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args(argv)
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    # Before test_agents is imported: the stub model, a fresh store and a trace file to read the hops from
+    workdir = tempfile.mkdtemp(prefix="bench_e2e_")
+    os.environ["LLM_MODEL"] = "stub"
+    os.environ["STUB_LLM_LATENCY"] = str(args.latency)
+    os.environ.setdefault("DOCUMENTS_DIR", os.path.join(workdir, "documents"))
+    os.environ["RESPONSE_CACHE_ENABLED"] = str(args.cache).lower()
+    os.environ["ROUTER_ENABLED"] = str(args.router).lower()
+    os.environ["TRACING_ENABLED"] = "true"
+    os.environ["TRACE_FILE"] = os.path.join(workdir, "traces.jsonl")
+    result = asyncio.run(_run(levels, MESSAGES, args.latency))
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        _print_table(result, args.latency)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Benchmark: hit rate, accuracy and latency of the local context router.
+
+Classifies a labelled set of requests with ``ContextRouter`` and reports how
+many it routes without the LLM (hit rate), how many of those go to the right
+context (precision) and the classification latency. By default only the
+rules are used; with ``--train`` the classifier is trained on every other
+example and the router (rules + classifier) is evaluated on the rest.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_router
+    python -m benchmarks.bench_router --train --examples my_requests.jsonl
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+
+# (request, expected context)
+EXAMPLES = [
+    ("Mark task 12 as done", "Execution"),
+    ("task 7 is finished, please update it", "Execution"),
+    ("Give me a status update on the website redesign", "Execution"),
+    ("What's the status of Guillaume's tasks?", "Execution"),
+    ("Log 3 hours of work on the budget review", "Execution"),
+    ("I completed the onboarding checklist today", "Execution"),
+    ("Close out task 31, we shipped it", "Execution"),
+    ("Progress update: the API migration is 80% through", "Execution"),
+    ("Draft a plan for the Q3 launch", "Planning"),
+    ("Let's do the weekly review", "Planning"),
+    ("Log the meeting from 2026-10-01", "Planning"),
+    ("Here are the meeting notes from yesterday's sync, extract the tasks", "Planning"),
+    ("Plan the next sprint for Philipp and Guillaume", "Planning"),
+    ("We need a roadmap and milestones for the new product", "Planning"),
+    ("Break the fundraising goal down into tasks with deadlines", "Planning"),
+    ("Analyze this transcript and create follow-ups", "Planning"),
+    ("Evaluate whether the pilot met its goals", "Evaluation"),
+    ("Assess the outcome of the hiring milestone", "Evaluation"),
+    ("Is our pricing decision aligned with our values?", "Evaluation"),
+    ("How effective was Monday's meeting?", "Evaluation"),
+    ("Did the launch achieve what we set out to do?", "Evaluation"),
+    ("Review the results of the marketing campaign against the targets", "Evaluation"),
+    ("Let's reflect on how the last month went", "Reflection"),
+    ("What lessons learned should we capture from phase one?", "Reflection"),
+    ("Run a retrospective on the release", "Reflection"),
+    ("How is team morale these days?", "Reflection"),
+    ("I'd like to look back on what went well and what didn't", "Reflection"),
+    ("Gather feedback from both of us about working together", "Reflection"),
+    ("Philipp and Guillaume disagree about the budget", "Resolution"),
+    ("Help us decide between option A and option B for hosting", "Resolution"),
+    ("We have a conflict over who owns the sales pipeline", "Resolution"),
+    ("Formalize the agreement we reached on equity", "Resolution"),
+    ("We can't agree on the hiring priority, mediate please", "Resolution"),
+    ("Choose one of the three vendor options with us", "Resolution"),
+    ("Hello!", None),
+    ("Can you help me?", None),
+    ("What can this system do?", None),
+    ("Thanks, that's all for now", None),
+]
+
+
+def _load_examples(path: str) -> list[tuple[str, str]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [(row["text"], row.get("context")) for row in (json.loads(line) for line in f if line.strip())]
+
+
+def _evaluate(router, examples: list[tuple[str, str]]) -> dict:
+    decisions = [(router.classify(text), expected) for text, expected in examples]
+    routed = [(decision, expected) for decision, expected in decisions if decision.context is not None]
+    correct = sum(decision.context == expected for decision, expected in routed)
+    # Requests that are not clearly one context should go to the LLM
+    routable = sum(expected is not None for _, expected in examples)
+    latencies = sorted(decision.seconds * 1e6 for decision, _ in decisions)
+    return {
+        "requests": len(examples),
+        "routed": len(routed),
+        "hit_rate": round(len(routed) / routable, 4) if routable else 0.0,
+        "precision": round(correct / len(routed), 4) if routed else None,
+        "by_source": {source: sum(d.source == source for d, _ in routed) for source in ("rule", "model")},
+        "p50_us": round(statistics.median(latencies), 1),
+        "p95_us": round(latencies[int(0.95 * (len(latencies) - 1))], 1),
+        "wrong": [(text, d.context, expected) for (text, expected), (d, _) in zip(examples, decisions)
+                  if d.context is not None and d.context != expected],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--examples", help="JSONL file of {text, context} (context null: leave to the LLM)")
+    parser.add_argument("--train", action="store_true", help="Train the classifier on half of the examples")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DOCUMENTS_DIR", tempfile.mkdtemp(prefix="bench_documents_"))
+    from test_agents.router import ContextRouter, LinearRouterModel
+
+    examples = _load_examples(args.examples) if args.examples else EXAMPLES
+    if args.train:
+        training = [(text, context) for text, context in examples[::2] if context is not None]
+        evaluation = examples[1::2]
+        model_file = os.path.join(tempfile.mkdtemp(prefix="bench_router_"), "router_model.npz")
+        LinearRouterModel.train(training).save(model_file)
+        router = ContextRouter(model_file)
+        print(f"classifier trained on {len(training)} examples, evaluated on {len(evaluation)}")
+    else:
+        evaluation = examples
+        router = ContextRouter(None)
+    result = _evaluate(router, evaluation)
+    wrong = result.pop("wrong")
+    print(json.dumps(result, indent=2))
+    for text, routed_to, expected in wrong:
+        print(f"  misrouted to {routed_to} (expected {expected}): {text!r}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
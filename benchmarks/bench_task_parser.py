@@ -0,0 +1,112 @@
+"""Benchmark: streaming task table parser vs. the previous whole-file parser.
+
+Generates a task file with N rows and measures wall time and peak traced
+memory (tracemalloc) for:
+
+* ``legacy``  - the previous implementation (read whole file, find header,
+  splitlines, strip, join, StringIO, csv.reader, build every Task)
+* ``stream``  - ``task_tools._read_tasks_from_file`` (single pass over the
+  file handle, lazy rows, one ``TaskRecord`` tuple per row)
+* ``rows``    - streaming rows only, without building any task objects
+
+Usage (from the repository root):
+    python -m benchmarks.bench_task_parser --rows 100000
+"""
+import argparse
+import csv
+import gc
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Must be set before test_agents is imported
+os.environ.setdefault("DOCUMENTS_DIR", tempfile.mkdtemp(prefix="bench_documents_"))
+
+from test_agents.models import Task
+from test_agents.tools import task_tools
+from test_agents.tools.task_tools import TASK_TABLE_HEADER
+
+
+def legacy_read_tasks(file_path: Path) -> list[Task]:
+    """The parser as it was before streaming (kept here as the baseline)."""
+    tasks = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        raw_content = f.read()
+    table_start = raw_content.find(TASK_TABLE_HEADER)
+    if table_start == -1:
+        return tasks
+    table_lines = raw_content[table_start + len(TASK_TABLE_HEADER):].strip().splitlines()
+    cleaned_lines = [line.strip().strip('|').strip() for line in table_lines if line.strip()]
+    reader = csv.reader(io.StringIO("\n".join(cleaned_lines)), delimiter='|', skipinitialspace=True)
+    for row in reader:
+        cleaned_row = [cell.strip() for cell in row]
+        if len(cleaned_row) == 6:
+            try:
+                tasks.append(Task(task_id=int(cleaned_row[0]), title=cleaned_row[1], assignee=cleaned_row[2],
+                                  deadline=cleaned_row[3], description=cleaned_row[4], status=cleaned_row[5]))
+            except (ValueError, IndexError):
+                continue
+    return tasks
+
+
+def stream_rows_only(file_path: Path) -> int:
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return sum(1 for _ in task_tools._iter_task_rows(f))
+
+
+def write_task_file(file_path: Path, rows: int):
+    assignees = ["Philipp", "Guillaume", "Alex", "Sam"]
+    statuses = ["Pending", "In Progress", "Done"]
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write("# Task List for Bench\n\n")
+        f.write(TASK_TABLE_HEADER)
+        for i in range(1, rows + 1):
+            f.write(f"| {i} | Task number {i} | {assignees[i % 4]} | 2026-{1 + i % 12:02d}-{1 + i % 28:02d} "
+                    f"| Synthetic description for task {i} with a few more words | {statuses[i % 3]} |\n")
+
+
+def measure(label: str, fn, repeat: int) -> dict:
+    times = []
+    peak = 0
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - started)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del result
+    best = min(times)
+    print(f"{label:<8} best {best * 1000:9.1f} ms   peak traced memory {peak / 2**20:8.1f} MiB")
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    file_path = Path(tempfile.mkdtemp(prefix="bench_tasks_")) / "tasks_Bench.md"
+    write_task_file(file_path, args.rows)
+    print(f"{args.rows} rows, {file_path.stat().st_size / 2**20:.1f} MiB")
+
+    streamed, _ = task_tools._read_tasks_from_file(file_path, "Bench")
+    if [task._asdict() for task in streamed] != [task.model_dump() for task in legacy_read_tasks(file_path)]:
+        print("FAIL: streaming parser output differs from the legacy parser")
+        return 1
+
+    measure("legacy", lambda: legacy_read_tasks(file_path), args.repeat)
+    measure("stream", lambda: task_tools._read_tasks_from_file(file_path, "Bench"), args.repeat)
+    measure("rows", lambda: stream_rows_only(file_path), args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""Benchmark: wall-clock of the orchestrator workflows, sequential vs parallel.
+
+Runs every workflow of ``context_orchestrators/workflows.py`` twice, once
+with one step at a time (as the orchestrators' instructions used to require)
+and once with independent steps running concurrently. Each step runs its
+specialist agent through an ADK runner against a local model that answers
+after ``--latency`` seconds, so the numbers show the orchestration overhead
+and the speed-up from the fan-out (the ideal speed-up is steps / stages).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_workflows --latency 0.5
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+
+
+def _delayed_model(latency: float):
+    from google.adk.models.base_llm import BaseLlm
+    from google.adk.models.llm_response import LlmResponse
+    from google.genai import types
+
+    class DelayedModel(BaseLlm):
+        """Answers every request with a short text after a fixed delay."""
+
+        async def generate_content_async(self, llm_request, stream=False):
+            await asyncio.sleep(latency)
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text="Step done.")]))
+
+    return DelayedModel(model="delayed")
+
+
+async def _run(latency: float) -> list[dict]:
+    from google.adk.runners import InMemoryRunner
+    from google.genai import types
+
+    from test_agents.config import LLM_MODEL
+    from test_agents.context_orchestrators.specialists import specialist_specs
+    from test_agents.context_orchestrators.workflows import WORKFLOWS, execute_workflow
+    from test_agents.llm import register_model
+
+    register_model(LLM_MODEL, _delayed_model(latency))
+    specs = specialist_specs()
+
+    async def run_step(step, prompt: str) -> str:
+        runner = InMemoryRunner(agent=specs[step.agent].build(), app_name="bench")
+        session = await runner.session_service.create_session(app_name="bench", user_id="bench")
+        text = ""
+        async for event in runner.run_async(user_id="bench", session_id=session.id,
+                                            new_message=types.Content(role="user", parts=[types.Part(text=prompt)])):
+            if event.content and event.content.parts and event.content.parts[0].text:
+                text = event.content.parts[0].text
+        return text
+
+    # Warm-up: the first run of each agent pays for one-off imports and tool declarations
+    for workflow in WORKFLOWS["Planning"].values():
+        await execute_workflow(workflow, "warm-up", run_step)
+
+    rows = []
+    for context, workflows in WORKFLOWS.items():
+        for workflow in workflows.values():
+            sequential = await execute_workflow(workflow, "Weekly review for Philipp", run_step, max_concurrency=1)
+            parallel = await execute_workflow(workflow, "Weekly review for Philipp", run_step)
+            rows.append({
+                "context": context,
+                "variant": workflow.variant,
+                "steps": len(workflow.steps),
+                "stages": len(workflow.stages),
+                "sequential_s": sequential["seconds"],
+                "parallel_s": parallel["seconds"],
+                "speedup": round(sequential["seconds"] / parallel["seconds"], 2),
+            })
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds per model call")
+    parser.add_argument("--json", action="store_true", help="Print the rows as JSON")
+    args = parser.parse_args(argv)
+
+    # Before test_agents is imported; cached answers would make the second run free
+    os.environ.setdefault("DOCUMENTS_DIR", tempfile.mkdtemp(prefix="bench_documents_"))
+    os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+    rows = asyncio.run(_run(args.latency))
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"{'variant':<20} {'steps':>5} {'stages':>6} {'sequential':>11} {'parallel':>9} {'speedup':>8}")
+    for row in rows:
+        print(f"{row['variant']:<20} {row['steps']:>5} {row['stages']:>6} {row['sequential_s']:>10.2f}s "
+              f"{row['parallel_s']:>8.2f}s {row['speedup']:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
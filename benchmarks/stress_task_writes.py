@@ -0,0 +1,102 @@
+"""Stress test: many processes adding and editing tasks in ONE task file.
+
+Spawns N worker processes that all call ``write_task`` / ``edit_task`` on the
+same user's list inside a throwaway DOCUMENTS_DIR (with a small journal
+threshold so compactions race with appends), then checks that no update was
+lost and the file is well-formed.
+
+Usage (from the repository root):
+    python -m benchmarks.stress_task_writes --processes 8 --tasks-per-process 50
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+USER_NAME = "Stress"
+
+
+def _worker(worker_id: int, tasks_per_process: int, barrier) -> list[int]:
+    from test_agents.tools import task_tools
+
+    # Start hammering only once every worker has finished importing
+    barrier.wait()
+    edited_ids = []
+    for i in range(tasks_per_process):
+        result = task_tools.write_task(
+            task_title=f"w{worker_id}-t{i}",
+            assignee=f"worker{worker_id}",
+            deadline="2026-11-01",
+            description=f"Task {i} from worker {worker_id}",
+            user_name=USER_NAME,
+        )
+        if result["status"] != "success":
+            raise RuntimeError(f"write_task failed: {result}")
+        if i % 3 == 0:
+            edit = task_tools.edit_task(result["task_id"], "modify", USER_NAME, {"status": "Done"})
+            if edit["status"] != "success":
+                raise RuntimeError(f"edit_task failed: {edit}")
+            edited_ids.append(result["task_id"])
+    return edited_ids
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--tasks-per-process", type=int, default=50)
+    parser.add_argument("--journal-max-bytes", type=int, default=4096,
+                        help="Small threshold so compactions interleave with appends.")
+    args = parser.parse_args(argv)
+
+    documents_dir = tempfile.mkdtemp(prefix="stress_documents_")
+    # Must be set before test_agents is imported (here and in the spawned workers)
+    os.environ["DOCUMENTS_DIR"] = documents_dir
+    os.environ["TASKS_JOURNAL_MAX_BYTES"] = str(args.journal_max_bytes)
+
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Manager().Barrier(args.processes + 1)
+    with ctx.Pool(args.processes) as pool:
+        pending = [pool.apply_async(_worker, (w, args.tasks_per_process, barrier))
+                   for w in range(args.processes)]
+        barrier.wait()
+        started = time.perf_counter()
+        edited_ids = [task_id for p in pending for task_id in p.get()]
+        elapsed = time.perf_counter() - started
+
+    from test_agents.tools import task_tools
+    result = task_tools.read_task_list(USER_NAME)["result"]
+    tasks = result["tasks"]
+    expected = args.processes * args.tasks_per_process
+    ids = [t["task_id"] for t in tasks]
+    errors = []
+    if len(tasks) != expected:
+        errors.append(f"expected {expected} tasks, found {len(tasks)} (lost updates)")
+    if len(set(ids)) != len(ids):
+        errors.append("duplicate task IDs")
+    statuses = {t["task_id"]: t["status"] for t in tasks}
+    lost_edits = [task_id for task_id in edited_ids if statuses.get(task_id) != "Done"]
+    if lost_edits:
+        errors.append(f"{len(lost_edits)} status edits lost (e.g. IDs {lost_edits[:5]})")
+
+    # The compacted markdown on disk must agree with the journal-replayed view
+    task_tools.compact_task_list(USER_NAME)
+    task_tools._task_store.invalidate()
+    on_disk = task_tools.read_task_list(USER_NAME)["result"]["tasks"]
+    if on_disk != tasks:
+        errors.append("compacted task file differs from the replayed task list")
+
+    operations = expected + len(edited_ids)
+    print(f"{args.processes} processes, {operations} operations in {elapsed:.2f}s "
+          f"({operations / elapsed:.0f} ops/s) against {documents_dir}")
+    if errors:
+        for error in errors:
+            print(f"FAIL: {error}")
+        return 1
+    print("OK: no lost updates, IDs unique, file consistent")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
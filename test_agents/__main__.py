@@ -0,0 +1,37 @@
+"""Command line entry point: ``python -m test_agents <command> ...``.
+
+Commands:
+    router    Train or try the local context router (see router.py)
+    command   Run tool commands directly, without the agents (see commands.py)
+    cache     Show statistics of or clear the LLM response cache (see response_cache.py)
+    hitl      List and answer pending human-in-the-loop requests (see hitl.py)
+    checkpoints  List, show or clear the workflow checkpoints (see checkpoints.py)
+    trace     Report p50/p95 latency, tokens and I/O per agent, model and tool (see tracing.py)
+    tasks     Compact the task lists' mutation journals (see tools/task_tools.py)
+"""
+import sys
+
+from . import checkpoints, commands, hitl, response_cache, router, tracing
+from .tools import task_tools
+
+COMMANDS = {
+    "router": router.main,
+    "command": commands.main,
+    "cache": response_cache.main,
+    "hitl": hitl.main,
+    "checkpoints": checkpoints.main,
+    "trace": tracing.main,
+    "tasks": task_tools.main,
+}
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        print(__doc__.strip())
+        return 2
+    return COMMANDS[argv[0]](argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""Lightweight construction of per-context specialist agents.
+
+Each context orchestrator needs its own instances of the Business, ValueSoul
+and TeamSpirit agents (an ADK agent can only have one parent). They used to
+be created with ``copy.deepcopy`` of a fully built agent, which also copied
+its ``LiteLlm`` client and tool wrappers 15 times at import. Instead, each
+specialist is described once by an immutable ``AgentSpec`` and
+``build_agent`` creates a fresh ``Agent`` from it; the model client (see
+``PooledAgent``) and the tool functions are shared, not copied.
+
+Context orchestrators are ``LazyOrchestrator`` agents: their specialists (and
+with them the tool modules) are only built the first time a request is routed
+into that context, which keeps the cold start of a worker down to importing
+ADK itself. They also keep their workflow's checkpoints (see checkpoints.py).
+"""
+import threading
+import typing
+from dataclasses import dataclass
+
+from google.adk.agents import Agent, BaseAgent, LlmAgent
+from google.adk.utils.context_utils import Aclosing
+from pydantic import PrivateAttr
+
+from .checkpoints import checkpoint_store
+from .config import LLM_MODEL
+from .hitl import hitl_store
+from .llm import get_model
+from .response_cache import response_cache
+from .tracing import tracer
+
+# Agents take the model *name*; PooledAgent resolves it to the shared client
+DEFAULT_MODEL_NAME = LLM_MODEL
+
+
+class PooledAgent(Agent):
+    """An ``Agent`` whose model name resolves to the process-wide client from ``llm.get_model``.
+
+    A plain ``Agent`` given a model name creates its own client (through ADK's
+    model registry) on first use. Its model calls also go through the shared
+    ``response_cache``, after the agent's own model callbacks. With tracing
+    enabled, its runs, model calls and tool calls are spans of the ``tracer``
+    (which wraps the other callbacks, so answers from a callback are traced too).
+    """
+
+    @property
+    def canonical_model(self):
+        if isinstance(self.model, str) and self.model:
+            return get_model(self.model)
+        return super().canonical_model
+
+    @property
+    def canonical_live_model(self):
+        if isinstance(self.model, str) and self.model:
+            return get_model(self.model)
+        return super().canonical_live_model
+
+    def _layered_before_model_callbacks(self) -> list:
+        return [response_cache.before_model_callback]
+
+    def _layered_after_model_callbacks(self) -> list:
+        return [response_cache.after_model_callback]
+
+    @property
+    def canonical_before_model_callbacks(self):
+        return tracer.before_model_callbacks(
+            [*super().canonical_before_model_callbacks, *self._layered_before_model_callbacks()])
+
+    @property
+    def canonical_after_model_callbacks(self):
+        return tracer.after_model_callbacks(
+            [*super().canonical_after_model_callbacks, *self._layered_after_model_callbacks()])
+
+    @property
+    def canonical_before_agent_callbacks(self):
+        return tracer.before_agent_callbacks(super().canonical_before_agent_callbacks)
+
+    @property
+    def canonical_after_agent_callbacks(self):
+        return tracer.after_agent_callbacks(super().canonical_after_agent_callbacks)
+
+    @property
+    def canonical_before_tool_callbacks(self):
+        return tracer.before_tool_callbacks(super().canonical_before_tool_callbacks)
+
+    @property
+    def canonical_after_tool_callbacks(self):
+        return tracer.after_tool_callbacks(super().canonical_after_tool_callbacks)
+
+    @property
+    def canonical_on_tool_error_callbacks(self):
+        return tracer.on_tool_error_callbacks(super().canonical_on_tool_error_callbacks)
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """Immutable definition of an agent: everything needed to build an instance."""
+    name: str
+    description: str
+    instruction: str
+    tools: tuple[typing.Callable, ...] = ()
+    # A model name (resolved to the shared client) or a BaseLlm instance
+    model: typing.Any = DEFAULT_MODEL_NAME
+
+    def build(self, **overrides) -> Agent:
+        """Creates a new, parentless ``PooledAgent`` from this spec.
+
+        Keyword arguments override the spec's fields (e.g. ``name=``) or add
+        other ``Agent`` options (e.g. callbacks).
+        """
+        options = {
+            "name": self.name,
+            "description": self.description,
+            "instruction": self.instruction,
+            "model": self.model,
+            "tools": list(self.tools),
+        }
+        options.update(overrides)
+        return PooledAgent(**options)
+
+
+def build_agent(spec: AgentSpec, **overrides) -> Agent:
+    """Builds an agent instance from a spec (see ``AgentSpec.build``)."""
+    return spec.build(**overrides)
+
+
+class LazyOrchestrator(PooledAgent):
+    """A ``PooledAgent`` whose sub-agents are created by ``sub_agent_factory`` when first needed.
+
+    They are built before the agent first runs (so the transfer targets are in
+    its prompt) or when one of ``lazy_sub_agent_names`` is looked up, which is
+    how ADK resumes a session whose last speaker was one of them. Lookups of
+    other names (e.g. a transfer to a sibling orchestrator) do not load them.
+
+    ADK runs clones of the agent tree (one per invocation and node run). A
+    clone made before loading loads on its own: it loads the agent it was
+    cloned from and clones that agent's sub-agents, so the factory runs only
+    once per orchestrator and transfers resolve on either instance.
+
+    Its steps, tool calls and HITL decisions are recorded in the
+    ``checkpoint_store``, which also restores and compacts its context before
+    each model call (before the response cache, so cached responses are keyed
+    on the compacted request). HITL answers it receives in the session mark
+    their requests delivered in the ``hitl_store``.
+    """
+    sub_agent_factory: typing.Optional[typing.Callable[[], list[BaseAgent]]] = None
+    lazy_sub_agent_names: tuple[str, ...] = ()
+    _load_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _clone_source: typing.Optional["LazyOrchestrator"] = PrivateAttr(default=None)
+    _lazy_sub_agents: list[BaseAgent] = PrivateAttr(default_factory=list)
+
+    @property
+    def sub_agents_loaded(self) -> bool:
+        return self.sub_agent_factory is None
+
+    def load_sub_agents(self) -> list[BaseAgent]:
+        """Builds the sub-agents if that has not happened yet and returns all sub-agents."""
+        if self.sub_agent_factory is None:
+            return self.sub_agents
+        with self._load_lock:
+            if self.sub_agent_factory is not None:
+                source = self._clone_source
+                if source is not None:
+                    source.load_sub_agents()
+                    sub_agents = [sub_agent.clone() for sub_agent in source._lazy_sub_agents]
+                else:
+                    sub_agents = self.sub_agent_factory()
+                # What BaseAgent/LlmAgent.model_post_init do for sub-agents passed to the constructor
+                for sub_agent in sub_agents:
+                    if sub_agent.parent_agent is not None:
+                        raise ValueError(
+                            f"Agent `{sub_agent.name}` already has a parent agent, current parent: "
+                            f"`{sub_agent.parent_agent.name}`, trying to add: `{self.name}`"
+                        )
+                    sub_agent.parent_agent = self
+                    if isinstance(sub_agent, LlmAgent) and sub_agent.mode is None:
+                        sub_agent.mode = "chat"
+                self._lazy_sub_agents = sub_agents
+                self.sub_agents = [*self.sub_agents, *sub_agents]
+                self.sub_agent_factory = None
+        return self.sub_agents
+
+    def _layered_before_model_callbacks(self) -> list:
+        return [hitl_store.before_model_callback, checkpoint_store.before_model_callback,
+                *super()._layered_before_model_callbacks()]
+
+    def _layered_after_model_callbacks(self) -> list:
+        return [checkpoint_store.after_model_callback, *super()._layered_after_model_callbacks()]
+
+    @property
+    def canonical_after_tool_callbacks(self):
+        return [*super().canonical_after_tool_callbacks, checkpoint_store.after_tool_callback]
+
+    @property
+    def canonical_after_agent_callbacks(self):
+        return [*super().canonical_after_agent_callbacks, checkpoint_store.after_agent_callback]
+
+    def find_sub_agent(self, name: str) -> typing.Optional[BaseAgent]:
+        if self.sub_agent_factory is not None and name in self.lazy_sub_agent_names:
+            self.load_sub_agents()
+        return super().find_sub_agent(name)
+
+    def clone(self, update: typing.Optional[typing.Mapping[str, typing.Any]] = None) -> "LazyOrchestrator":
+        cloned = super().clone(update)
+        # Private attributes are copied by reference
+        cloned._load_lock = threading.Lock()
+        cloned._lazy_sub_agents = []
+        if cloned.sub_agent_factory is not None:
+            cloned._clone_source = self
+        return cloned
+
+    # Every way ADK runs an agent: as a workflow node, run_async and run_live
+    # (Aclosing, like ADK, so the wrapped generators are closed in this context)
+    async def _run_impl(self, *, ctx, node_input):
+        self.load_sub_agents()
+        async with Aclosing(super()._run_impl(ctx=ctx, node_input=node_input)) as events:
+            async for event in events:
+                yield event
+
+    async def _run_async_impl(self, ctx):
+        self.load_sub_agents()
+        async with Aclosing(super()._run_async_impl(ctx)) as events:
+            async for event in events:
+                yield event
+
+    async def _run_live_impl(self, ctx):
+        self.load_sub_agents()
+        async with Aclosing(super()._run_live_impl(ctx)) as events:
+            async for event in events:
+                yield event
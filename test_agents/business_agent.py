@@ -1,29 +1,38 @@
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
-
 # Import tools from the new package structure
 from test_agents import tools
+from test_agents.agent_factory import AgentSpec, DEFAULT_MODEL_NAME
 
-# Define the model used by this agent (consistent with others)
-AGENT_MODEL = LiteLlm("openai/gpt-4.1-mini")
+# Define the model used by this agent (shared with the other agents)
+AGENT_MODEL = DEFAULT_MODEL_NAME
 
-# Define the Business Agent
-business_agent = Agent(
+# Define the Business Agent (context orchestrators build their own instances from this spec)
+business_agent_spec = AgentSpec(
     name="BusinessAgent",
     description="Handles practical project management aspects including task tracking and document management for specific users.",
     model=AGENT_MODEL,
-    tools=[
+    tools=(
         tools.read_task_list,
+        tools.query_tasks,
+        tools.query_team_tasks,
         tools.write_task,
         tools.edit_task,
-    ],
+        tools.write_tasks_bulk,
+        tools.edit_tasks_bulk,
+        tools.search_governance_documents,
+    ),
     instruction="""
     You are a professional project assistant.
     Your primary function is to manage task lists for 'Philipp' and 'Guillaume'.
     When asked to read, add, modify, or delete tasks, you MUST determine which user's list is relevant (Philipp or Guillaume) based on the request or context.
     Use the 'user_name' parameter in the tools ('read_task_list', 'write_task', 'edit_task') to specify either 'Philipp' or 'Guillaume'.
     For reading tasks: Use the 'read_task_list' tool, specifying the 'user_name'. Present the tasks clearly. Only call this tool once per turn.
+    For finding specific tasks (e.g., by assignee, status, deadline range, or a keyword): Prefer the 'query_tasks' tool over 'read_task_list'. It returns only matching tasks, one page at a time; if 'next_cursor' is set and you need more, call it again with that 'cursor' in a later turn. Use 'fields' to request only the columns you need.
+    For questions spanning the whole team (e.g., "everything due this week"): Use the 'query_team_tasks' tool ONCE instead of querying each user's list. Each result includes the 'user_name' of the list it belongs to; use that 'user_name' when editing the task.
     For adding tasks: Use the 'write_task' tool. You need 'task_title', 'assignee', 'deadline', 'description', and the target 'user_name'. Confirm success. Only call this tool once per turn.
+    For adding SEVERAL tasks to the same list (e.g., action items extracted from a meeting): Use the 'write_tasks_bulk' tool ONCE with the target 'user_name' and a 'tasks' list (each item has 'task_title', 'assignee', 'deadline', 'description') instead of calling 'write_task' repeatedly.
+    For modifying or deleting SEVERAL tasks in the same list: Use the 'edit_tasks_bulk' tool ONCE with the target 'user_name' and an 'operations' list (each item has 'task_id', 'action', and 'updates' for 'modify').
+    For questions about what the team's documents say (meeting notes, profiles, partnership agreement/companion) or to find tasks by topic across all lists: Use the 'search_governance_documents' tool with a short keyword 'query'. It returns only the most relevant passages with their document and section; quote those instead of reading whole documents.
+    Bulk tools are all-or-nothing: if the result status is 'error', nothing was changed; use the per-item 'results' to report which items failed.
     For modifying or deleting tasks:
       1. First, if you need to confirm the task details (like the exact title or current description), use the 'read_task_list' tool for the correct 'user_name'. Present the relevant task details to the user or use them for the next step. DO NOT call edit_task in the same turn as read_task_list.
       2. In a SEPARATE turn, use the 'edit_task' tool.
@@ -35,3 +44,6 @@ business_agent = Agent(
     Report any errors encountered by the tools.
     """,
 )
+
+# Standalone instance of the spec
+business_agent = business_agent_spec.build()
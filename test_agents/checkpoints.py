@@ -0,0 +1,389 @@
+"""Persistent checkpoints of the context orchestrators' workflows.
+
+The Planning and Resolution workflows loop "revise -> present for review ->
+revise", and every draft and decision used to live only in the LLM
+conversation: a restart or timeout meant replaying the sub-agent calls, and
+each round made the prompt longer. ``CheckpointStore`` records the steps of a
+workflow in an SQLite file as they complete:
+
+* ``request``: the user's message that started a turn of the orchestrator,
+* ``delegation``: the orchestrator hands a step to a specialist,
+* ``result``: a specialist's answer (e.g. the current draft),
+* ``tool``: an orchestrator tool call and its result (e.g. ``run_parallel_workflow``),
+* ``hitl_request`` / ``hitl_decision``: a question or review sent to the
+  user, and the user's answer,
+* ``message``: the orchestrator's own reply.
+
+Before each orchestrator model call, the checkpoints are used to
+
+* resume: a session continuing another session's workflow (created with
+  ``{"workflow_id": "<id>"}`` in its state, e.g. after a restart) gets the
+  completed steps as a summary, so the orchestrator continues from the last
+  one instead of calling the specialists again, and
+* bound the context: once the conversation is longer than
+  ``CHECKPOINT_COMPACT_AFTER`` contents, the older ones are replaced by the
+  same summary (the user's original request, the latest result of each
+  agent in full, earlier ones shortened) and only the last
+  ``CHECKPOINT_KEEP_RECENT`` are kept.
+
+A workflow's id is the ``workflow_id`` state value, or else the session id.
+
+Workflows without a step for ``CHECKPOINT_RETENTION_DAYS`` are deleted, and
+beyond ``CHECKPOINT_MAX_STEPS`` steps the oldest ones are (checked at most
+once per ``PRUNE_INTERVAL`` seconds while recording, or with ``prune``).
+
+    python -m test_agents checkpoints list
+    python -m test_agents checkpoints show <workflow_id>
+    python -m test_agents checkpoints clear <workflow_id>
+    python -m test_agents checkpoints prune
+"""
+import argparse
+import json
+import sqlite3
+import threading
+import time
+import typing
+from pathlib import Path
+
+from google.genai import types
+
+from .config import (
+    CHECKPOINT_COMPACT_AFTER,
+    CHECKPOINT_KEEP_RECENT,
+    CHECKPOINT_MAX_STEPS,
+    CHECKPOINT_RETENTION_DAYS,
+    CHECKPOINT_STORE_FILE,
+    CHECKPOINT_SUMMARY_CHARS,
+    CHECKPOINTS_ENABLED,
+)
+from .hitl import HITL_TOOLS
+from .router import CONTEXT_AGENTS
+
+# Session state key naming the workflow a session works on (default: the session id)
+WORKFLOW_ID_KEY = "workflow_id"
+ORCHESTRATOR_NAMES = frozenset(CONTEXT_AGENTS.values())
+# Steps listed in a summary; earlier ones are only counted
+SUMMARY_MAX_STEPS = 30
+# Seconds between two automatic prunings of old checkpoints
+PRUNE_INTERVAL = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    workflow_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    orchestrator TEXT NOT NULL,
+    agent TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS checkpoints_workflow ON checkpoints (app_name, user_id, workflow_id, orchestrator);
+CREATE INDEX IF NOT EXISTS checkpoints_created ON checkpoints (created);
+"""
+
+
+class Checkpoint(typing.NamedTuple):
+    seq: int
+    app_name: str
+    user_id: str
+    workflow_id: str
+    session_id: str
+    orchestrator: str
+    agent: str
+    kind: str
+    name: str
+    content: dict
+    created: float
+
+
+def _orchestrator_name(agent) -> typing.Optional[str]:
+    """The context orchestrator an agent belongs to (None for the root and for nested runs)."""
+    if agent.name in ORCHESTRATOR_NAMES:
+        return agent.name
+    parent = agent.parent_agent
+    if parent is not None and parent.name in ORCHESTRATOR_NAMES:
+        return parent.name
+    return None
+
+
+def _workflow_key(context) -> tuple[str, str, str]:
+    session = context.session
+    return session.app_name, session.user_id, context.state.get(WORKFLOW_ID_KEY) or session.id
+
+
+def _shorten(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit].rstrip() + " [...]"
+
+
+def _describe(checkpoint: Checkpoint, limit: int) -> str:
+    content = checkpoint.content
+    if checkpoint.kind == "request":
+        return f"User asked: {_shorten(content.get('text', ''), limit)}"
+    if checkpoint.kind == "delegation":
+        return f"Delegated to {checkpoint.name}."
+    if checkpoint.kind == "hitl_request":
+        return f"Asked the user ({checkpoint.name}): {_shorten(json.dumps(content.get('args'), default=str), limit)}"
+    if checkpoint.kind == "hitl_decision":
+        return f"User answered ({checkpoint.name}): {json.dumps(content.get('result'), default=str)}"
+    if checkpoint.kind == "tool":
+        return (f"Called {checkpoint.name}: "
+                f"{_shorten(json.dumps(content.get('response'), default=str), limit)}")
+    label = "Result from" if checkpoint.kind == "result" else "Reply of"
+    return f"{label} {checkpoint.agent}: {_shorten(content.get('text', ''), limit)}"
+
+
+def summarize(checkpoints: list[Checkpoint], summary_chars: int = CHECKPOINT_SUMMARY_CHARS) -> str:
+    """Text summary of completed steps; the user's first request and the latest result of each agent are kept in full.
+
+    Only the last ``SUMMARY_MAX_STEPS`` steps are listed (the first request is
+    always stated); older results are shortened to ``summary_chars`` characters.
+    """
+    latest_result = {checkpoint.agent: checkpoint.seq for checkpoint in checkpoints if checkpoint.kind == "result"}
+    first_request = next((checkpoint for checkpoint in checkpoints if checkpoint.kind == "request"), None)
+    lines = []
+    if first_request is not None:
+        lines.append(f"The user's original request: {first_request.content.get('text', '')}")
+    lines.append("Workflow progress restored from checkpoints. These steps are COMPLETED, do not repeat them; "
+                 "continue from the last one:")
+    steps = [checkpoint for checkpoint in checkpoints if checkpoint is not first_request]
+    omitted = max(len(steps) - SUMMARY_MAX_STEPS, 0)
+    if omitted:
+        lines.append(f"({omitted} earlier steps omitted)")
+    for number, checkpoint in enumerate(steps[omitted:], omitted + 1):
+        full = checkpoint.kind == "result" and latest_result[checkpoint.agent] == checkpoint.seq
+        lines.append(f"{number}. {_describe(checkpoint, 1_000_000 if full else summary_chars)}")
+    return "\n".join(lines)
+
+
+def _is_plain_user_message(content: types.Content) -> bool:
+    return content.role == "user" and not any(part.function_response for part in content.parts or [])
+
+
+class CheckpointStore:
+    """SQLite store of workflow steps, used as callbacks of the orchestrators and specialists."""
+
+    def __init__(self, path: typing.Union[str, Path], enabled: bool = True,
+                 compact_after: int = 40, keep_recent: int = 12, summary_chars: int = 1200,
+                 retention_days: float = 30, max_steps: int = 100_000):
+        self.path = Path(path)
+        self.enabled = enabled
+        self.compact_after = compact_after
+        self.keep_recent = keep_recent
+        self.summary_chars = summary_chars
+        self.retention_days = retention_days
+        self.max_steps = max_steps
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # When the store was last pruned (time.monotonic; None: not yet in this process)
+        self._pruned_at: typing.Optional[float] = None
+        # (invocation id, orchestrator) of the turns whose request is recorded
+        self._requests: dict[tuple[str, str], None] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        # Called with the lock held
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def record(self, context, orchestrator: str, agent: str, kind: str, name: str, content: dict):
+        """Appends a completed step of the workflow of the context's session."""
+        app_name, user_id, workflow_id = _workflow_key(context)
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO checkpoints (app_name, user_id, workflow_id, session_id, orchestrator, agent, kind, "
+                "name, content, created) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (app_name, user_id, workflow_id, context.session.id, orchestrator, agent, kind, name,
+                 json.dumps(content, default=str), time.time()),
+            )
+            if self._pruned_at is None or time.monotonic() - self._pruned_at >= PRUNE_INTERVAL:
+                self._prune()
+
+    def _prune(self) -> int:
+        # Called with the lock held
+        connection = self._connect()
+        deleted = 0
+        if self.retention_days > 0:
+            deleted += connection.execute(
+                "DELETE FROM checkpoints WHERE (app_name, user_id, workflow_id) IN "
+                "(SELECT app_name, user_id, workflow_id FROM checkpoints "
+                "GROUP BY app_name, user_id, workflow_id HAVING MAX(created) < ?)",
+                (time.time() - self.retention_days * 86400,),
+            ).rowcount
+        if self.max_steps > 0:
+            deleted += connection.execute(
+                "DELETE FROM checkpoints WHERE seq <= (SELECT seq FROM checkpoints ORDER BY seq DESC LIMIT 1 OFFSET ?)",
+                (self.max_steps,),
+            ).rowcount
+        self._pruned_at = time.monotonic()
+        return deleted
+
+    def prune(self) -> int:
+        """Deletes the workflows idle for longer than the retention and the oldest steps beyond the maximum.
+
+        Returns:
+            int: The number of deleted steps.
+        """
+        with self._lock:
+            return self._prune()
+
+    def checkpoints(self, workflow_id: str, app_name: typing.Optional[str] = None,
+                    user_id: typing.Optional[str] = None,
+                    orchestrator: typing.Optional[str] = None) -> list[Checkpoint]:
+        """The steps of a workflow in order (optionally of one app, user and orchestrator)."""
+        query, params = "SELECT * FROM checkpoints WHERE workflow_id = ?", [workflow_id]
+        for column, value in (("app_name", app_name), ("user_id", user_id), ("orchestrator", orchestrator)):
+            if value is not None:
+                query, params = query + f" AND {column} = ?", params + [value]
+        with self._lock:
+            rows = self._connect().execute(query + " ORDER BY seq", params).fetchall()
+        return [Checkpoint(*row[:9], json.loads(row[9]), row[10]) for row in rows]
+
+    def workflows(self) -> list[dict]:
+        """Every workflow with its number of steps and last activity."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT app_name, user_id, workflow_id, COUNT(*), MAX(created), GROUP_CONCAT(DISTINCT orchestrator) "
+                "FROM checkpoints GROUP BY app_name, user_id, workflow_id ORDER BY MAX(created)"
+            ).fetchall()
+        return [{"app_name": app_name, "user_id": user_id, "workflow_id": workflow_id, "steps": steps,
+                 "last_step": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last)), "orchestrators": names}
+                for app_name, user_id, workflow_id, steps, last, names in rows]
+
+    def clear(self, workflow_id: str) -> int:
+        """Deletes a workflow's checkpoints; returns how many there were."""
+        with self._lock:
+            return self._connect().execute("DELETE FROM checkpoints WHERE workflow_id = ?", (workflow_id,)).rowcount
+
+    # --- Callbacks ---
+
+    def before_model_callback(self, callback_context, llm_request) -> None:
+        """Records HITL answers, then restores or compacts the orchestrator's context from the checkpoints."""
+        if not self.enabled:
+            return None
+        orchestrator = callback_context.agent_name
+        self._record_request(callback_context, orchestrator)
+        contents = llm_request.contents
+        if contents and contents[-1].role == "user":
+            for part in contents[-1].parts or []:
+                response = part.function_response
+                if (response is not None and response.name in HITL_TOOLS
+                        and (response.response or {}).get("status") != "pending"):
+                    self.record(callback_context, orchestrator, orchestrator, "hitl_decision", response.name,
+                                {"result": (response.response or {}).get("result", response.response)})
+
+        app_name, user_id, workflow_id = _workflow_key(callback_context)
+        checkpoints = self.checkpoints(workflow_id, app_name, user_id, orchestrator)
+        if not checkpoints:
+            return None
+        start = 0
+        if len(contents) > self.compact_after:
+            # Cut at a user message, so no kept function response loses its call
+            start = next((index for index in range(len(contents) - self.keep_recent, len(contents))
+                          if _is_plain_user_message(contents[index])), 0)
+        if start == 0:
+            # Only restore the steps of earlier sessions, the others are in this conversation
+            session_id = callback_context.session.id
+            checkpoints = [checkpoint for checkpoint in checkpoints if checkpoint.session_id != session_id]
+            if not checkpoints:
+                return None
+        summary = types.Content(role="user", parts=[types.Part(text=summarize(checkpoints, self.summary_chars))])
+        llm_request.contents = [summary, *contents[start:]]
+        return None
+
+    def _record_request(self, callback_context, orchestrator: str):
+        """Records the user's message of this turn, once per orchestrator (HITL answers are recorded as decisions)."""
+        key = (callback_context.invocation_id, orchestrator)
+        if key in self._requests:
+            return
+        if len(self._requests) > 1024:
+            self._requests.clear()
+        self._requests[key] = None
+        user_content = callback_context.user_content
+        text = "".join(part.text or "" for part in (user_content.parts or []) if not part.thought) if user_content else ""
+        if text.strip():
+            self.record(callback_context, orchestrator, orchestrator, "request", "user", {"text": text})
+
+    def after_model_callback(self, callback_context, llm_response) -> None:
+        """Records the orchestrator handing a step to a specialist."""
+        if not self.enabled or llm_response.partial or not llm_response.content:
+            return None
+        for part in llm_response.content.parts or []:
+            call = part.function_call
+            if call is not None and call.name == "transfer_to_agent":
+                target = (call.args or {}).get("agent_name", "")
+                self.record(callback_context, callback_context.agent_name, callback_context.agent_name,
+                            "delegation", target, {"args": call.args})
+        return None
+
+    def after_tool_callback(self, tool, args, tool_context, tool_response) -> None:
+        """Records the orchestrator's tool calls (HITL requests, parallel workflows) and their results."""
+        if not self.enabled or tool.name == "transfer_to_agent":
+            return None
+        orchestrator = tool_context.agent_name
+        if tool.name in HITL_TOOLS:
+            self.record(tool_context, orchestrator, orchestrator, "hitl_request", tool.name, {"args": args})
+        else:
+            self.record(tool_context, orchestrator, orchestrator, "tool", tool.name,
+                        {"args": args, "response": tool_response})
+        return None
+
+    def after_agent_callback(self, callback_context) -> None:
+        """Records the last text an orchestrator or specialist produced in this invocation."""
+        if not self.enabled:
+            return None
+        agent = callback_context.get_invocation_context().agent
+        orchestrator = _orchestrator_name(agent)
+        if orchestrator is None:
+            return None
+        for event in reversed(callback_context.session.events):
+            if event.invocation_id != callback_context.invocation_id:
+                break
+            if event.author != agent.name or event.partial or not event.content:
+                continue
+            text = "".join(part.text or "" for part in event.content.parts or [] if not part.thought)
+            if text.strip():
+                kind = "message" if agent.name == orchestrator else "result"
+                self.record(callback_context, orchestrator, agent.name, kind, agent.name, {"text": text})
+                break
+        return None
+
+
+# Used by the context orchestrators and their specialists (agent_factory.py, specialists.py)
+checkpoint_store = CheckpointStore(CHECKPOINT_STORE_FILE, CHECKPOINTS_ENABLED, CHECKPOINT_COMPACT_AFTER,
+                                   CHECKPOINT_KEEP_RECENT, CHECKPOINT_SUMMARY_CHARS, CHECKPOINT_RETENTION_DAYS,
+                                   CHECKPOINT_MAX_STEPS)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m test_agents checkpoints",
+                                     description="Inspect or clear the workflow checkpoints.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="Show the workflows with checkpoints")
+    show = commands.add_parser("show", help="Show the steps of a workflow (and its restored summary)")
+    show.add_argument("workflow_id")
+    clear = commands.add_parser("clear", help="Delete the checkpoints of a workflow")
+    clear.add_argument("workflow_id")
+    commands.add_parser("prune", help="Delete the checkpoints past the retention (CHECKPOINT_RETENTION_DAYS / _MAX_STEPS)")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for workflow in checkpoint_store.workflows():
+            print(json.dumps(workflow))
+    elif args.command == "show":
+        checkpoints = checkpoint_store.checkpoints(args.workflow_id)
+        for orchestrator in dict.fromkeys(checkpoint.orchestrator for checkpoint in checkpoints):
+            print(f"== {orchestrator}")
+            print(summarize([checkpoint for checkpoint in checkpoints if checkpoint.orchestrator == orchestrator]))
+    elif args.command == "prune":
+        print(f"Removed {checkpoint_store.prune()} checkpoints")
+    else:
+        print(f"Removed {checkpoint_store.clear(args.workflow_id)} checkpoints of {args.workflow_id}")
+    return 0
@@ -0,0 +1,262 @@
+"""Structured command mode: run document tools directly, without the agents.
+
+"Add task X for Philipp due 2026-11-01" normally takes three LLM hops
+(GovernanceOrchestrator -> ExecutionOrchestrator -> BusinessAgent) to end in
+one ``write_task`` call. A message written as a command is executed by the
+root agent's ``before_agent_callback`` instead: the tool is called directly
+and its result becomes the root's reply, so the action is still recorded in
+the session history, but no LLM is involved.
+
+Command mode is off unless ``COMMAND_MODE_ENABLED`` is set. A message is a
+command if it starts with ``/`` followed by the name of a command, or is a
+JSON payload naming one:
+
+    /write_task task_title="Draft budget" assignee=Philipp deadline=2026-11-01 description="Q4" user_name=Philipp
+    /edit_task task_id=12 action=modify user_name=Philipp updates='{"status": "Completed"}'
+    /write_meeting_log meeting_date=2026-10-01 participants=Philipp,Guillaume content="..."
+    {"command": "write_task", "args": {"task_title": "Draft budget", ...}}
+    [{"command": "edit_task", "args": {...}}, {"command": "edit_task", "args": {...}}]
+
+Argument values are taken as strings for ``str`` parameters and parsed as
+JSON otherwise (``task_id=12``, ``updates='{...}'``); list parameters also
+accept comma-separated values. A JSON list runs its commands in order. Any
+other message (including "/something" that is not a command and text that
+only looks like JSON) goes to the agents.
+
+Commands are only recognized at the start of a turn handled by the root
+agent, i.e. in a new session or once the conversation is back at the root:
+ADK hands a session's follow-up messages to the agent that answered last
+(e.g. BusinessAgent), and the root's callback does not run for those.
+Scripts are not affected by this.
+
+Scripts can run commands without a session (one command per line, ``#``
+comments allowed):
+    python -m test_agents command '/read_task_list user_name=Philipp'
+    python -m test_agents command --file commands.txt    # "-" reads stdin
+"""
+import argparse
+import inspect
+import json
+import shlex
+import sys
+import typing
+
+from google.genai import types
+
+from . import tools
+from .config import COMMAND_MODE_ENABLED, ensure_document_dirs
+
+# Tools that can be run as commands (the HITL tools need a conversation)
+COMMANDS = (
+    "get_current_time",
+    "read_task_list",
+    "query_tasks",
+    "query_team_tasks",
+    "write_task",
+    "edit_task",
+    "write_tasks_bulk",
+    "edit_tasks_bulk",
+    "read_partnership_documents",
+    "list_partnership_sections",
+    "read_partnership_section",
+    "find_relevant_values",
+    "read_meeting_log",
+    "write_meeting_log",
+    "list_meetings",
+    "latest_meeting",
+    "search_meetings",
+    "read_team_profile",
+    "search_governance_documents",
+)
+
+# Shorter names for the common commands
+ALIASES = {
+    "add-task": "write_task",
+    "edit-task": "edit_task",
+    "tasks": "read_task_list",
+    "meeting": "read_meeting_log",
+    "log-meeting": "write_meeting_log",
+    "search": "search_governance_documents",
+}
+
+
+class CommandError(ValueError):
+    """A message that is a command but cannot be run (unknown name, bad arguments)."""
+
+
+class Command(typing.NamedTuple):
+    name: str
+    args: dict
+
+
+def _tool(name: str) -> typing.Callable:
+    name = ALIASES.get(name, name)
+    if name not in COMMANDS:
+        raise CommandError(f"Unknown command '{name}'. Available: {', '.join(COMMANDS)}")
+    return getattr(tools, name)
+
+
+def _is_str_parameter(annotation) -> bool:
+    if annotation is str:
+        return True
+    # Optional[str] and Literal["a", "b"]
+    if typing.get_origin(annotation) not in (typing.Union, typing.Literal):
+        return False
+    args = typing.get_args(annotation)
+    return all(arg is str or arg is type(None) or isinstance(arg, str) for arg in args)
+
+
+def _is_list_parameter(annotation) -> bool:
+    # Optional[list[str]] is Union[list[str], None]
+    if typing.get_origin(annotation) is typing.Union:
+        return any(_is_list_parameter(arg) for arg in typing.get_args(annotation) if arg is not type(None))
+    return annotation is list or typing.get_origin(annotation) is list
+
+
+def _parse_value(raw: str, annotation) -> typing.Any:
+    if _is_str_parameter(annotation):
+        return raw
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        if _is_list_parameter(annotation):
+            return [item.strip() for item in raw.split(",") if item.strip()]
+        return raw
+
+
+def _parse_line(text: str) -> Command:
+    """Parses ``/name key=value ...``."""
+    try:
+        tokens = shlex.split(text[1:])
+    except ValueError as e:
+        raise CommandError(f"Cannot parse command: {e}") from e
+    if not tokens:
+        raise CommandError("Empty command.")
+    name, tool = ALIASES.get(tokens[0], tokens[0]), _tool(tokens[0])
+    hints = typing.get_type_hints(tool)
+    args = {}
+    for token in tokens[1:]:
+        key, separator, raw = token.partition("=")
+        if not separator or not key:
+            raise CommandError(f"Expected key=value, got '{token}'.")
+        args[key] = _parse_value(raw, hints.get(key))
+    return Command(name, args)
+
+
+def _parse_payload(payload) -> list[Command]:
+    items = payload if isinstance(payload, list) else [payload]
+    commands = []
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("command"), str):
+            raise CommandError('Each JSON command needs a "command" name (and optional "args").')
+        args = item.get("args") or {}
+        if not isinstance(args, dict):
+            raise CommandError(f'"args" of {item["command"]} must be an object.')
+        _tool(item["command"])
+        commands.append(Command(ALIASES.get(item["command"], item["command"]), args))
+    return commands
+
+
+def parse_commands(text: str) -> typing.Optional[list[Command]]:
+    """The commands in a message, or None if it is not a command.
+
+    Raises:
+        CommandError: If the message is a command but is malformed.
+    """
+    text = text.strip()
+    if text.startswith("/"):
+        # "/something" that names no command is left to the agents
+        name = text[1:].split(maxsplit=1)[0] if text[1:].strip() else ""
+        if ALIASES.get(name, name) not in COMMANDS:
+            return None
+        return [_parse_line(text)]
+    if text[:1] in ("{", "["):
+        try:
+            payload = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        # JSON without a "command" is left to the agents
+        items = payload if isinstance(payload, list) else [payload]
+        if not items or not all(isinstance(item, dict) and "command" in item for item in items):
+            return None
+        return _parse_payload(payload)
+    return None
+
+
+def run_command(command: Command) -> dict:
+    """Calls the command's tool; returns the command and the tool's result."""
+    tool = _tool(command.name)
+    try:
+        inspect.signature(tool).bind(**command.args)
+    except TypeError as e:
+        result = {"status": "error", "error_message": f"Invalid arguments for {command.name}: {e}"}
+    else:
+        result = tool(**command.args)
+    return {"command": command.name, "args": command.args, "result": result}
+
+
+def run_commands(commands: list[Command]) -> list[dict]:
+    """Runs commands in order (each tool reports its own errors in its result)."""
+    ensure_document_dirs()
+    return [run_command(command) for command in commands]
+
+
+def _succeeded(outcome: dict) -> bool:
+    result = outcome["result"]
+    return not (isinstance(result, dict) and result.get("status") == "error")
+
+
+def before_agent_callback(callback_context) -> typing.Optional[types.Content]:
+    """Runs a command message directly and answers with its results (None for other messages)."""
+    if not COMMAND_MODE_ENABLED:
+        return None
+    user_content = callback_context.user_content
+    if not user_content:
+        return None
+    text = "".join(part.text or "" for part in user_content.parts or [])
+    try:
+        commands = parse_commands(text)
+        if commands is None:
+            return None
+        reply = {"results": run_commands(commands)}
+    except CommandError as e:
+        reply = {"error": str(e)}
+    return types.Content(role="model", parts=[types.Part(text=json.dumps(reply, default=str))])
+
+
+def _read_lines(path: str) -> typing.Iterator[str]:
+    f = sys.stdin if path == "-" else open(path, 'r', encoding='utf-8')
+    try:
+        for line in f:
+            if line.strip() and not line.lstrip().startswith("#"):
+                yield line
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m test_agents command",
+                                     description="Run tool commands directly, without the agents.")
+    parser.add_argument("text", nargs="?", help="One command, e.g. '/read_task_list user_name=Philipp'")
+    parser.add_argument("--file", help="File with one command per line ('-' for stdin)")
+    args = parser.parse_args(argv)
+    if (args.text is None) == (args.file is None):
+        parser.error("give either a command or --file")
+
+    lines = [args.text] if args.text is not None else _read_lines(args.file)
+    failed = 0
+    for line in lines:
+        try:
+            commands = parse_commands(line)
+            if commands is None:
+                raise CommandError(f"Not a command: {line.strip()[:80]}. Available: {', '.join(COMMANDS)}")
+            outcomes = run_commands(commands)
+        except CommandError as e:
+            print(json.dumps({"error": str(e)}))
+            failed += 1
+            continue
+        for outcome in outcomes:
+            print(json.dumps(outcome, default=str))
+            failed += not _succeeded(outcome)
+    return 1 if failed else 0
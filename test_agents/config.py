@@ -22,12 +22,106 @@ TASKS_FILE_PATTERN = str(_documents_base_path / "tasks_{user_name}.md")
 PARTNERSHIP_AGREEMENT_FILE = str(_documents_base_path / "partnership_agreement.md")
 PARTNERSHIP_COMPANION_FILE = str(_documents_base_path / "partnership_companion.md")
 
-# Ensure runtime directories exist on first import
-# This code runs when the module is imported by the tools.
-try:
-    MEETINGS_DIR.mkdir(parents=True, exist_ok=True)
-    PROFILES_DIR.mkdir(parents=True, exist_ok=True)
-    # Ensure the base directory also exists, especially if overridden via env var
-    _documents_base_path.mkdir(parents=True, exist_ok=True)
-except OSError as e:
-    print(f"Warning: Could not create runtime directories under '{DOCUMENTS_BASE_DIR}': {e}")
+# Model used by every agent (one shared, pooled client per model name, see llm.py)
+LLM_MODEL = os.getenv("LLM_MODEL", "openai/gpt-4.1-mini")
+# HTTP connection pool shared by all LLM requests (keep-alive avoids a TLS handshake per call)
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+# Seconds before an LLM request is abandoned
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "120"))
+# Simulated latency (seconds) of each call to the local stub model (LLM_MODEL=stub, see stub_llm.py)
+STUB_LLM_LATENCY = float(os.getenv("STUB_LLM_LATENCY", "0"))
+
+# Local fast-path router in front of the root agent (see router.py). The
+# classifier is optional: without a trained model file only the rules are used.
+ROUTER_ENABLED = os.getenv("ROUTER_ENABLED", "false").lower() not in ("0", "false", "no")
+ROUTER_MODEL_FILE = os.getenv("ROUTER_MODEL_FILE", str(_documents_base_path / ".router_model.npz"))
+ROUTER_MIN_CONFIDENCE = float(os.getenv("ROUTER_MIN_CONFIDENCE", "0.85"))
+ROUTER_MIN_MARGIN = float(os.getenv("ROUTER_MIN_MARGIN", "0.3"))
+
+# Persistent cache of LLM responses used by every agent (see response_cache.py). Off by
+# default: it replays earlier answers to identical conversations. Entries are dropped
+# when a document is written, expire after the TTL (seconds) and are evicted least
+# recently used first beyond the maximum.
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() not in ("0", "false", "no")
+RESPONSE_CACHE_FILE = os.getenv("RESPONSE_CACHE_FILE", str(_documents_base_path / ".response_cache.sqlite3"))
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", str(24 * 3600)))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "5000"))
+
+# Independent specialist steps of the orchestrators' workflows run concurrently
+# (see context_orchestrators/workflows.py), at most this many at a time
+PARALLEL_WORKFLOWS_ENABLED = os.getenv("PARALLEL_WORKFLOWS_ENABLED", "true").lower() not in ("0", "false", "no")
+WORKFLOW_MAX_CONCURRENCY = int(os.getenv("WORKFLOW_MAX_CONCURRENCY", "4"))
+
+# Pending human-in-the-loop requests and their answers, shared by the server and
+# the `python -m test_agents hitl` CLI (see hitl.py); responders poll it this often (seconds)
+HITL_STORE_FILE = os.getenv("HITL_STORE_FILE", str(_documents_base_path / ".hitl_requests.sqlite3"))
+HITL_POLL_INTERVAL = float(os.getenv("HITL_POLL_INTERVAL", "1.0"))
+
+# Checkpoints of the orchestrators' workflows (see checkpoints.py): a session resumes
+# another session's workflow (state {"workflow_id": ...}) from its completed steps, and
+# conversations longer than COMPACT_AFTER contents keep the last KEEP_RECENT plus a
+# summary in which older results are shortened to SUMMARY_CHARS characters.
+CHECKPOINTS_ENABLED = os.getenv("CHECKPOINTS_ENABLED", "true").lower() not in ("0", "false", "no")
+CHECKPOINT_STORE_FILE = os.getenv("CHECKPOINT_STORE_FILE", str(_documents_base_path / ".workflow_checkpoints.sqlite3"))
+CHECKPOINT_COMPACT_AFTER = int(os.getenv("CHECKPOINT_COMPACT_AFTER", "40"))
+CHECKPOINT_KEEP_RECENT = int(os.getenv("CHECKPOINT_KEEP_RECENT", "12"))
+CHECKPOINT_SUMMARY_CHARS = int(os.getenv("CHECKPOINT_SUMMARY_CHARS", "1200"))
+# Workflows idle for longer are deleted, and the oldest steps beyond the maximum (0: keep)
+CHECKPOINT_RETENTION_DAYS = float(os.getenv("CHECKPOINT_RETENTION_DAYS", "30"))
+CHECKPOINT_MAX_STEPS = int(os.getenv("CHECKPOINT_MAX_STEPS", "100000"))
+
+# Spans of every agent run, model call and tool call, appended to TRACE_FILE as JSON
+# lines (see tracing.py; `python -m test_agents trace report`)
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() not in ("0", "false", "no")
+TRACE_FILE = os.getenv("TRACE_FILE", str(_documents_base_path / ".traces.jsonl"))
+
+# Messages written as commands ("/write_task ..." or JSON) run the tool directly (see commands.py);
+# off by default, and only recognized on a turn that starts at the root agent
+COMMAND_MODE_ENABLED = os.getenv("COMMAND_MODE_ENABLED", "false").lower() not in ("0", "false", "no")
+
+# Touched by every document write of the tools (see tools/document_io.py), so caches
+# can tell that documents changed without scanning DOCUMENTS_DIR
+DOCUMENTS_WRITE_GENERATION_FILE = str(_documents_base_path / ".write_generation")
+
+# Cached metadata/word index of the meeting logs, one SQLite row per log (rebuilt from MEETINGS_DIR if missing)
+MEETING_INDEX_FILE = str(_documents_base_path / ".meeting_index.sqlite3")
+
+# Persisted BM25 passage index used by search_governance_documents (rebuilt if missing)
+DOCUMENT_SEARCH_INDEX_FILE = str(_documents_base_path / ".search_index.sqlite3")
+
+# In-memory cache shared by the read tools (documents are re-read only when they change)
+FILE_CACHE_MAX_ENTRIES = int(os.getenv("FILE_CACHE_MAX_ENTRIES", "128"))
+FILE_CACHE_MAX_CHARS = int(os.getenv("FILE_CACHE_MAX_CHARS", str(16 * 1024 * 1024)))
+
+# Hashed TF-IDF vectors of the partnership document sections (used by find_relevant_values)
+VALUE_INDEX_DIR = str(_documents_base_path / ".value_index")
+
+# Last task ID handed out across ALL task lists, so IDs are unique team-wide
+TASK_ID_COUNTER_FILE = str(_documents_base_path / ".task_id_counter")
+
+# Task mutations are appended to a journal next to each task file
+# (e.g. tasks_Philipp.md.journal) and folded back into the markdown table
+# once the journal grows past this many bytes, or once the list has had no
+# writes for TASKS_COMPACT_IDLE_SECONDS (0 turns the idle compaction off).
+TASKS_JOURNAL_SUFFIX = ".journal"
+TASKS_JOURNAL_MAX_BYTES = int(os.getenv("TASKS_JOURNAL_MAX_BYTES", str(64 * 1024)))
+TASKS_COMPACT_IDLE_SECONDS = float(os.getenv("TASKS_COMPACT_IDLE_SECONDS", "5"))
+
+
+
+def ensure_document_dirs():
+    """Creates the runtime directories under DOCUMENTS_BASE_DIR if they are missing.
+
+    Called when the document tools are first loaded rather than on import, so
+    importing the configuration has no side effects (the tools' writes create
+    parent directories themselves as well).
+    """
+    try:
+        MEETINGS_DIR.mkdir(parents=True, exist_ok=True)
+        PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+        # Ensure the base directory also exists, especially if overridden via env var
+        _documents_base_path.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"Warning: Could not create runtime directories under '{DOCUMENTS_BASE_DIR}': {e}")
@@ -5,26 +5,20 @@ It identifies the specific evaluation variant (e.g., Task/Milestone Evaluation,
 Meeting Evaluation) and orchestrates calls to specialized agents (Business,
 ValueSoul, TeamSpirit) and HITL tools to execute the corresponding assessment process.
 """
-import copy
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
-
-# Import base agent definitions
-from test_agents.business_agent import business_agent
-from test_agents.value_soul_agent_base import value_soul_agent_base
-from test_agents.team_spirit_agent_base import team_spirit_agent_base
+from test_agents.agent_factory import DEFAULT_MODEL_NAME, LazyOrchestrator
+from test_agents.context_orchestrators.specialists import SPECIALIST_NAMES, build_specialists
+from test_agents.context_orchestrators.workflows import (
+    sequencing_rule,
+    workflow_instruction,
+    workflow_tools,
+)
 from test_agents import tools # For HITL tools
 
 # Define the model for this orchestrator
-AGENT_MODEL = LiteLlm(model="openai/gpt-4.1-mini")
-
-# Instantiate local copies for this context
-evaluation_business_agent = copy.deepcopy(business_agent)
-evaluation_value_soul_agent = copy.deepcopy(value_soul_agent_base)
-evaluation_team_spirit_agent = copy.deepcopy(team_spirit_agent_base)
+AGENT_MODEL = DEFAULT_MODEL_NAME
 
 # Define the Evaluation Orchestrator Agent
-evaluation_orchestrator = Agent(
+evaluation_orchestrator = LazyOrchestrator(
     name="EvaluationOrchestrator",
     description="Manages evaluation processes, assessing outcomes against goals, values, and team dynamics.",
     model=AGENT_MODEL,
@@ -36,7 +30,7 @@ evaluation_orchestrator = Agent(
     *   If it's a broader request to evaluate project alignment with partnership values, it's **Value Alignment Check**.
     *   If unsure, ask for clarification using the 'request_user_clarification' tool.
 
-2.  **Execute the corresponding workflow step-by-step, calling ONLY ONE sub-agent or HITL tool per turn:**
+2.  **Execute the corresponding workflow step-by-step, calling ONLY ONE sub-agent or tool per turn:**
 
     *   **If Task/Milestone Evaluation:**
         1. Call `BusinessAgent` to retrieve the task definition, goals, and recorded outcomes/status.
@@ -60,18 +54,17 @@ evaluation_orchestrator = Agent(
         5. Call `present_for_review_and_approval` tool with the alignment report.
 
 3.  Once a workflow is complete and potentially approved via HITL, provide the final consolidated evaluation report.
-4.  **CRITICAL: You MUST call sub-agents sequentially as defined for the variant. Only call ONE sub-agent or HITL tool per turn.**
-5.  **CRITICAL: You do NOT have direct access to tools like 'read_partnership_documents' or 'read_meeting_log'. You MUST delegate tasks requiring those tools to your sub-agents (`EvaluationBusinessAgent`, `EvaluationValueSoulAgent`, `EvaluationTeamSpiritAgent`).**
-""",
-    sub_agents=[
-        evaluation_business_agent,
-        evaluation_value_soul_agent,
-        evaluation_team_spirit_agent
-    ],
+""" + sequencing_rule("Evaluation") + """5.  **CRITICAL: You do NOT have direct access to tools like 'read_partnership_documents' or 'read_meeting_log'. You MUST delegate tasks requiring those tools to your sub-agents (`EvaluationBusinessAgent`, `EvaluationValueSoulAgent`, `EvaluationTeamSpiritAgent`).**
+""" + workflow_instruction("Evaluation"),
+    # Its own Business/ValueSoul/TeamSpirit instances, built on first routing into this context
+    sub_agent_factory=build_specialists,
+    lazy_sub_agent_names=SPECIALIST_NAMES,
     # This orchestrator might need access to HITL tools directly
     tools=[
         tools.request_user_clarification,
         tools.present_for_review_and_approval,
         tools.ask_user_to_choose_option,
+        # Runs the independent specialist steps of a variant concurrently
+        *workflow_tools("Evaluation"),
     ]
 )
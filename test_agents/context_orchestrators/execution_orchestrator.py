@@ -5,26 +5,15 @@ It identifies the specific execution variant (e.g., Status Update, Progress Logg
 and orchestrates calls to specialized agents (Business, ValueSoul, TeamSpirit)
 and HITL tools to execute the corresponding process.
 """
-import copy
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
-
-# Import base agent definitions
-from test_agents.business_agent import business_agent
-from test_agents.value_soul_agent_base import value_soul_agent_base
-from test_agents.team_spirit_agent_base import team_spirit_agent_base
+from test_agents.agent_factory import DEFAULT_MODEL_NAME, LazyOrchestrator
+from test_agents.context_orchestrators.specialists import SPECIALIST_NAMES, build_specialists
 from test_agents import tools # For HITL tools
 
 # Define the model for this orchestrator
-AGENT_MODEL = LiteLlm(model="openai/gpt-4.1-mini")
-
-# Instantiate local copies for this context
-execution_business_agent = copy.deepcopy(business_agent)
-execution_value_soul_agent = copy.deepcopy(value_soul_agent_base)
-execution_team_spirit_agent = copy.deepcopy(team_spirit_agent_base)
+AGENT_MODEL = DEFAULT_MODEL_NAME
 
 # Define the Execution Orchestrator Agent
-execution_orchestrator = Agent(
+execution_orchestrator = LazyOrchestrator(
     name="ExecutionOrchestrator",
     description="Manages execution processes including status updates, progress tracking, and task completion.",
     model=AGENT_MODEL,
@@ -59,11 +48,9 @@ execution_orchestrator = Agent(
 4.  **CRITICAL: You MUST call sub-agents sequentially as defined for the variant. Only call ONE sub-agent or HITL tool per turn.**
 5.  **CRITICAL: You do NOT have direct access to tools like 'read_task_list' or 'edit_task'. You MUST delegate tasks requiring those tools to your sub-agents (`ExecutionBusinessAgent`, `ExecutionValueSoulAgent`, `ExecutionTeamSpiritAgent`).**
 """,
-    sub_agents=[
-        execution_business_agent,
-        execution_value_soul_agent,
-        execution_team_spirit_agent
-    ],
+    # Its own Business/ValueSoul/TeamSpirit instances, built on first routing into this context
+    sub_agent_factory=build_specialists,
+    lazy_sub_agent_names=SPECIALIST_NAMES,
     # This orchestrator might need access to HITL tools directly
     tools=[
         tools.request_user_clarification,
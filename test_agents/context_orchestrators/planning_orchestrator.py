@@ -5,30 +5,20 @@ It identifies the specific planning variant (e.g., Standard, Meeting Analysis)
 and orchestrates calls to specialized agents (Business, ValueSoul, TeamSpirit)
 and HITL tools to execute the corresponding planning process.
 """
-import copy
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
-
-# Import base agent definitions (adjust paths/imports as needed)
-# Assuming base definitions are accessible from the parent directory or package structure allows it
-# Example: from test_agents.agent_bases.business_agent_base import business_agent_base (if structure changes)
-# Using absolute imports from the top-level 'test_agents' package:
-from test_agents.business_agent import business_agent # Assuming business_agent is the instance defined in business_agent.py
-from test_agents.value_soul_agent_base import value_soul_agent_base
-from test_agents.team_spirit_agent_base import team_spirit_agent_base
+from test_agents.agent_factory import DEFAULT_MODEL_NAME, LazyOrchestrator
+from test_agents.context_orchestrators.specialists import SPECIALIST_NAMES, build_specialists
+from test_agents.context_orchestrators.workflows import (
+    sequencing_rule,
+    workflow_instruction,
+    workflow_tools,
+)
 from test_agents import tools # To potentially access HITL tools if needed directly (though likely called by sub-agents based on instructions)
 
 # Define the model for this orchestrator
-AGENT_MODEL = LiteLlm(model="openai/gpt-4.1-mini")
-
-# --- Step 2.1.3: Instantiate local copies for this context ---
-# Create independent instances of the base agents for this specific orchestrator
-planning_business_agent = copy.deepcopy(business_agent)
-planning_value_soul_agent = copy.deepcopy(value_soul_agent_base)
-planning_team_spirit_agent = copy.deepcopy(team_spirit_agent_base)
+AGENT_MODEL = DEFAULT_MODEL_NAME
 
 # --- Step 2.1.4: Define the Planning Orchestrator Agent ---
-planning_orchestrator = Agent(
+planning_orchestrator = LazyOrchestrator(
     name="PlanningOrchestrator",
     description="Manages planning processes including standard planning, meeting analysis, and weekly reviews. Determines the planning variant and calls specialized agents (Business, ValueSoul, TeamSpirit) in the correct sequence.",
     model=AGENT_MODEL,
@@ -40,7 +30,7 @@ planning_orchestrator = Agent(
     *   If it's a request to review progress against an existing plan or a periodic review, it's **Weekly Review Planning**.
     *   If unsure, ask for clarification using the 'request_user_clarification' tool.
 
-2.  **Execute the corresponding workflow step-by-step, calling ONLY ONE sub-agent or HITL tool per turn:**
+2.  **Execute the corresponding workflow step-by-step, calling ONLY ONE sub-agent or tool per turn:**
 
     *   **If Standard Planning:**
         1. Call `BusinessAgent` to create the initial draft plan.
@@ -58,7 +48,7 @@ planning_orchestrator = Agent(
         3. Call `ValueSoulAgent` to check value alignment of extracted items.
         4. Call `present_for_review_and_approval` tool with the extracted tasks/decisions.
         5. If approved:
-            a. Call `BusinessAgent` to write the outputs to relevant governance documents.
+            a. Call `BusinessAgent` to write the outputs to relevant governance documents (all extracted tasks for a list in a single bulk call).
         6. If rejected or approved_with_comments:
             a. Call `BusinessAgent` to revise extracted items based on feedback.
             b. Go back to step 4 (present revised items for review).
@@ -75,18 +65,17 @@ planning_orchestrator = Agent(
             b. Go back to step 4 (present revised review/updates).
 
 3.  Once a workflow is complete, provide the final consolidated result.
-4.  **CRITICAL: You MUST call sub-agents sequentially as defined for the variant. Only call ONE sub-agent or HITL tool per turn.**
-5.  **CRITICAL: You do NOT have direct access to tools like 'read_partnership_documents' or 'read_meeting_log'. You MUST delegate tasks requiring those tools to your sub-agents (`PlanningBusinessAgent`, `PlanningValueSoulAgent`, `PlanningTeamSpiritAgent`).**
-""",
-    sub_agents=[
-        planning_business_agent,
-        planning_value_soul_agent,
-        planning_team_spirit_agent
-    ],
+""" + sequencing_rule("Planning") + """5.  **CRITICAL: You do NOT have direct access to tools like 'read_partnership_documents' or 'read_meeting_log'. You MUST delegate tasks requiring those tools to your sub-agents (`PlanningBusinessAgent`, `PlanningValueSoulAgent`, `PlanningTeamSpiritAgent`).**
+""" + workflow_instruction("Planning"),
+    # Its own Business/ValueSoul/TeamSpirit instances, built on first routing into this context
+    sub_agent_factory=build_specialists,
+    lazy_sub_agent_names=SPECIALIST_NAMES,
     # This orchestrator might need access to HITL tools directly
     tools=[
         tools.request_user_clarification,
         tools.present_for_review_and_approval,
         tools.ask_user_to_choose_option,
+        # Runs the independent specialist steps of a variant concurrently
+        *workflow_tools("Planning"),
     ]
 )
@@ -5,26 +5,20 @@ It identifies the specific reflection variant (e.g., Targeted Reflection,
 Sentiment Gathering) and orchestrates calls to specialized agents (Business,
 ValueSoul, TeamSpirit) and HITL tools to facilitate team learning and capture insights.
 """
-import copy
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
-
-# Import base agent definitions
-from test_agents.business_agent import business_agent
-from test_agents.value_soul_agent_base import value_soul_agent_base
-from test_agents.team_spirit_agent_base import team_spirit_agent_base
+from test_agents.agent_factory import DEFAULT_MODEL_NAME, LazyOrchestrator
+from test_agents.context_orchestrators.specialists import SPECIALIST_NAMES, build_specialists
+from test_agents.context_orchestrators.workflows import (
+    sequencing_rule,
+    workflow_instruction,
+    workflow_tools,
+)
 from test_agents import tools # For HITL tools
 
 # Define the model for this orchestrator
-AGENT_MODEL = LiteLlm(model="openai/gpt-4.1-mini")
-
-# Instantiate local copies for this context
-reflection_business_agent = copy.deepcopy(business_agent)
-reflection_value_soul_agent = copy.deepcopy(value_soul_agent_base)
-reflection_team_spirit_agent = copy.deepcopy(team_spirit_agent_base)
+AGENT_MODEL = DEFAULT_MODEL_NAME
 
 # Define the Reflection Orchestrator Agent
-reflection_orchestrator = Agent(
+reflection_orchestrator = LazyOrchestrator(
     name="ReflectionOrchestrator",
     description="Manages reflection processes, facilitating team learning, process improvement, and capturing insights.",
     model=AGENT_MODEL,
@@ -36,7 +30,7 @@ reflection_orchestrator = Agent(
     *   If it's a request to identify lessons learned from a project phase, it's **Lessons Learned Capture**.
     *   If unsure, ask for clarification using the 'request_user_clarification' tool.
 
-2.  **Execute the corresponding workflow step-by-step, calling ONLY ONE sub-agent or HITL tool per turn:**
+2.  **Execute the corresponding workflow step-by-step, calling ONLY ONE sub-agent or tool per turn:**
 
     *   **If Targeted Reflection (e.g., on a meeting):**
         1. Call `TeamSpiritAgent` to retrieve relevant context (e.g., read meeting log, read profiles).
@@ -59,18 +53,17 @@ reflection_orchestrator = Agent(
         5. Call `present_for_review_and_approval` tool with the documented lessons learned.
 
 3.  Once a workflow is complete and potentially approved via HITL, provide the final consolidated reflection output or confirmation.
-4.  **CRITICAL: You MUST call sub-agents sequentially as defined for the variant. Only call ONE sub-agent or HITL tool per turn.**
-5.  **CRITICAL: You do NOT have direct access to tools like 'read_meeting_log' or 'read_team_profile'. You MUST delegate tasks requiring those tools to your sub-agents (`ReflectionBusinessAgent`, `ReflectionValueSoulAgent`, `ReflectionTeamSpiritAgent`).**
-""",
-    sub_agents=[
-        reflection_business_agent,
-        reflection_value_soul_agent,
-        reflection_team_spirit_agent
-    ],
+""" + sequencing_rule("Reflection") + """5.  **CRITICAL: You do NOT have direct access to tools like 'read_meeting_log' or 'read_team_profile'. You MUST delegate tasks requiring those tools to your sub-agents (`ReflectionBusinessAgent`, `ReflectionValueSoulAgent`, `ReflectionTeamSpiritAgent`).**
+""" + workflow_instruction("Reflection"),
+    # Its own Business/ValueSoul/TeamSpirit instances, built on first routing into this context
+    sub_agent_factory=build_specialists,
+    lazy_sub_agent_names=SPECIALIST_NAMES,
     # This orchestrator might need access to HITL tools directly
     tools=[
         tools.request_user_clarification,
         tools.present_for_review_and_approval,
         tools.ask_user_to_choose_option,
+        # Runs the independent specialist steps of a variant concurrently
+        *workflow_tools("Reflection"),
     ]
 )
@@ -6,26 +6,15 @@ Decision Making) and orchestrates calls to specialized agents (Business,
 ValueSoul, TeamSpirit) and HITL tools to facilitate conflict resolution and
 structured decision-making.
 """
-import copy
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
-
-# Import base agent definitions
-from test_agents.business_agent import business_agent
-from test_agents.value_soul_agent_base import value_soul_agent_base
-from test_agents.team_spirit_agent_base import team_spirit_agent_base
+from test_agents.agent_factory import DEFAULT_MODEL_NAME, LazyOrchestrator
+from test_agents.context_orchestrators.specialists import SPECIALIST_NAMES, build_specialists
 from test_agents import tools # For HITL tools
 
 # Define the model for this orchestrator
-AGENT_MODEL = LiteLlm(model="openai/gpt-4.1-mini")
-
-# Instantiate local copies for this context
-resolution_business_agent = copy.deepcopy(business_agent)
-resolution_value_soul_agent = copy.deepcopy(value_soul_agent_base)
-resolution_team_spirit_agent = copy.deepcopy(team_spirit_agent_base)
+AGENT_MODEL = DEFAULT_MODEL_NAME
 
 # Define the Resolution Orchestrator Agent
-resolution_orchestrator = Agent(
+resolution_orchestrator = LazyOrchestrator(
     name="ResolutionOrchestrator",
     description="Manages resolution processes, facilitating conflict resolution and structured decision-making.",
     model=AGENT_MODEL,
@@ -66,11 +55,9 @@ resolution_orchestrator = Agent(
 4.  **CRITICAL: You MUST call sub-agents sequentially as defined for the variant. Only call ONE sub-agent or HITL tool per turn.**
 5.  **CRITICAL: You do NOT have direct access to tools like 'read_partnership_documents'. You MUST delegate tasks requiring those tools to your sub-agents (`ResolutionBusinessAgent`, `ResolutionValueSoulAgent`, `ResolutionTeamSpiritAgent`).**
 """,
-    sub_agents=[
-        resolution_business_agent,
-        resolution_value_soul_agent,
-        resolution_team_spirit_agent
-    ],
+    # Its own Business/ValueSoul/TeamSpirit instances, built on first routing into this context
+    sub_agent_factory=build_specialists,
+    lazy_sub_agent_names=SPECIALIST_NAMES,
     # This orchestrator might need access to HITL tools directly
     tools=[
         tools.request_user_clarification,
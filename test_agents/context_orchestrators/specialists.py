@@ -0,0 +1,34 @@
+"""Specialist agents (Business, ValueSoul, TeamSpirit) of a context orchestrator.
+
+Every context orchestrator owns its own instances. They are built by
+``build_specialists`` the first time a request is routed into that context,
+so importing the agent tree does not import the tool modules.
+"""
+from google.adk.agents import BaseAgent
+
+from test_agents.agent_factory import AgentSpec
+
+# Names of the agents returned by build_specialists (the names in their specs)
+SPECIALIST_NAMES = ("BusinessAgent", "ValueSoulAgent", "TeamSpiritAgent")
+
+
+def specialist_specs() -> dict[str, AgentSpec]:
+    """The specs of the three specialists by name (importing them imports the tool modules)."""
+    from test_agents.config import ensure_document_dirs
+    from test_agents.business_agent import business_agent_spec
+    from test_agents.value_soul_agent_base import value_soul_agent_spec
+    from test_agents.team_spirit_agent_base import team_spirit_agent_spec
+
+    # Their tools read and write under DOCUMENTS_DIR
+    ensure_document_dirs()
+    return {spec.name: spec for spec in (business_agent_spec, value_soul_agent_spec, team_spirit_agent_spec)}
+
+
+def build_specialists() -> list[BaseAgent]:
+    """Creates a fresh, parentless set of the three specialists from their specs."""
+    from test_agents.checkpoints import checkpoint_store
+
+    specs = specialist_specs()
+    # Their answers are steps of the orchestrator's workflow
+    return [specs[name].build(after_agent_callback=checkpoint_store.after_agent_callback)
+            for name in SPECIALIST_NAMES]
@@ -0,0 +1,297 @@
+"""Parallel workflows: independent specialist calls of a variant run concurrently.
+
+The orchestrators' instructions call BusinessAgent, ValueSoulAgent and
+TeamSpiritAgent one per turn, even when the steps do not depend on each other
+(e.g. the business status, team sentiment and value check of a Weekly Review).
+Each ``Workflow`` below declares the specialist steps of one variant as a DAG
+(``WorkflowStep.after``). ``run_workflow`` starts every step as soon as the
+steps it depends on have finished, so independent steps run at the same time,
+and returns all their outputs merged, for the orchestrator to synthesize and
+present for review (the HITL step stays with the orchestrator).
+
+Each step runs on a fresh, read-only specialist built from its spec (the
+tools in ``tools.WRITE_TOOLS`` are left out, so concurrent steps cannot write
+the same documents), in a nested run (``AgentTool``) that gets the request
+and the outputs of the steps it depends on. The orchestrators get a
+``run_parallel_workflow`` tool for their variants (``workflow_tools``), and
+instructions to use it (``sequencing_rule``, ``workflow_instruction``) when
+``PARALLEL_WORKFLOWS_ENABLED`` is set.
+"""
+import asyncio
+import dataclasses
+import time
+import typing
+from dataclasses import dataclass
+
+from google.adk.tools.agent_tool import AgentTool
+from google.adk.tools.tool_context import ToolContext
+
+from test_agents.agent_factory import AgentSpec
+from test_agents.config import PARALLEL_WORKFLOWS_ENABLED, WORKFLOW_MAX_CONCURRENCY
+from test_agents.context_orchestrators.specialists import SPECIALIST_NAMES, specialist_specs
+from test_agents.models import ToolResult
+
+
+@dataclass(frozen=True)
+class WorkflowStep:
+    """One specialist call: ``task`` is its instruction, ``after`` the steps whose output it needs."""
+    name: str
+    agent: str
+    task: str
+    after: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Workflow:
+    """The specialist steps of one orchestrator variant (a DAG, listed in dependency order)."""
+    variant: str
+    description: str
+    steps: tuple[WorkflowStep, ...]
+
+    def __post_init__(self):
+        seen = set()
+        for step in self.steps:
+            if step.agent not in SPECIALIST_NAMES:
+                raise ValueError(f"Workflow '{self.variant}': unknown agent '{step.agent}' in step '{step.name}'")
+            missing = [name for name in step.after if name not in seen]
+            if missing:
+                raise ValueError(f"Workflow '{self.variant}': step '{step.name}' runs after unknown or later "
+                                 f"step(s) {missing}")
+            seen.add(step.name)
+
+    @property
+    def stages(self) -> list[list[str]]:
+        """Step names grouped by depth: the steps of a stage can run at the same time."""
+        depth: dict[str, int] = {}
+        for step in self.steps:
+            depth[step.name] = 1 + max((depth[name] for name in step.after), default=-1)
+        stages: list[list[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for name, level in depth.items():
+            stages[level].append(name)
+        return stages
+
+
+# Governance context -> its variants that can be parallelized
+WORKFLOWS: dict[str, dict[str, Workflow]] = {
+    "Planning": {
+        "weekly_review": Workflow(
+            "weekly_review", "Weekly Review Planning, steps 1-3",
+            (
+                WorkflowStep("business_status", "BusinessAgent",
+                             "Analyze the current task status against the existing plan."),
+                WorkflowStep("team_sentiment", "TeamSpiritAgent",
+                             "Summarize team feedback and sentiment from the recent meeting logs and profiles."),
+                WorkflowStep("value_check", "ValueSoulAgent",
+                             "Check the team's recent progress and priorities against the partnership values."),
+            ),
+        ),
+        "meeting_analysis": Workflow(
+            "meeting_analysis", "Meeting Analysis Planning, steps 1-3",
+            (
+                WorkflowStep("interaction_analysis", "TeamSpiritAgent",
+                             "Analyze the interactions in the meeting transcript or log."),
+                WorkflowStep("extracted_items", "BusinessAgent",
+                             "Extract the tasks and decisions from the meeting. Do NOT write them to any list yet."),
+                WorkflowStep("value_alignment", "ValueSoulAgent",
+                             "Check the extracted tasks and decisions against the partnership values.",
+                             after=("extracted_items",)),
+            ),
+        ),
+    },
+    "Evaluation": {
+        "task_evaluation": Workflow(
+            "task_evaluation", "Task/Milestone Evaluation, steps 1-3",
+            (
+                WorkflowStep("task_outcome", "BusinessAgent",
+                             "Retrieve the task or milestone definition, its goals and the recorded outcome/status."),
+                WorkflowStep("team_feedback", "TeamSpiritAgent",
+                             "Find team feedback on how the task went in the related meeting logs."),
+                WorkflowStep("value_evaluation", "ValueSoulAgent",
+                             "Evaluate the outcome against the project and partnership values.",
+                             after=("task_outcome",)),
+            ),
+        ),
+        "meeting_evaluation": Workflow(
+            "meeting_evaluation", "Meeting Evaluation, steps 1-3",
+            (
+                WorkflowStep("meeting_log", "TeamSpiritAgent", "Read the specified meeting log and summarize it."),
+                WorkflowStep("value_evaluation", "ValueSoulAgent",
+                             "Evaluate the meeting's discussion and decisions against the partnership values.",
+                             after=("meeting_log",)),
+                WorkflowStep("actionable_outcomes", "BusinessAgent",
+                             "Identify actionable outcomes or tasks from the meeting. Do NOT write them to any "
+                             "list yet.",
+                             after=("meeting_log",)),
+            ),
+        ),
+        "value_alignment": Workflow(
+            "value_alignment", "Value Alignment Check, steps 1-3",
+            (
+                WorkflowStep("values", "ValueSoulAgent",
+                             "Summarize the principles of the partnership documents relevant to the request."),
+                WorkflowStep("project_status", "BusinessAgent",
+                             "Retrieve the project plans and task status relevant to the request."),
+                WorkflowStep("alignment_check", "ValueSoulAgent",
+                             "Check the project status against the values.",
+                             after=("values", "project_status")),
+            ),
+        ),
+    },
+    "Reflection": {
+        "lessons_learned": Workflow(
+            "lessons_learned", "Lessons Learned Capture, steps 1-3",
+            (
+                WorkflowStep("project_documents", "BusinessAgent",
+                             "Retrieve the plans and task status of the project phase."),
+                WorkflowStep("team_perspectives", "TeamSpiritAgent",
+                             "Gather the team's perspectives on the phase from the related meeting logs."),
+                WorkflowStep("value_lessons", "ValueSoulAgent",
+                             "Analyze the lessons learned through the lens of the partnership values.",
+                             after=("project_documents", "team_perspectives")),
+            ),
+        ),
+    },
+}
+
+StepRunner = typing.Callable[[WorkflowStep, str], typing.Awaitable[str]]
+
+
+def _step_prompt(step: WorkflowStep, request: str, outputs: dict[str, str]) -> str:
+    parts = [step.task, f"Request: {request}"]
+    if step.after:
+        parts.append("Results of the previous steps:")
+        parts.extend(f"[{name}]\n{outputs[name]}" for name in step.after)
+    return "\n\n".join(parts)
+
+
+async def execute_workflow(workflow: Workflow, request: str, run_step: StepRunner,
+                           max_concurrency: int = WORKFLOW_MAX_CONCURRENCY) -> dict:
+    """Runs the steps of a workflow, each as soon as its dependencies are done.
+
+    Args:
+        workflow: The steps to run.
+        request: What the user asked (passed to every step).
+        run_step: Coroutine function running one step's prompt on its agent and returning its answer.
+        max_concurrency: Maximum number of steps running at the same time (1 runs them sequentially).
+
+    Returns:
+        dict: Per step its agent, status ('success', 'error' or 'skipped' when a
+        dependency failed), output and seconds, plus the total wall-clock seconds.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    outputs: dict[str, str] = {}
+    results: dict[str, dict] = {}
+    started = time.perf_counter()
+
+    async def run(step: WorkflowStep, dependencies: list[asyncio.Task]):
+        if not all(await asyncio.gather(*dependencies)):
+            results[step.name] = {"agent": step.agent, "status": "skipped", "output": None, "seconds": 0.0}
+            return False
+        async with semaphore:
+            step_started = time.perf_counter()
+            try:
+                output = await run_step(step, _step_prompt(step, request, outputs))
+            except Exception as e:
+                results[step.name] = {"agent": step.agent, "status": "error", "output": f"{type(e).__name__}: {e}",
+                                      "seconds": round(time.perf_counter() - step_started, 3)}
+                return False
+        outputs[step.name] = output
+        results[step.name] = {"agent": step.agent, "status": "success", "output": output,
+                              "seconds": round(time.perf_counter() - step_started, 3)}
+        return True
+
+    tasks: dict[str, asyncio.Task] = {}
+    for step in workflow.steps:
+        tasks[step.name] = asyncio.ensure_future(run(step, [tasks[name] for name in step.after]))
+    await asyncio.gather(*tasks.values())
+    return {
+        "variant": workflow.variant,
+        # In declaration order
+        "steps": {step.name: results[step.name] for step in workflow.steps},
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def read_only_specs() -> dict[str, AgentSpec]:
+    """The specialists' specs without the tools that write documents, for workflow steps."""
+    from test_agents.tools import WRITE_TOOLS
+
+    return {
+        name: dataclasses.replace(
+            spec,
+            tools=tuple(tool for tool in spec.tools if tool.__name__ not in WRITE_TOOLS),
+            instruction=spec.instruction + "\n\nIn this step you can only read documents: report what should "
+                                           "be written instead of writing it.",
+        )
+        for name, spec in specialist_specs().items()
+    }
+
+
+def _agent_tool_runner(tool_context: ToolContext) -> StepRunner:
+    """Runs each step on a new read-only specialist in a nested run, like an ``AgentTool`` call."""
+    specs = read_only_specs()
+
+    async def run_step(step: WorkflowStep, prompt: str) -> str:
+        agent = specs[step.agent].build(disallow_transfer_to_parent=True, disallow_transfer_to_peers=True)
+        output = await AgentTool(agent).run_async(args={"request": prompt}, tool_context=tool_context)
+        return output if isinstance(output, str) else str(output)
+
+    return run_step
+
+
+def workflow_tools(context: str) -> list:
+    """The ``run_parallel_workflow`` tool for a context's variants (none if disabled or not parallelizable)."""
+    workflows = WORKFLOWS.get(context)
+    if not PARALLEL_WORKFLOWS_ENABLED or not workflows:
+        return []
+
+    async def run_parallel_workflow(variant: str, request: str, tool_context: ToolContext) -> dict:
+        try:
+            workflow = workflows[variant]
+        except KeyError:
+            return ToolResult(status="error", error_message=f"Unknown variant '{variant}'. "
+                              f"Available: {', '.join(workflows)}").model_dump()
+        result = await execute_workflow(workflow, request, _agent_tool_runner(tool_context))
+        if all(step["status"] != "success" for step in result["steps"].values()):
+            return ToolResult(status="error", error_message="All workflow steps failed.", result=result).model_dump()
+        return ToolResult(status="success", result=result).model_dump()
+
+    run_parallel_workflow.__doc__ = f"""Runs the specialist steps of a workflow variant, independent steps concurrently.
+
+    Args:
+        variant (str): One of: {', '.join(f"'{name}' ({workflow.description})" for name, workflow in workflows.items())}.
+        request (str): The user's request with all details the specialists need (names, dates, documents).
+
+    Returns:
+        dict: A ToolResult; 'result' has 'steps', the output of every step by name.
+    """
+    return [run_parallel_workflow]
+
+
+def sequencing_rule(context: str) -> str:
+    """Rule 4 of an orchestrator's instruction: one call per turn, the steps of its parallel
+    workflows (if any) in a single ``run_parallel_workflow`` call."""
+    if not workflow_tools(context):
+        return ("4.  **CRITICAL: You MUST call sub-agents sequentially as defined for the variant. "
+                "Only call ONE sub-agent or HITL tool per turn.**\n")
+    return ("4.  **CRITICAL: Only make ONE call per turn: a sub-agent, a HITL tool or `run_parallel_workflow`. "
+            "Call the sub-agents sequentially as defined for the variant, except for the steps of the variants "
+            "listed under 'Parallel workflows' below: run those with a single `run_parallel_workflow` call, then "
+            "continue with the variant's next step.**\n")
+
+
+def workflow_instruction(context: str) -> str:
+    """Instructions for the ``run_parallel_workflow`` tool (empty if the context has none)."""
+    if not workflow_tools(context):
+        return ""
+    lines = [
+        "",
+        "**Parallel workflows:** For the variants below, do NOT call the sub-agents for the listed steps one by one. "
+        "Instead call the `run_parallel_workflow` tool ONCE with the variant and the full request: it runs those "
+        "steps (independent ones at the same time) and returns every step's output. Then synthesize the outputs and "
+        "continue with the variant's next step (e.g. `present_for_review_and_approval`) as usual.",
+    ]
+    for name, workflow in WORKFLOWS[context].items():
+        steps = ", ".join(f"{step.name} ({step.agent})" for step in workflow.steps)
+        lines.append(f"    *   `{name}`: {workflow.description}: {steps}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,373 @@
+"""Asynchronous human-in-the-loop (HITL) requests.
+
+The HITL tools (``tools/human_interaction_tools.py``) used to call
+``input()``, which blocked the whole server process, and with it every
+other session, until one person answered. They are now ADK long-running
+tools: a call registers a pending request in ``HitlStore`` (an SQLite file
+shared by the server and the CLI) and returns at once with status
+``pending``; ADK then pauses that session's invocation while the worker
+keeps serving the others.
+
+A session is resumed by sending the answer as the ``FunctionResponse`` of
+the pending call (same id and name), which ADK routes back to the agent that
+asked:
+
+* ``adk web`` shows the pending call and lets the user send that response.
+  The orchestrators' ``HitlStore.before_model_callback`` then marks the
+  request delivered, so it is no longer listed as pending and cannot be
+  answered a second time from the CLI.
+* an application that owns the ``Runner`` calls ``resume`` (or runs a
+  ``HitlResponder``, which delivers every answer recorded in the store),
+* people answer from the command line, which records the answer for the
+  responder:
+
+    python -m test_agents hitl list
+    python -m test_agents hitl answer <request_id> "Next Friday works"
+    python -m test_agents hitl answer <request_id> approved_with_comments --comments "Shorter, please"
+    python -m test_agents hitl answer <request_id> 2          # option number or text
+
+Answers recorded from the command line only reach a session through a
+``HitlResponder`` running on the same ``Runner``, i.e. in an application that
+creates its own runner. ``adk web`` / ``adk api_server`` own their runner and
+run no responder: there, answer in the web UI (or send the FunctionResponse
+through the API).
+
+``FakeResponder`` answers pending requests automatically, for local runs and
+benchmarks without a person.
+"""
+import argparse
+import asyncio
+import json
+import sqlite3
+import sys
+import threading
+import time
+import typing
+import uuid
+from pathlib import Path
+
+from google.genai import types
+
+from .config import HITL_POLL_INTERVAL, HITL_STORE_FILE
+
+REVIEW_DECISIONS = ("approved", "rejected", "approved_with_comments")
+
+# The long-running tools of human_interaction_tools.py
+HITL_TOOLS = frozenset({"request_user_clarification", "present_for_review_and_approval", "ask_user_to_choose_option"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    request_id TEXT PRIMARY KEY,
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    function_call_id TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    answer TEXT,
+    created REAL NOT NULL,
+    answered REAL
+);
+CREATE INDEX IF NOT EXISTS requests_status ON requests (status);
+CREATE INDEX IF NOT EXISTS requests_call ON requests (session_id, function_call_id);
+"""
+
+
+class HitlError(ValueError):
+    """An unknown request, or an answer that does not fit the request."""
+
+
+class HitlRequest(typing.NamedTuple):
+    request_id: str
+    app_name: str
+    user_id: str
+    session_id: str
+    function_call_id: str
+    tool: str
+    payload: dict
+    # 'pending', 'answered' (waiting to be delivered) or 'delivered'
+    status: str
+    # The tool result sent to the agent (a ToolResult dict), once answered
+    answer: typing.Optional[dict]
+    created: float
+    answered: typing.Optional[float]
+
+
+def build_answer(request: HitlRequest, response: typing.Union[str, dict]) -> dict:
+    """Turns a person's response into the tool result the agent expects.
+
+    Args:
+        request: The pending request.
+        response: The answer text; for reviews the decision (or a dict with
+            'decision' and 'comments'), for choices the option text or its
+            1-based number.
+
+    Raises:
+        HitlError: If the response does not fit the request.
+    """
+    if request.tool == "present_for_review_and_approval":
+        if isinstance(response, str):
+            response = {"decision": response}
+        decision = str(response.get("decision", "")).lower().strip()
+        if decision not in REVIEW_DECISIONS:
+            raise HitlError(f"Decision must be one of {', '.join(REVIEW_DECISIONS)}, got '{decision}'.")
+        return {"status": "success", "result": {"decision": decision, "comments": response.get("comments") or ""},
+                "error_message": None}
+    if request.tool == "ask_user_to_choose_option":
+        options = request.payload["options"]
+        choice = response.get("selected_option") if isinstance(response, dict) else response
+        choice = str(choice).strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(options) and choice not in options:
+            choice = options[int(choice) - 1]
+        if choice not in options:
+            raise HitlError(f"Choose one of {options} (or its number), got '{choice}'.")
+        return {"status": "success", "result": {"selected_option": choice}, "error_message": None}
+    text = response.get("user_response") if isinstance(response, dict) else response
+    return {"status": "success", "result": {"user_response": str(text or "")}, "error_message": None}
+
+
+class HitlStore:
+    """Pending and answered HITL requests, in an SQLite file (WAL mode, shared across processes)."""
+
+    def __init__(self, path: typing.Union[str, Path]):
+        self.path = Path(path)
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Called with the lock held
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def _from_row(row) -> HitlRequest:
+        values = list(row)
+        values[6] = json.loads(values[6])
+        values[8] = json.loads(values[8]) if values[8] is not None else None
+        return HitlRequest(*values)
+
+    def register(self, tool_context, tool: str, payload: dict) -> HitlRequest:
+        """Records a pending request for the current tool call of a session."""
+        session = tool_context.session
+        request = HitlRequest(
+            request_id=uuid.uuid4().hex[:12],
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+            function_call_id=tool_context.function_call_id,
+            tool=tool,
+            payload=payload,
+            status="pending",
+            answer=None,
+            created=time.time(),
+            answered=None,
+        )
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO requests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*request[:6], json.dumps(payload, default=str), request.status, None, request.created, None),
+            )
+        return request
+
+    def get(self, request_id: str) -> HitlRequest:
+        with self._lock:
+            row = self._connect().execute("SELECT * FROM requests WHERE request_id = ?", (request_id,)).fetchone()
+        if row is None:
+            raise HitlError(f"Unknown HITL request '{request_id}'.")
+        return self._from_row(row)
+
+    def requests(self, status: typing.Optional[str] = None,
+                 app_name: typing.Optional[str] = None) -> list[HitlRequest]:
+        """Requests, oldest first, optionally only those with a status / of an app."""
+        query, params = "SELECT * FROM requests WHERE 1 = 1", []
+        if status is not None:
+            query, params = query + " AND status = ?", params + [status]
+        if app_name is not None:
+            query, params = query + " AND app_name = ?", params + [app_name]
+        with self._lock:
+            rows = self._connect().execute(query + " ORDER BY created", params).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def answer(self, request_id: str, response: typing.Union[str, dict]) -> HitlRequest:
+        """Records the answer to a pending request (see ``build_answer``).
+
+        Raises:
+            HitlError: If the request is unknown, already answered, or the answer does not fit it.
+        """
+        request = self.get(request_id)
+        if request.status != "pending":
+            raise HitlError(f"HITL request '{request_id}' is already {request.status}.")
+        answer = build_answer(request, response)
+        now = time.time()
+        with self._lock:
+            updated = self._connect().execute(
+                "UPDATE requests SET status = 'answered', answer = ?, answered = ? "
+                "WHERE request_id = ? AND status = 'pending'",
+                (json.dumps(answer), now, request_id),
+            ).rowcount
+        if not updated:
+            raise HitlError(f"HITL request '{request_id}' was answered meanwhile.")
+        return request._replace(status="answered", answer=answer, answered=now)
+
+    def mark_delivered(self, request_id: str):
+        with self._lock:
+            self._connect().execute("UPDATE requests SET status = 'delivered' WHERE request_id = ?", (request_id,))
+
+    def mark_call_delivered(self, session_id: str, function_call_id: str, answer: dict) -> int:
+        """Marks the request of a tool call delivered once its response is in the session.
+
+        Keeps an answer recorded earlier (e.g. from the CLI); otherwise records
+        the one the session received. Returns the number of requests updated.
+        """
+        with self._lock:
+            return self._connect().execute(
+                "UPDATE requests SET status = 'delivered', answer = COALESCE(answer, ?), "
+                "answered = COALESCE(answered, ?) "
+                "WHERE session_id = ? AND function_call_id = ? AND status != 'delivered'",
+                (json.dumps(answer, default=str), time.time(), session_id, function_call_id),
+            ).rowcount
+
+    def before_model_callback(self, callback_context, llm_request) -> None:
+        """Marks the requests answered in the session itself (e.g. in adk web) as delivered.
+
+        The resuming message is the last content of the request; its function
+        call ids are read from the session's event, since ADK strips its own
+        ids from the request.
+        """
+        contents = llm_request.contents
+        if not contents or contents[-1].role != "user" or not any(
+                part.function_response is not None and part.function_response.name in HITL_TOOLS
+                for part in contents[-1].parts or []):
+            return None
+        session = callback_context.session
+        for event in reversed(session.events):
+            if event.author != "user":
+                continue
+            for response in event.get_function_responses():
+                if (response.id and response.name in HITL_TOOLS
+                        and (response.response or {}).get("status") != "pending"):
+                    self.mark_call_delivered(session.id, response.id, response.response or {})
+            break
+        return None
+
+
+def function_response_message(request: HitlRequest) -> types.Content:
+    """The user message that resumes the session: the answer as the pending call's response."""
+    if request.answer is None:
+        raise HitlError(f"HITL request '{request.request_id}' has not been answered.")
+    return types.Content(role="user", parts=[types.Part(function_response=types.FunctionResponse(
+        id=request.function_call_id, name=request.tool, response=request.answer,
+    ))])
+
+
+async def resume(runner, request: HitlRequest, store: typing.Optional["HitlStore"] = None) -> list:
+    """Delivers an answered request to its session and runs it until it finishes or pauses again.
+
+    Returns:
+        list: The events of the resumed run.
+    """
+    events = [
+        event async for event in runner.run_async(
+            user_id=request.user_id, session_id=request.session_id,
+            new_message=function_response_message(request),
+        )
+    ]
+    (store or hitl_store).mark_delivered(request.request_id)
+    return events
+
+
+class HitlResponder:
+    """Resumes the sessions of a runner whose HITL requests were answered (e.g. from the CLI)."""
+
+    def __init__(self, runner, store: typing.Optional[HitlStore] = None, poll_interval: float = HITL_POLL_INTERVAL):
+        self.runner = runner
+        self.store = store or hitl_store
+        self.poll_interval = poll_interval
+
+    async def deliver_answered(self) -> int:
+        """Resumes every session with an undelivered answer, concurrently; returns how many."""
+        requests = self.store.requests(status="answered", app_name=self.runner.app_name)
+        await asyncio.gather(*(resume(self.runner, request, self.store) for request in requests))
+        return len(requests)
+
+    async def run(self):
+        """Delivers answers as they come in, until cancelled."""
+        while True:
+            await self.deliver_answered()
+            await asyncio.sleep(self.poll_interval)
+
+
+class FakeResponder:
+    """Answers pending requests without a person: fixed text, a review decision and the first option."""
+
+    def __init__(self, store: typing.Optional[HitlStore] = None, text: str = "Yes, please go ahead.",
+                 decision: str = "approved", comments: str = ""):
+        self.store = store or hitl_store
+        self.text = text
+        self.decision = decision
+        self.comments = comments
+
+    def response_for(self, request: HitlRequest) -> typing.Union[str, dict]:
+        if request.tool == "present_for_review_and_approval":
+            return {"decision": self.decision, "comments": self.comments}
+        if request.tool == "ask_user_to_choose_option":
+            return "1"
+        return self.text
+
+    def answer_pending(self, app_name: typing.Optional[str] = None) -> list[HitlRequest]:
+        """Answers every pending request (of an app); returns the answered requests."""
+        answered = []
+        for request in self.store.requests(status="pending", app_name=app_name):
+            try:
+                answered.append(self.store.answer(request.request_id, self.response_for(request)))
+            except HitlError:
+                # Answered by someone else meanwhile
+                continue
+        return answered
+
+
+# Shared by the HITL tools, the responders and the CLI
+hitl_store = HitlStore(HITL_STORE_FILE)
+
+
+def _describe(request: HitlRequest) -> dict:
+    return {"request_id": request.request_id, "tool": request.tool, "status": request.status,
+            "session_id": request.session_id, "user_id": request.user_id,
+            "waiting_s": round(time.time() - request.created, 1), **request.payload}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m test_agents hitl",
+                                     description="List and answer pending human-in-the-loop requests.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    listing = commands.add_parser("list", help="Show pending requests")
+    listing.add_argument("--all", action="store_true", help="Also show answered and delivered requests")
+    answer = commands.add_parser("answer", help="Answer a pending request")
+    answer.add_argument("request_id")
+    answer.add_argument("response", help="Answer text, review decision, or option (text or number)")
+    answer.add_argument("--comments", default="", help="Comments for a review decision")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for request in hitl_store.requests(status=None if args.all else "pending"):
+            print(json.dumps(_describe(request), default=str))
+        return 0
+    try:
+        request = hitl_store.get(args.request_id)
+        response = ({"decision": args.response, "comments": args.comments}
+                    if request.tool == "present_for_review_and_approval" else args.response)
+        request = hitl_store.answer(args.request_id, response)
+    except HitlError as e:
+        print(f"Error: {e}")
+        return 1
+    print(json.dumps({"request_id": request.request_id, "status": request.status, "answer": request.answer}))
+    # adk web runs no responder (see the module docstring)
+    print("Recorded. A HitlResponder on the session's runner delivers it; with adk web, answer in the web UI.",
+          file=sys.stderr)
+    return 0
@@ -0,0 +1,117 @@
+"""Shared model clients for all agents.
+
+``get_model(name)`` hands out one ``LiteLlm`` per model name for the whole
+process, so the 20 agents of the tree (and their per-invocation clones) do not
+each set up a client. The first call also installs pooled ``httpx`` clients as
+LiteLLM's ``client_session``/``aclient_session``: every provider request then
+reuses keep-alive connections instead of opening a connection (and TLS
+handshake) per call. Pool limits and the timeout come from ``config.py``
+(``LLM_*`` environment variables).
+
+LiteLLM is imported on the first ``get_model`` call (it takes about a second),
+which for agents built with ``agent_factory.PooledAgent`` is their first LLM
+request, not the import of the agent tree.
+
+``LLM_MODEL=stub`` selects the deterministic local ``StubLlm`` instead (see
+``stub_llm.py``), which needs neither LiteLLM nor network access.
+
+The async pool belongs to the event loop that first uses it; a worker runs
+all agents on one loop. ``aclose()`` closes it (e.g. on shutdown).
+"""
+import threading
+import typing
+
+from .config import (
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_MODEL,
+    LLM_TIMEOUT,
+    STUB_LLM_LATENCY,
+)
+
+# LLM_MODEL value selecting the local rule-based model (stub_llm.py), e.g. for offline load tests
+STUB_MODEL_NAME = "stub"
+
+if typing.TYPE_CHECKING:
+    from google.adk.models.base_llm import BaseLlm
+    from google.adk.models.lite_llm import LiteLlm
+
+_models: dict[str, "BaseLlm"] = {}
+_lock = threading.Lock()
+# The sessions installed by _install_http_pool (not ones configured by the application)
+_sessions: list = []
+
+
+def _install_http_pool():
+    """Gives LiteLLM pooled keep-alive HTTP clients, unless the application already set its own."""
+    import httpx
+    import litellm
+
+    limits = httpx.Limits(
+        max_connections=LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(LLM_TIMEOUT)
+    if litellm.aclient_session is None:
+        litellm.aclient_session = httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True)
+        _sessions.append(litellm.aclient_session)
+    if litellm.client_session is None:
+        litellm.client_session = httpx.Client(limits=limits, timeout=timeout, follow_redirects=True)
+        _sessions.append(litellm.client_session)
+
+
+def get_model(model_name: typing.Optional[str] = None) -> "BaseLlm":
+    """Returns the shared client for a model (``LLM_MODEL`` by default), creating it on first use.
+
+    Args:
+        model_name: A LiteLLM model name, e.g. "openai/gpt-4.1-mini", or "stub" for the
+            local ``StubLlm``.
+    """
+    model_name = model_name or LLM_MODEL
+    model = _models.get(model_name)
+    if model is not None:
+        return model
+    with _lock:
+        model = _models.get(model_name)
+        if model is None and model_name == STUB_MODEL_NAME:
+            from .stub_llm import StubLlm
+
+            model = _models[model_name] = StubLlm(model=model_name, latency=STUB_LLM_LATENCY)
+        elif model is None:
+            from google.adk.models.lite_llm import LiteLlm
+
+            if not _sessions:
+                _install_http_pool()
+            # The timeout is passed per request too, or the provider SDK's default (10 min) applies
+            model = _models[model_name] = LiteLlm(model=model_name, timeout=LLM_TIMEOUT)
+    return model
+
+
+def register_model(model_name: str, model: "BaseLlm"):
+    """Makes ``get_model(model_name)`` return ``model`` (e.g. a local stub for benchmarks)."""
+    with _lock:
+        _models[model_name] = model
+
+
+def loaded_models() -> list[str]:
+    """Names of the models whose client has been created."""
+    return list(_models)
+
+
+async def aclose():
+    """Closes the HTTP pool installed by ``get_model`` and forgets the clients."""
+    import litellm
+
+    with _lock:
+        sessions = list(_sessions)
+        _sessions.clear()
+        _models.clear()
+    for session in sessions:
+        if litellm.aclient_session is session:
+            litellm.aclient_session = None
+            await session.aclose()
+        elif litellm.client_session is session:
+            litellm.client_session = None
+            session.close()
@@ -6,8 +6,9 @@ It analyzes user requests to determine the relevant governance context
 the request to the corresponding specialized Context Orchestrator agent.
 """
 
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
+from .agent_factory import DEFAULT_MODEL_NAME, PooledAgent
+from .commands import before_agent_callback as run_command_message
+from .router import context_router
 
 # Import the context orchestrators
 from .context_orchestrators import (
@@ -19,10 +20,10 @@ from .context_orchestrators import (
 )
 
 # Define the model for the main orchestrator
-AGENT_MODEL = LiteLlm(model="openai/gpt-4.1-mini")
+AGENT_MODEL = DEFAULT_MODEL_NAME
 
 # Define the Main Orchestrator (Root Agent)
-main_orchestrator = Agent(
+main_orchestrator = PooledAgent(
     name="GovernanceOrchestrator",
     description="Central orchestrator that analyzes user requests and routes them to the appropriate governance context orchestrator (Planning, Execution, Evaluation, Reflection, Resolution).",
     model=AGENT_MODEL,
@@ -52,5 +53,10 @@ main_orchestrator = Agent(
         resolution_orchestrator
     ],
     # This main orchestrator should NOT have tools, its only job is routing.
-    tools=[]
+    tools=[],
+    # Command messages ("/write_task ...", JSON) run the tool directly (see commands.py)
+    before_agent_callback=run_command_message,
+    # Unambiguous requests are routed locally, without an LLM call (see router.py)
+    before_model_callback=context_router.before_model_callback,
+    after_model_callback=context_router.after_model_callback,
 )
@@ -50,6 +50,35 @@ class TaskListResult(BaseModel):
     tasks: list[Task] = Field(..., description="List of tasks found in the document")
     raw_content: str = Field(..., description="The raw markdown content of the task list file")
 
+class TaskFilterInput(BaseModel):
+    """Filter, sort and pagination options shared by the task query tools."""
+    assignee: typing.Optional[str] = Field(None, description="Only tasks assigned to this person (case-insensitive).")
+    status: typing.Optional[str] = Field(None, description="Only tasks with this status (case-insensitive).")
+    deadline_from: typing.Optional[str] = Field(None, description="Only tasks due on or after this date (YYYY-MM-DD).")
+    deadline_to: typing.Optional[str] = Field(None, description="Only tasks due on or before this date (YYYY-MM-DD).")
+    text: typing.Optional[str] = Field(None, description="Only tasks whose title or description contains this text (case-insensitive).")
+    sort_by: typing.Literal["task_id", "title", "assignee", "deadline", "status"] = Field("task_id", description="Field to sort by.")
+    descending: bool = Field(False, description="Sort in descending order.")
+    limit: int = Field(20, ge=1, le=200, description="Maximum number of tasks to return.")
+    cursor: typing.Optional[str] = Field(None, description="The 'next_cursor' value from a previous query, to fetch the next page.")
+    fields: typing.Optional[list[typing.Literal["task_id", "title", "assignee", "deadline", "description", "status"]]] = Field(None, description="Task fields to return (task_id is always included). All fields if omitted.")
+
+class QueryTasksInput(TaskFilterInput):
+    """Input model for filtering, sorting and paginating one user's task list."""
+    user_name: str = Field(..., description="The name of the user whose list to query ('Philipp' or 'Guillaume').")
+    include_raw_content: bool = Field(False, description="Also return the raw markdown of the whole list.")
+
+class QueryTeamTasksInput(TaskFilterInput):
+    """Input model for querying the task lists of the whole team at once."""
+    user_names: typing.Optional[list[str]] = Field(None, description="Only search these users' lists. All lists if omitted.")
+
+class TaskQueryResult(BaseModel):
+    """Structured result for a task list query."""
+    tasks: list[dict] = Field(..., description="The matching tasks on this page, projected to the requested fields (team queries also include the owning list's 'user_name').")
+    total_matches: int = Field(..., description="Number of tasks matching the filters across all pages.")
+    next_cursor: typing.Optional[str] = Field(None, description="Pass as 'cursor' to fetch the next page; None if this is the last page.")
+    raw_content: typing.Optional[str] = Field(None, description="The raw markdown of the list, only if requested.")
+
 class WriteTaskInput(BaseModel):
     """Input model for adding a new task."""
     task_title: str = Field(..., description="The title for the new task.")
@@ -76,11 +105,47 @@ class TaskOperationResult(BaseModel):
     message: str = Field(..., description="A confirmation or error message.")
     task_id: int | None = Field(None, description="The ID of the task affected (useful for creation).")
 
+class NewTaskInput(BaseModel):
+    """One task to add within a bulk write."""
+    task_title: str = Field(..., description="The title for the new task.")
+    assignee: str = Field(..., description="Who the task should be assigned to.")
+    deadline: str = Field(..., description="The deadline for the task (YYYY-MM-DD).")
+    description: str = Field(..., description="A description of the task.")
+
+class WriteTasksBulkInput(BaseModel):
+    """Input model for adding several tasks to one list in a single operation."""
+    user_name: str = Field(..., description="The name of the user whose list to modify ('Philipp' or 'Guillaume').")
+    tasks: list[NewTaskInput] = Field(..., min_length=1, description="The tasks to add, in order.")
+
+class TaskEditOperation(BaseModel):
+    """One modify or delete operation within a bulk edit."""
+    task_id: int = Field(..., description="The ID of the task to modify or delete.")
+    action: str = Field(..., description="The action to perform: 'modify' or 'delete'.")
+    updates: typing.Optional[dict] = Field(None, description="Fields to change if action is 'modify' (title, assignee, deadline, description, status).")
+
+class EditTasksBulkInput(BaseModel):
+    """Input model for modifying/deleting several tasks in one list in a single operation."""
+    user_name: str = Field(..., description="The name of the user whose list to modify ('Philipp' or 'Guillaume').")
+    operations: list[TaskEditOperation] = Field(..., min_length=1, description="The operations to apply, in order.")
+
+class BulkTaskItemResult(BaseModel):
+    """Outcome of a single item within a bulk task operation."""
+    index: int = Field(..., description="Position of the item in the request (0-based).")
+    status: typing.Literal["success", "error", "not_applied"] = Field(..., description="'not_applied' means the item was valid but the batch was rolled back.")
+    message: str = Field(..., description="A confirmation or error message for this item.")
+    task_id: int | None = Field(None, description="The ID of the task affected.")
+
+class BulkTaskOperationResult(BaseModel):
+    """Output model for bulk task operations, which are applied all-or-nothing."""
+    status: str = Field(..., description="'success' if every item was applied, 'error' if none were.")
+    message: str = Field(..., description="A summary of the operation.")
+    results: list[BulkTaskItemResult] = Field(default_factory=list, description="Per-item results, in request order.")
+
 
 # --- Generic Tool Result Model ---
 
 class ToolResult(BaseModel):
     """Generic output model for tools, indicating success or failure."""
-    status: typing.Literal["success", "error"] = Field(..., description="Indicates if the operation was successful or encountered an error.")
+    status: typing.Literal["success", "error", "pending"] = Field(..., description="Indicates if the operation was successful or encountered an error ('pending': waiting for the user, see hitl.py).")
     result: typing.Optional[dict] = Field(None, description="A dictionary containing the successful result data, if applicable.")
     error_message: typing.Optional[str] = Field(None, description="A message describing the error, if status is 'error'.")
@@ -0,0 +1,278 @@
+"""Persistent cache of LLM responses, shared by all agents.
+
+Teams ask the same questions again ("what does our agreement say about
+decision making?") and each one used to run the whole orchestrator chain.
+Every ``PooledAgent`` (see agent_factory.py) passes its model calls through
+``ResponseCache``: before a call the cache looks up the request, after it the
+response is stored, so a repeated request skips the LLM round trip at every
+hop (routing, the transfer to the specialist, its tool calls and answer).
+
+An entry is keyed on
+
+* the agent name and model,
+* a hash of the system instruction and of the declared tools,
+* the normalized conversation: text as casefolded word tokens (so case,
+  punctuation and spacing do not matter), tool calls by name and arguments
+  and tool results by a hash of their content (call ids are per-run and
+  ignored),
+
+and is only valid for the documents it was produced from: the documents'
+write generation (``tools/document_io.write_generation``, which changes with
+every document the tools write, in any process) is stored with it, and all
+entries are dropped as soon as it changes. It is one ``stat`` per model call;
+documents edited by hand are not noticed (``python -m test_agents cache
+clear``).
+
+The cache is off by default (``RESPONSE_CACHE_ENABLED``): identical
+conversations get the earlier answer again instead of a new one.
+
+Only final responses are stored, and only if every tool call in them is a
+transfer or a read-only tool; a response that writes (``write_task``...) or
+asks the user is never replayed. Entries expire after ``RESPONSE_CACHE_TTL``
+seconds and the least recently used ones are evicted beyond
+``RESPONSE_CACHE_MAX_ENTRIES``. The store is an SQLite file (WAL mode, so
+several workers can share it).
+
+    python -m test_agents cache stats
+    python -m test_agents cache clear
+"""
+import argparse
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import typing
+from pathlib import Path
+
+from google.adk.models.llm_response import LlmResponse
+
+from .config import (
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_FILE,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_TTL,
+)
+from .tools.document_io import write_generation
+from .tools.text_utils import tokenize
+
+# Tool calls a cached response may contain: replaying them has no side effects
+CACHEABLE_CALLS = frozenset({
+    "transfer_to_agent",
+    "get_current_time",
+    "read_task_list",
+    "query_tasks",
+    "query_team_tasks",
+    "read_partnership_documents",
+    "list_partnership_sections",
+    "read_partnership_section",
+    "find_relevant_values",
+    "read_meeting_log",
+    "list_meetings",
+    "latest_meeting",
+    "search_meetings",
+    "read_team_profile",
+    "search_governance_documents",
+    "read_pirate_code",
+})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    agent TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def documents_fingerprint() -> str:
+    """Changes whenever the tools write a document (see ``document_io.write_generation``)."""
+    return "-".join(map(str, write_generation()))
+
+
+def _normalize_part(part) -> typing.Optional[list]:
+    if part.thought:
+        return None
+    if part.text is not None:
+        return ["text", " ".join(tokenize(part.text))]
+    if part.function_call is not None:
+        return ["call", part.function_call.name, part.function_call.args]
+    if part.function_response is not None:
+        return ["result", part.function_response.name, _digest(part.function_response.response)]
+    # Files, images...: by content
+    return ["data", _digest(part.model_dump(mode="json", exclude_none=True))]
+
+
+def request_key(agent_name: str, llm_request) -> str:
+    """The cache key of a model request (see the module docstring)."""
+    config = llm_request.config
+    tools = sorted(
+        declaration.name
+        for tool in (config.tools or []) if getattr(tool, "function_declarations", None)
+        for declaration in tool.function_declarations
+    )
+    conversation = [
+        [content.role, [normalized for normalized in map(_normalize_part, content.parts or []) if normalized]]
+        for content in llm_request.contents
+    ]
+    return _digest({
+        "agent": agent_name,
+        "model": llm_request.model,
+        "instruction": _digest(str(config.system_instruction)),
+        "tools": _digest(tools),
+        "conversation": conversation,
+    })
+
+
+def is_cacheable(llm_response: LlmResponse) -> bool:
+    """A complete, successful response whose tool calls (if any) can be replayed safely."""
+    if llm_response.partial or llm_response.error_code or not llm_response.content:
+        return False
+    parts = llm_response.content.parts or []
+    if not parts:
+        return False
+    return all(part.function_call is None or part.function_call.name in CACHEABLE_CALLS for part in parts)
+
+
+class ResponseCache:
+    """SQLite-backed TTL/LRU cache of model responses, used as model callbacks."""
+
+    def __init__(self, path: typing.Union[str, Path], ttl: float = 86400, max_entries: int = 5000,
+                 enabled: bool = True):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # (invocation id, agent) -> (key, fingerprint) of the model call in flight
+        self._pending: dict[tuple[str, str], tuple[str, str]] = {}
+        self._fingerprint: typing.Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # Called with the lock held
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _invalidate_if_changed(self, connection: sqlite3.Connection, fingerprint: str):
+        # Entries of other workers may still carry an older fingerprint, so compare with the stored ones too
+        if fingerprint != self._fingerprint:
+            deleted = connection.execute("DELETE FROM responses WHERE fingerprint != ?", (fingerprint,)).rowcount
+            if deleted:
+                self.invalidations += 1
+            self._fingerprint = fingerprint
+
+    def get(self, key: str, fingerprint: str) -> typing.Optional[LlmResponse]:
+        """The stored response for a request, if it is fresh and the documents are unchanged."""
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            self._invalidate_if_changed(connection, fingerprint)
+            row = connection.execute(
+                "SELECT response FROM responses WHERE key = ? AND fingerprint = ? AND created > ?",
+                (key, fingerprint, now - self.ttl),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            connection.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return LlmResponse.model_validate_json(row[0])
+
+    def put(self, key: str, agent_name: str, fingerprint: str, llm_response: LlmResponse):
+        """Stores a response, evicting expired and least recently used entries."""
+        now = time.time()
+        data = llm_response.model_dump_json(exclude_none=True)
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, agent, fingerprint, response, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, agent_name, fingerprint, data, now, now),
+            )
+            connection.execute("DELETE FROM responses WHERE created <= ?", (now - self.ttl,))
+            connection.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self.stores += 1
+
+    def clear(self) -> int:
+        """Deletes every entry; returns how many there were."""
+        with self._lock:
+            return self._connect().execute("DELETE FROM responses").rowcount
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "stores": self.stores,
+                "invalidations": self.invalidations,
+            }
+
+    def before_model_callback(self, callback_context, llm_request) -> typing.Optional[LlmResponse]:
+        """Answers a model call from the cache, or remembers its key to store the response."""
+        if not self.enabled:
+            return None
+        key = request_key(callback_context.agent_name, llm_request)
+        fingerprint = documents_fingerprint()
+        cached = self.get(key, fingerprint)
+        if cached is not None:
+            cached.custom_metadata = {**(cached.custom_metadata or {}), "response_cache": "hit"}
+            return cached
+        if len(self._pending) > 1024:
+            # Calls that failed are never popped
+            self._pending.clear()
+        self._pending[(callback_context.invocation_id, callback_context.agent_name)] = (key, fingerprint)
+        return None
+
+    def after_model_callback(self, callback_context, llm_response) -> typing.Optional[LlmResponse]:
+        """Stores the final response of a call that missed the cache."""
+        if llm_response.partial:
+            return None
+        pending = self._pending.pop((callback_context.invocation_id, callback_context.agent_name), None)
+        if pending is not None and is_cacheable(llm_response):
+            key, fingerprint = pending
+            self.put(key, callback_context.agent_name, fingerprint, llm_response)
+        return None
+
+
+# Used by every PooledAgent (agent_factory.py)
+response_cache = ResponseCache(RESPONSE_CACHE_FILE, RESPONSE_CACHE_TTL, RESPONSE_CACHE_MAX_ENTRIES,
+                               RESPONSE_CACHE_ENABLED)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m test_agents cache",
+                                     description="Inspect or clear the LLM response cache.")
+    parser.add_argument("command", choices=("stats", "clear"))
+    args = parser.parse_args(argv)
+    if args.command == "stats":
+        print(json.dumps({"file": str(response_cache.path), **response_cache.stats()}))
+    else:
+        print(f"Removed {response_cache.clear()} cached responses from {response_cache.path}")
+    return 0
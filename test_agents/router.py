@@ -0,0 +1,435 @@
+"""Local fast-path router in front of the GovernanceOrchestrator.
+
+The root agent's only job is to pick one of the five context orchestrators,
+which costs a full LLM call even for obvious requests ("mark task 12 done").
+``ContextRouter`` classifies the user's message locally first:
+
+1. regex rules anchored to explicit intent phrases; a request matching the
+   rules of exactly one context is routed there (``RULE_EXAMPLES`` lists the
+   phrases they must and must not route, ``router check`` verifies them),
+2. otherwise, if a model file exists, a linear (softmax) classifier on hashed
+   word unigrams and bigrams; its top context is used when its probability is
+   at least ``ROUTER_MIN_CONFIDENCE`` and ``ROUTER_MIN_MARGIN`` above the
+   next context's.
+
+A routed request never reaches the LLM: the root's ``before_model_callback``
+answers with the ``transfer_to_agent`` call the LLM would have made. Anything
+uncertain falls through to the LLM router unchanged. ``RouterMetrics`` counts
+hits and fallbacks and estimates the latency saved from the measured duration
+of the LLM routing calls.
+
+Train or try the classifier (from the repository root):
+    python -m test_agents router train examples.jsonl    # {"text": ..., "context": "Execution"} per line
+    python -m test_agents router route "mark task 12 as done"
+    python -m test_agents router check
+
+The router is off unless ``ROUTER_ENABLED`` is set.
+"""
+import argparse
+import json
+import re
+import threading
+import time
+import typing
+import zlib
+from pathlib import Path
+
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from .config import ROUTER_ENABLED, ROUTER_MIN_CONFIDENCE, ROUTER_MIN_MARGIN, ROUTER_MODEL_FILE
+from .tools.text_utils import tokenize
+
+# Governance context -> the orchestrator handling it
+CONTEXT_AGENTS = {
+    "Planning": "PlanningOrchestrator",
+    "Execution": "ExecutionOrchestrator",
+    "Evaluation": "EvaluationOrchestrator",
+    "Reflection": "ReflectionOrchestrator",
+    "Resolution": "ResolutionOrchestrator",
+}
+
+# Anchored to explicit intent phrases ("mark task 12 as done", "we have a
+# conflict", "evaluate ..."), not to single topic words: "calendar conflict" or
+# "how well does X work" must not be routed. A request matching the rules of
+# one context is routed there; ambiguous phrasings are left to the classifier
+# or the LLM. RULE_EXAMPLES below pins the intended behaviour.
+_LEAD = r"^(?:(?:please|so|ok(?:ay)?|now|let's|can you|could you|help (?:me|us)(?: to)?)[\s,]+)*"
+_RULES: dict[str, list[str]] = {
+    "Planning": [
+        _LEAD + r"(?:create|draft|make|build|write|prepare)\s+(?:a|an|the|our)\b.{0,30}\bplan\b",
+        _LEAD + r"(?:do|run|start)\s+(?:the|our)\s+weekly review\b",
+        _LEAD + r"plan\s+(?:the|our)\s+(?:next|coming)\s+(?:week|sprint|month|quarter)\b",
+        _LEAD + r"(?:log|record|analy[sz]e|process|write up)\s+(?:the|this|our|today's|yesterday's)\s+meeting\b",
+        r"\bhere (?:are|is) the meeting (?:transcript|notes)\b",
+    ],
+    "Execution": [
+        r"\bmark\b(?:\s+\S+){0,6}?\s+as\s+(?:done|complete|completed|finished|closed)\b",
+        r"\btask\s+#?\d+\s+is\s+(?:now\s+)?(?:done|complete|completed|finished)\b",
+        r"^(?:status|progress)\s+update\b",
+        _LEAD + r"(?:give me|post|share)\s+a\s+(?:status|progress)\s+update\b",
+        r"\bwhat(?:'s|\s+is)\s+the\s+status\s+of\b.{0,40}\btasks?\b",
+        _LEAD + r"log\s+\d+(?:\.\d+)?\s+hours?\b",
+    ],
+    "Evaluation": [
+        _LEAD + r"(?:evaluate|assess)\b",
+        r"\b(?:is|was|are|were)\b.{0,40}\baligned with our values\b",
+        r"^how\s+(?:well|effective(?:ly)?)\s+(?:did|was|were)\b",
+    ],
+    "Reflection": [
+        _LEAD + r"reflect\s+on\b",
+        r"\blessons?\s+learn(?:ed|t)\b",
+        _LEAD + r"(?:run|do|hold|start)\s+(?:a|the|our)\s+retro(?:spective)?\b",
+        r"^how\s+is\s+(?:the\s+|our\s+)?team(?:'s)?\s+(?:morale|mood|sentiment)\b",
+    ],
+    "Resolution": [
+        r"\b(?:we|they|philipp and guillaume|guillaume and philipp)\s+(?:disagree|can't agree|cannot agree|don't agree)\b",
+        r"\b(?:we|they)\s+have\s+a\s+(?:conflict|disagreement|dispute)\b",
+        r"\bhelp\s+us\s+(?:decide|choose)\s+between\b",
+        _LEAD + r"formali[sz]e\s+the\s+(?:agreement|resolution|decision)\b",
+        _LEAD + r"(?:mediate|resolve)\s+(?:the|our|this)\s+(?:conflict|disagreement|dispute)\b",
+    ],
+}
+_COMPILED_RULES = {
+    context: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    for context, patterns in _RULES.items()
+}
+
+# (request, the context the rules must route it to, or None if they must not route it)
+RULE_EXAMPLES: tuple[tuple[str, typing.Optional[str]], ...] = (
+    ("Mark task 12 as done", "Execution"),
+    ("Please mark the budget task as completed", "Execution"),
+    ("task 7 is finished, please update it", "Execution"),
+    ("Give me a status update on the website redesign", "Execution"),
+    ("Progress update: the API migration is 80% through", "Execution"),
+    ("What's the status of Guillaume's tasks?", "Execution"),
+    ("Log 3 hours of work on the budget review", "Execution"),
+    ("Draft a plan for the Q3 launch", "Planning"),
+    ("Let's do the weekly review", "Planning"),
+    ("Plan the next sprint for Philipp and Guillaume", "Planning"),
+    ("Log the meeting from 2026-10-01", "Planning"),
+    ("Here are the meeting notes from yesterday's sync, extract the tasks", "Planning"),
+    ("Evaluate whether the pilot met its goals", "Evaluation"),
+    ("Can you assess the outcome of the hiring milestone?", "Evaluation"),
+    ("Is our pricing decision aligned with our values?", "Evaluation"),
+    ("How effective was Monday's meeting?", "Evaluation"),
+    ("Let's reflect on how the last month went", "Reflection"),
+    ("What lessons learned should we capture from phase one?", "Reflection"),
+    ("Run a retrospective on the release", "Reflection"),
+    ("How is team morale these days?", "Reflection"),
+    ("Philipp and Guillaume disagree about the budget", "Resolution"),
+    ("We have a conflict over who owns the sales pipeline", "Resolution"),
+    ("Help us decide between option A and option B for hosting", "Resolution"),
+    ("Formalize the agreement we reached on equity", "Resolution"),
+    ("We can't agree on the hiring priority, mediate please", "Resolution"),
+    # Topic words without the intent
+    ("Add a calendar conflict check to the booking task", None),
+    ("Let's resolve the merge conflict in the repository", None),
+    ("How well does the new CRM integrate with email?", None),
+    ("Draft an assessment template for new hires", None),
+    ("Reflect the new prices in the task list", None),
+    ("Mark the meeting on my calendar", None),
+    ("What's the status quo of the partnership agreement?", None),
+    ("Summarize our decision making options in the agreement", None),
+    ("Update the team mood board description", None),
+    ("Evaluation criteria for the pilot are in the agreement, read them", None),
+    # Several intents: left to the classifier or the LLM
+    ("Mark task 3 as done; what lessons learned should we keep?", None),
+    # No intent
+    ("Hello!", None),
+    ("Can you help me?", None),
+    ("What can this system do?", None),
+    ("Thanks, that's all for now", None),
+)
+
+
+def rule_context(text: str) -> typing.Optional[str]:
+    """The context whose rules, and only whose rules, match the request (None otherwise)."""
+    matched = [context for context, rules in _COMPILED_RULES.items() if any(rule.search(text) for rule in rules)]
+    return matched[0] if len(matched) == 1 else None
+
+
+def check_rules(examples: typing.Iterable[tuple[str, typing.Optional[str]]] = RULE_EXAMPLES) -> list[dict]:
+    """The examples the rules route differently than expected (empty if they all pass)."""
+    return [{"text": text, "expected": expected, "routed": routed}
+            for text, expected in examples if (routed := rule_context(text)) != expected]
+
+# Hash buckets of the classifier's features
+DIMENSIONS = 2 ** 12
+
+
+class RouteDecision(typing.NamedTuple):
+    """Outcome of classifying one request."""
+    context: typing.Optional[str]  # None: leave it to the LLM router
+    confidence: float
+    source: str  # "rule", "model" or "none"
+    seconds: float
+
+    @property
+    def agent_name(self) -> typing.Optional[str]:
+        return CONTEXT_AGENTS.get(self.context) if self.context else None
+
+
+def _features(text: str) -> dict[int, float]:
+    """Hashed unigram + bigram counts (crc32, stable across processes)."""
+    tokens = tokenize(text)
+    counts: dict[int, float] = {}
+    for gram in tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]:
+        bucket = zlib.crc32(gram.encode('utf-8')) % DIMENSIONS
+        counts[bucket] = counts.get(bucket, 0.0) + 1.0
+    return counts
+
+
+class LinearRouterModel:
+    """Softmax regression over hashed n-grams: ``weights`` is (contexts x DIMENSIONS)."""
+
+    def __init__(self, contexts: list[str], weights, bias):
+        self.contexts = contexts
+        self.weights = weights
+        self.bias = bias
+
+    def rank(self, text: str) -> list[tuple[str, float]]:
+        """Returns every context with its probability, most likely first."""
+        import numpy as np
+
+        features = _features(text)
+        if not features:
+            return [(context, 0.0) for context in self.contexts]
+        indices = np.fromiter(features.keys(), dtype=np.int64, count=len(features))
+        values = np.log1p(np.fromiter(features.values(), dtype=np.float32, count=len(features)))
+        logits = self.weights[:, indices] @ values + self.bias
+        probabilities = np.exp(logits - logits.max())
+        probabilities /= probabilities.sum()
+        return sorted(zip(self.contexts, map(float, probabilities)), key=lambda item: item[1], reverse=True)
+
+    def predict(self, text: str) -> tuple[str, float]:
+        """Returns the most likely context and its probability."""
+        return self.rank(text)[0]
+
+    @classmethod
+    def train(cls, examples: list[tuple[str, str]], epochs: int = 200,
+              learning_rate: float = 0.5, l2: float = 1e-4) -> "LinearRouterModel":
+        """Fits the model on ``(text, context)`` pairs with full-batch gradient descent."""
+        import numpy as np
+
+        contexts = sorted({context for _, context in examples})
+        unknown = set(contexts) - set(CONTEXT_AGENTS)
+        if unknown:
+            raise ValueError(f"Unknown contexts {sorted(unknown)}; expected one of {list(CONTEXT_AGENTS)}")
+        matrix = np.zeros((len(examples), DIMENSIONS), dtype=np.float32)
+        for row, (text, _) in enumerate(examples):
+            for bucket, count in _features(text).items():
+                matrix[row, bucket] = np.log1p(count)
+        targets = np.zeros((len(examples), len(contexts)), dtype=np.float32)
+        targets[np.arange(len(examples)), [contexts.index(context) for _, context in examples]] = 1.0
+        weights = np.zeros((len(contexts), DIMENSIONS), dtype=np.float32)
+        bias = np.zeros(len(contexts), dtype=np.float32)
+        for _ in range(epochs):
+            logits = matrix @ weights.T + bias
+            logits -= logits.max(axis=1, keepdims=True)
+            probabilities = np.exp(logits)
+            probabilities /= probabilities.sum(axis=1, keepdims=True)
+            error = (probabilities - targets) / len(examples)
+            weights -= learning_rate * (error.T @ matrix + l2 * weights)
+            bias -= learning_rate * error.sum(axis=0)
+        return cls(contexts, weights, bias)
+
+    def save(self, path: typing.Union[str, Path]):
+        import io
+        import numpy as np
+        from .tools.document_io import atomic_write_bytes
+
+        buffer = io.BytesIO()
+        np.savez(buffer, contexts=np.array(self.contexts), weights=self.weights, bias=self.bias,
+                 dimensions=np.array(DIMENSIONS))
+        atomic_write_bytes(Path(path), buffer.getvalue())
+
+    @classmethod
+    def load(cls, path: typing.Union[str, Path]) -> typing.Optional["LinearRouterModel"]:
+        """Loads a saved model; None if the file is missing or was trained for other features."""
+        import numpy as np
+
+        try:
+            with np.load(path) as data:
+                if int(data["dimensions"]) != DIMENSIONS:
+                    print(f"Ignoring router model {path}: trained with {int(data['dimensions'])} dimensions")
+                    return None
+                return cls([str(context) for context in data["contexts"]], data["weights"], data["bias"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unusable router model {path}: {e}")
+            return None
+
+
+class RouterMetrics:
+    """Thread-safe counters of the fast path (see ``stats``)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.routed: dict[str, int] = {context: 0 for context in CONTEXT_AGENTS}
+        self.routed_by: dict[str, int] = {"rule": 0, "model": 0}
+        self.fallbacks = 0
+        self.classify_seconds = 0.0
+        self.llm_calls = 0
+        self.llm_seconds = 0.0
+
+    def record_decision(self, decision: RouteDecision):
+        with self._lock:
+            self.requests += 1
+            self.classify_seconds += decision.seconds
+            if decision.context is None:
+                self.fallbacks += 1
+            else:
+                self.routed[decision.context] += 1
+                self.routed_by[decision.source] += 1
+
+    def record_llm_call(self, seconds: float):
+        with self._lock:
+            self.llm_calls += 1
+            self.llm_seconds += seconds
+
+    def stats(self) -> dict:
+        """Hit rate, per-context counts and the estimated LLM latency saved by the fast path."""
+        with self._lock:
+            hits = self.requests - self.fallbacks
+            mean_llm = self.llm_seconds / self.llm_calls if self.llm_calls else None
+            return {
+                "requests": self.requests,
+                "fast_path": hits,
+                "fallbacks": self.fallbacks,
+                "hit_rate": round(hits / self.requests, 4) if self.requests else 0.0,
+                "routed": dict(self.routed),
+                "routed_by": dict(self.routed_by),
+                "mean_classify_ms": round(self.classify_seconds / self.requests * 1000, 3) if self.requests else 0.0,
+                "mean_llm_route_ms": round(mean_llm * 1000, 1) if mean_llm is not None else None,
+                # Unknown until one LLM routing call has been timed
+                "latency_saved_s": round(hits * mean_llm - self.classify_seconds, 3) if mean_llm is not None else None,
+            }
+
+
+class ContextRouter:
+    """Rules, then the optional classifier; see the module docstring."""
+
+    def __init__(self, model_file: typing.Optional[typing.Union[str, Path]] = None,
+                 min_confidence: float = 0.85, enabled: bool = True, min_margin: float = 0.3):
+        self.model_file = Path(model_file) if model_file else None
+        self.min_confidence = min_confidence
+        self.min_margin = min_margin
+        self.enabled = enabled
+        self.metrics = RouterMetrics()
+        self._model: typing.Optional[LinearRouterModel] = None
+        self._model_loaded = False
+        self._lock = threading.Lock()
+        # (invocation id, agent) -> start of an LLM routing call, for the metrics
+        self._llm_started: dict[tuple[str, str], float] = {}
+
+    @property
+    def model(self) -> typing.Optional[LinearRouterModel]:
+        """The classifier, loaded on first use (None without a model file)."""
+        if not self._model_loaded:
+            with self._lock:
+                if not self._model_loaded:
+                    self._model = LinearRouterModel.load(self.model_file) if self.model_file else None
+                    self._model_loaded = True
+        return self._model
+
+    def classify(self, text: str) -> RouteDecision:
+        """Decides the context of a request (``context`` None if not confident)."""
+        started = time.perf_counter()
+        matched = [context for context, rules in _COMPILED_RULES.items() if any(rule.search(text) for rule in rules)]
+        if len(matched) == 1:
+            return RouteDecision(matched[0], 1.0, "rule", time.perf_counter() - started)
+        model = self.model
+        if model is not None:
+            ranked = model.rank(text)
+            (context, probability), runner_up = ranked[0], (ranked[1][1] if len(ranked) > 1 else 0.0)
+            # Confident, clearly ahead of the next context, and (if rules matched several contexts) one of those
+            if (probability >= self.min_confidence and probability - runner_up >= self.min_margin
+                    and (not matched or context in matched)):
+                return RouteDecision(context, round(probability, 4), "model", time.perf_counter() - started)
+        return RouteDecision(None, 0.0, "none", time.perf_counter() - started)
+
+    def before_model_callback(self, callback_context, llm_request) -> typing.Optional[LlmResponse]:
+        """Answers the root's routing call locally when the request is unambiguous."""
+        if not self.enabled:
+            return None
+        text = _pending_user_text(callback_context, llm_request)
+        if text is None:
+            return None
+        decision = self.classify(text)
+        self.metrics.record_decision(decision)
+        if decision.agent_name is None:
+            if len(self._llm_started) > 1024:
+                # Calls that failed are never popped
+                self._llm_started.clear()
+            self._llm_started[(callback_context.invocation_id, callback_context.agent_name)] = time.perf_counter()
+            return None
+        return LlmResponse(content=types.Content(role="model", parts=[
+            types.Part(function_call=types.FunctionCall(
+                name="transfer_to_agent", args={"agent_name": decision.agent_name},
+            )),
+        ]))
+
+    def after_model_callback(self, callback_context, llm_response) -> typing.Optional[LlmResponse]:
+        """Times the LLM routing calls the fast path did not answer."""
+        if not llm_response.partial:
+            started = self._llm_started.pop((callback_context.invocation_id, callback_context.agent_name), None)
+            if started is not None:
+                self.metrics.record_llm_call(time.perf_counter() - started)
+        return None
+
+
+def _pending_user_text(callback_context, llm_request) -> typing.Optional[str]:
+    """The user's message, if it is what the model is about to answer.
+
+    Not when control came back to the root later in the invocation (the
+    conversation then continues past the user's message).
+    """
+    user_content = callback_context.user_content
+    if not user_content or not llm_request.contents:
+        return None
+    last = llm_request.contents[-1]
+    if last.role != "user" or any(part.function_response for part in last.parts or []):
+        return None
+    text = "".join(part.text or "" for part in user_content.parts or [])
+    last_text = "".join(part.text or "" for part in last.parts or [])
+    return text if text.strip() and text == last_text else None
+
+
+# Used by the root agent (agent.py)
+context_router = ContextRouter(ROUTER_MODEL_FILE, ROUTER_MIN_CONFIDENCE, ROUTER_ENABLED, ROUTER_MIN_MARGIN)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m test_agents router",
+                                     description="Train or try the local context router.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    train = commands.add_parser("train", help="Fit the classifier on a JSONL file of {text, context}")
+    train.add_argument("examples")
+    train.add_argument("--output", default=ROUTER_MODEL_FILE)
+    train.add_argument("--epochs", type=int, default=200)
+    route = commands.add_parser("route", help="Show how a request would be routed")
+    route.add_argument("text")
+    commands.add_parser("check", help="Check the rules against RULE_EXAMPLES")
+    args = parser.parse_args(argv)
+
+    if args.command == "train":
+        with open(args.examples, 'r', encoding='utf-8') as f:
+            examples = [(row["text"], row["context"]) for row in (json.loads(line) for line in f if line.strip())]
+        model = LinearRouterModel.train(examples, epochs=args.epochs)
+        correct = sum(model.predict(text)[0] == context for text, context in examples)
+        model.save(args.output)
+        print(f"Trained on {len(examples)} examples ({correct / len(examples):.1%} training accuracy); "
+              f"saved to {args.output}")
+    elif args.command == "check":
+        failures = check_rules()
+        for failure in failures:
+            print(json.dumps(failure))
+        print(f"{len(RULE_EXAMPLES) - len(failures)}/{len(RULE_EXAMPLES)} rule examples routed as expected")
+        return 1 if failures else 0
+    else:
+        decision = context_router.classify(args.text)
+        print(json.dumps({**decision._asdict(), "agent_name": decision.agent_name}))
+    return 0
@@ -0,0 +1,155 @@
+"""Deterministic local stand-in for the LLM, for offline runs and load tests.
+
+With ``LLM_MODEL=stub`` every agent gets a ``StubLlm`` (see ``llm.get_model``)
+that answers from rules instead of calling a provider, so the full path
+``root_agent`` -> context orchestrator -> specialist -> tool runs without
+network access or API keys:
+
+* the root transfers to the context of the user's message (the context
+  router's rules, else the intent's default context),
+* an orchestrator transfers to the specialist of the intent,
+* a specialist calls the intent's tool, and answers with a short summary once
+  the tool result is back.
+
+Intents are recognised by keywords (tasks, adding or completing a task,
+meetings, values); anything else gets a plain text answer from whichever
+agent receives it. Each call waits ``STUB_LLM_LATENCY`` seconds first, to
+simulate the provider, and reports token counts estimated from the request
+size (4 characters per token).
+
+    LLM_MODEL=stub adk web
+"""
+import asyncio
+import datetime
+import re
+import typing
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from .llm import STUB_MODEL_NAME
+from .router import CONTEXT_AGENTS, context_router
+
+# Task list used by the task intents
+STUB_USER = "Philipp"
+
+
+class Intent(typing.NamedTuple):
+    name: str
+    pattern: re.Pattern
+    # Context used when the router's rules do not decide
+    context: str
+    specialist: str
+    tool: str
+    args: typing.Callable[[str, re.Match], dict]
+
+
+def _task_args(text: str, match: re.Match) -> dict:
+    deadline = (datetime.date.today() + datetime.timedelta(days=7)).isoformat()
+    return {"task_title": text[:60], "assignee": STUB_USER, "deadline": deadline, "description": text,
+            "user_name": STUB_USER}
+
+
+INTENTS = (
+    Intent("complete_task", re.compile(r"\btask\s+#?(\d+)\b", re.IGNORECASE), "Execution", "BusinessAgent",
+           "edit_task", lambda text, match: {"task_id": int(match.group(1)), "action": "modify",
+                                             "user_name": STUB_USER, "updates": {"status": "Done"}}),
+    Intent("add_task", re.compile(r"\b(?:add|create|new)\b.{0,30}\btask\b", re.IGNORECASE), "Planning",
+           "BusinessAgent", "write_task", _task_args),
+    Intent("list_tasks", re.compile(r"\btasks?\b|\bto-?dos?\b", re.IGNORECASE), "Execution", "BusinessAgent",
+           "read_task_list", lambda text, match: {"user_name": STUB_USER}),
+    Intent("meetings", re.compile(r"\bmeetings?\b|\bretro", re.IGNORECASE), "Reflection", "TeamSpiritAgent",
+           "latest_meeting", lambda text, match: {}),
+    Intent("values", re.compile(r"\bvalues?\b|\bpartnership\b|\balign", re.IGNORECASE), "Evaluation",
+           "ValueSoulAgent", "find_relevant_values", lambda text, match: {"text": text}),
+)
+
+
+def _user_text(llm_request) -> str:
+    """The latest message written by the user (not a transcript of another agent)."""
+    for content in reversed(llm_request.contents):
+        if content.role != "user":
+            continue
+        text = "".join(part.text or "" for part in content.parts or [])
+        if text.strip() and not text.startswith("For context:"):
+            return text
+    return ""
+
+
+def _transfer_targets(llm_request) -> list[str]:
+    """The agents ``transfer_to_agent`` may name in this request."""
+    for tool in (llm_request.config.tools or []) if llm_request.config else []:
+        for declaration in getattr(tool, "function_declarations", None) or []:
+            if declaration.name != "transfer_to_agent":
+                continue
+            if declaration.parameters_json_schema:
+                return list(declaration.parameters_json_schema["properties"]["agent_name"].get("enum") or [])
+            if declaration.parameters and declaration.parameters.properties:
+                return list(declaration.parameters.properties["agent_name"].enum or [])
+    return []
+
+
+def _estimate_tokens(llm_request) -> int:
+    characters = len(str(llm_request.config.system_instruction or "")) if llm_request.config else 0
+    for content in llm_request.contents:
+        for part in content.parts or []:
+            characters += len(part.text or "")
+            if part.function_response is not None:
+                characters += len(str(part.function_response.response))
+    return characters // 4
+
+
+class StubLlm(BaseLlm):
+    """Rule-based model: transfers to the right agents and calls the tools of the recognised intent."""
+
+    # Seconds each call waits before answering
+    latency: float = 0.0
+
+    @classmethod
+    def supported_models(cls) -> list[str]:
+        return [STUB_MODEL_NAME]
+
+    def respond(self, llm_request) -> types.Content:
+        """The model turn for a request (deterministic)."""
+        last = llm_request.contents[-1] if llm_request.contents else None
+        results = [part.function_response for part in (last.parts or []) if part.function_response] if last else []
+        if results and results[0].name != "transfer_to_agent":
+            # The tool's result is back: summarize it
+            response = results[0].response or {}
+            return _text(f"{results[0].name}: {response.get('status', 'done')}.")
+
+        text = _user_text(llm_request)
+        intent, match = next(((intent, match) for intent in INTENTS if (match := intent.pattern.search(text))),
+                             (None, None))
+        if intent is not None and intent.tool in llm_request.tools_dict:
+            return _call(intent.tool, intent.args(text, match))
+        targets = _transfer_targets(llm_request)
+        if intent is not None and intent.specialist in targets:
+            return _call("transfer_to_agent", {"agent_name": intent.specialist})
+        if targets and set(targets) <= set(CONTEXT_AGENTS.values()):
+            # The root: its only targets are the context orchestrators
+            orchestrator = context_router.classify(text).agent_name
+            if orchestrator is None and intent is not None:
+                orchestrator = CONTEXT_AGENTS[intent.context]
+            if orchestrator in targets:
+                return _call("transfer_to_agent", {"agent_name": orchestrator})
+        return _text(f"(stub) Noted: {text[:80]}")
+
+    async def generate_content_async(self, llm_request, stream: bool = False):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        content = self.respond(llm_request)
+        prompt = _estimate_tokens(llm_request)
+        completion = sum(len(part.text or str(part.function_call.args)) for part in content.parts) // 4
+        yield LlmResponse(content=content, usage_metadata=types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=prompt, candidates_token_count=completion, total_token_count=prompt + completion,
+        ))
+
+
+def _text(text: str) -> types.Content:
+    return types.Content(role="model", parts=[types.Part(text=text)])
+
+
+def _call(name: str, args: dict) -> types.Content:
+    return types.Content(role="model", parts=[types.Part(function_call=types.FunctionCall(name=name, args=args))])
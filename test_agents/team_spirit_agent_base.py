@@ -1,36 +1,47 @@
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
 from . import tools  # Import the tools package
+from .agent_factory import AgentSpec, DEFAULT_MODEL_NAME
 
-# Define the model for this agent (consistent with others)
-AGENT_MODEL = LiteLlm(model="openai/gpt-4.1-mini")
+# Define the model for this agent (shared with the other agents)
+AGENT_MODEL = DEFAULT_MODEL_NAME
 
 # Define the BASE Team Spirit Agent definition
-# This can be used to instantiate multiple instances if needed.
-team_spirit_agent_base = Agent(
+# Use team_spirit_agent_spec.build() to instantiate it as many times as needed.
+team_spirit_agent_spec = AgentSpec(
     name="TeamSpiritAgent", # Keep the functional name
     description="Focuses on team dynamics, meeting analysis, and interpersonal aspects of collaboration",
     model=AGENT_MODEL,
-    tools=[
+    tools=(
         tools.read_meeting_log,
         tools.write_meeting_log,
+        tools.list_meetings,
+        tools.latest_meeting,
+        tools.search_meetings,
         tools.read_team_profile,
-    ],
+        tools.search_governance_documents,
+    ),
     instruction=(
         "CRITICAL RULE: Follow these instructions precisely.\n"
         "Your role is to manage information related to team interactions using specific tools.\n\n"
         "Tool Usage Rules:\n"
-        "1. `read_meeting_log`: Use this tool ONLY when you have a specific meeting date in 'YYYY-MM-DD' format.\n"
-        "   - **IF the user asks for the 'last meeting' or gives an unclear date:** DO NOT call the tool. Instead, respond ONLY with the question: 'Could you please provide the specific date of the meeting in YYYY-MM-DD format?'\n"
-        "   - **IF you have the correct date:** Call the tool with the 'meeting_date' parameter.\n"
+        "1. `read_meeting_log`: Use this tool when you have a specific meeting date in 'YYYY-MM-DD' format. Call it with the 'meeting_date' parameter.\n"
+        "   - **IF the user asks for the 'last' / 'latest' / 'most recent' meeting:** Call `latest_meeting` instead. Do NOT ask the user for the date.\n"
+        "   - **IF the user describes the meeting by period, participant or topic** (e.g., 'the meetings in March', 'the meeting where we discussed hiring'): Use `list_meetings` or `search_meetings` to find the date, then call `read_meeting_log` in your next turn.\n"
+        "   - **ONLY IF these tools find no matching meeting:** Ask 'Could you please provide the specific date of the meeting in YYYY-MM-DD format?'\n"
         "2. `write_meeting_log`: Use this tool to create/update logs. Requires 'meeting_date' (YYYY-MM-DD), 'participants' (list), and 'content'. Ask for any missing information before calling.\n"
-        "3. `read_team_profile`: Use this tool to read profiles. Requires 'member_name' ('Philipp' or 'Guillaume').\n\n"
+        "3. `list_meetings`: Lists meeting dates with participants and section headings. Optional 'start_date'/'end_date' (YYYY-MM-DD) and 'participant' filters.\n"
+        "4. `latest_meeting`: Returns the most recent meeting log in full. Takes no parameters.\n"
+        "5. `search_meetings`: Finds meetings mentioning keywords. Requires 'query'; optional 'start_date', 'end_date' and 'limit'.\n"
+        "6. `read_team_profile`: Use this tool to read profiles. Requires 'member_name' ('Philipp' or 'Guillaume').\n"
+        "7. `search_governance_documents`: Finds the most relevant passages across all documents (meeting logs, profiles, partnership documents, task lists). Requires 'query'; optional 'document_types' (e.g., ['meeting', 'profile']) and 'limit'. Prefer it over reading whole documents when only a specific topic matters.\n\n"
         "General Instructions:\n"
         "- **CRITICAL: You MUST process requests sequentially. NEVER call more than ONE tool in a single response turn.** If you need to use multiple tools (e.g., read two different profiles), call the first tool, wait for the response, then call the second tool in your *next* response turn.\n"
         "- **NEVER attempt to call `transfer_to_agent`.** You do not have permission to transfer.\n"
         "- **If you receive a request outside your scope** (e.g., evaluating against values, managing business tasks, planning, execution details not related to team dynamics), you MUST respond by stating you cannot perform that specific task and suggest the user direct the request appropriately. For example: 'I specialize in team dynamics and meeting logs. I cannot perform value evaluations. Please direct that request to the appropriate agent.' DO NOT attempt to transfer or use tools for out-of-scope requests.\n"
         "- If a tool call is successful, present the results clearly.\n"
         "- If a tool call fails, report the error message provided by the tool.\n"
-        "- If you lack necessary information for ANY tool call (especially the date for `read_meeting_log`), ask the user for clarification using the specific phrasing provided above where applicable."
+        "- If you lack necessary information for ANY tool call (e.g., the date for `read_meeting_log` when no meeting tool can find it), ask the user for clarification using the specific phrasing provided above where applicable."
     )
 )
+
+# Standalone instance of the spec
+team_spirit_agent_base = team_spirit_agent_spec.build()
@@ -1,12 +1,66 @@
 # This file makes Python treat the 'tools' directory as a package.
 # We can expose tools selectively here if needed, or import submodules directly.
 
-from .time_tools import get_current_time
-from .pirate_tools import read_pirate_code, write_pirate_code, edit_pirate_code
-from .task_tools import read_task_list, write_task, edit_task
-from .value_soul_tools import read_partnership_documents
-from .team_spirit_tools import read_meeting_log, write_meeting_log, read_team_profile # Add TeamSpirit tools
-from .human_interaction_tools import request_user_clarification, present_for_review_and_approval, ask_user_to_choose_option # Add HITL tools
+# Tools are resolved on first access (PEP 562), so importing the package (e.g.
+# for the HITL tools of the context orchestrators) does not import every tool
+# module and its indexes; `from test_agents.tools import x` works as before.
+import importlib
+
+from ..tracing import traced_tool
+
+_TOOL_MODULES = {
+    "get_current_time": ".time_tools",
+    "read_pirate_code": ".pirate_tools",
+    "write_pirate_code": ".pirate_tools",
+    "edit_pirate_code": ".pirate_tools",
+    "read_task_list": ".task_tools",
+    "query_tasks": ".task_tools",
+    "query_team_tasks": ".task_tools",
+    "write_task": ".task_tools",
+    "edit_task": ".task_tools",
+    "write_tasks_bulk": ".task_tools",
+    "edit_tasks_bulk": ".task_tools",
+    "read_partnership_documents": ".value_soul_tools",
+    "list_partnership_sections": ".value_soul_tools",
+    "read_partnership_section": ".value_soul_tools",
+    "find_relevant_values": ".value_soul_tools",
+    "read_meeting_log": ".team_spirit_tools", # TeamSpirit tools
+    "write_meeting_log": ".team_spirit_tools",
+    "list_meetings": ".team_spirit_tools",
+    "latest_meeting": ".team_spirit_tools",
+    "search_meetings": ".team_spirit_tools",
+    "read_team_profile": ".team_spirit_tools",
+    "search_governance_documents": ".search_tools",
+    "request_user_clarification": ".human_interaction_tools", # HITL tools
+    "present_for_review_and_approval": ".human_interaction_tools",
+    "ask_user_to_choose_option": ".human_interaction_tools",
+}
+
+
+# Tools that change documents (left out of steps that must only read, e.g. parallel workflow steps)
+WRITE_TOOLS = frozenset({
+    "write_pirate_code",
+    "edit_pirate_code",
+    "write_task",
+    "edit_task",
+    "write_tasks_bulk",
+    "edit_tasks_bulk",
+    "write_meeting_log",
+})
+
+
+def __getattr__(name: str):
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Tool functions record their document I/O when tracing is enabled (see tracing.py)
+    tool = traced_tool(getattr(importlib.import_module(module_name, __name__), name))
+    globals()[name] = tool  # Later lookups skip __getattr__
+    return tool
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     "get_current_time", # Note: TimeAgent is removed, but tool might still be here. Keep for now unless cleanup requested.
@@ -14,12 +68,23 @@ __all__ = [
     "write_pirate_code",
     "edit_pirate_code",
     "read_task_list",
+    "query_tasks",
+    "query_team_tasks",
     "write_task",
     "edit_task",
+    "write_tasks_bulk",
+    "edit_tasks_bulk",
     "read_partnership_documents",
+    "list_partnership_sections",
+    "read_partnership_section",
+    "find_relevant_values",
     "read_meeting_log", # Add TeamSpirit tools to __all__
     "write_meeting_log",
+    "list_meetings",
+    "latest_meeting",
+    "search_meetings",
     "read_team_profile",
+    "search_governance_documents",
     "request_user_clarification", # Add HITL tools to __all__
     "present_for_review_and_approval",
     "ask_user_to_choose_option",
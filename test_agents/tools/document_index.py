@@ -0,0 +1,295 @@
+"""BM25 full-text index over the markdown documents under ``DOCUMENTS_DIR``.
+
+Documents are split into passages (a paragraph, a list block or a single
+table row, labelled with its heading path) so a search returns a few
+relevant paragraphs instead of whole files. The index keeps an inverted
+``token -> {passage: term frequency}`` map and is updated incrementally:
+``refresh(sources)`` only re-reads documents whose signature (e.g.
+``(mtime_ns, size)``) changed since they were indexed.
+
+It is persisted to an SQLite file with one row per document and per passage,
+so a restarted process starts warm and re-indexing one document only
+rewrites that document's rows.
+"""
+import heapq
+import json
+import math
+import re
+import sqlite3
+import threading
+import typing
+from collections import Counter
+from pathlib import Path
+
+from .text_utils import iter_markdown_headings, strip_html_comments, tokenize, unique_tokens
+
+_INDEX_VERSION = 2
+# BM25 parameters (the usual defaults)
+_K1 = 1.2
+_B = 0.75
+# Paragraphs longer than this many lines are split into several passages
+_MAX_PASSAGE_LINES = 12
+_TABLE_SEPARATOR_RE = re.compile(r"^\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?$")
+
+
+class Passage(typing.NamedTuple):
+    """One searchable chunk of a document."""
+    doc_id: str
+    heading: str
+    line: int
+    text: str
+    term_counts: dict[str, int]
+    length: int
+
+    @classmethod
+    def build(cls, doc_id: str, heading: str, line: int, text: str,
+              term_counts: typing.Optional[dict[str, int]] = None) -> "Passage":
+        """Creates a passage, tokenizing its heading and text unless term counts are given."""
+        if term_counts is None:
+            term_counts = dict(Counter(tokenize(f"{heading}\n{text}")))
+        return cls(doc_id, heading, line, text, term_counts, sum(term_counts.values()))
+
+
+class DocumentSource(typing.NamedTuple):
+    """How to validate and (re)load one document."""
+    signature: typing.Any
+    load: typing.Callable[[], str]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id TEXT PRIMARY KEY,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS passages (
+    doc_id TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    heading TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    term_counts TEXT NOT NULL,
+    PRIMARY KEY (doc_id, number)
+);
+"""
+
+
+def _jsonable(value):
+    """Normalizes a signature to what it becomes after a JSON round trip (tuples -> lists)."""
+    return json.loads(json.dumps(value))
+
+
+def split_passages(content: str) -> list[tuple[str, int, str]]:
+    """Splits markdown into ``(heading path, 1-based start line, text)`` passages."""
+    passages = []
+    heading_path: list[str] = []
+    block: list[str] = []
+    block_start = 0
+    in_fence = False
+
+    def flush():
+        nonlocal block
+        text = "\n".join(block).strip()
+        if text:
+            passages.append((" > ".join(heading_path), block_start, text))
+        block = []
+
+    # Drop HTML comments (template guidance) but keep line numbers stable
+    content = strip_html_comments(content)
+    for number, line in enumerate(content.splitlines(), start=1):
+        stripped = line.strip()
+        if stripped.startswith("```") or stripped.startswith("~~~"):
+            in_fence = not in_fence
+        elif not in_fence:
+            heading = next(iter_markdown_headings([stripped]), None)
+            if heading is not None:
+                flush()
+                level, title = heading
+                heading_path = heading_path[:level - 1] + [title]
+                continue
+            if not stripped:
+                flush()
+                continue
+            if stripped.startswith("|"):
+                # Every table row (e.g. one task) is its own passage
+                flush()
+                if not _TABLE_SEPARATOR_RE.match(stripped):
+                    block, block_start = [stripped], number
+                    flush()
+                continue
+        if not block:
+            block_start = number
+        block.append(line)
+        if len(block) >= _MAX_PASSAGE_LINES and not in_fence:
+            flush()
+    flush()
+    return passages
+
+
+class DocumentSearchIndex:
+    """Persistent, incrementally updated BM25 index over a set of documents."""
+
+    def __init__(self, index_file: typing.Union[str, Path]):
+        self.index_file = Path(index_file)
+        # doc_id -> (signature, passages)
+        self._documents: dict[str, tuple[typing.Any, list[Passage]]] = {}
+        # token -> {(doc_id, passage number): term frequency}
+        self._postings: dict[str, dict[tuple[str, int], int]] = {}
+        self._passage_count = 0
+        self._total_length = 0
+        self._loaded = False
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    # --- maintenance ---
+
+    def _add_document(self, doc_id: str, signature, passages: list[Passage]):
+        self._documents[doc_id] = (signature, passages)
+        for number, passage in enumerate(passages):
+            for token, count in passage.term_counts.items():
+                self._postings.setdefault(token, {})[(doc_id, number)] = count
+            self._total_length += passage.length
+        self._passage_count += len(passages)
+
+    def _remove_document(self, doc_id: str):
+        _, passages = self._documents.pop(doc_id, (None, []))
+        for number, passage in enumerate(passages):
+            for token in passage.term_counts:
+                postings = self._postings.get(token)
+                if postings is not None:
+                    postings.pop((doc_id, number), None)
+                    if not postings:
+                        del self._postings[token]
+            self._total_length -= passage.length
+        self._passage_count -= len(passages)
+
+    def _index_document(self, doc_id: str, signature, content: str):
+        passages = [Passage.build(doc_id, heading, line, text) for heading, line, text in split_passages(content)]
+        self._add_document(doc_id, signature, passages)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Called with the lock held
+        if self._connection is None:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.index_file, timeout=30, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            if connection.execute("PRAGMA user_version").fetchone()[0] != _INDEX_VERSION:
+                connection.execute("DROP TABLE IF EXISTS documents")
+                connection.execute("DROP TABLE IF EXISTS passages")
+                connection.execute(f"PRAGMA user_version = {_INDEX_VERSION}")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _load_persisted(self):
+        try:
+            connection = self._connect()
+            signatures = connection.execute("SELECT doc_id, signature FROM documents").fetchall()
+            rows = connection.execute(
+                "SELECT doc_id, heading, line, text, term_counts FROM passages ORDER BY doc_id, number").fetchall()
+        except sqlite3.Error as e:
+            print(f"Ignoring unreadable search index {self.index_file}: {e}")
+            return
+        passages: dict[str, list[Passage]] = {}
+        for doc_id, heading, line, text, term_counts in rows:
+            try:
+                passages.setdefault(doc_id, []).append(Passage.build(doc_id, heading, line, text,
+                                                                     json.loads(term_counts)))
+            except ValueError as e:
+                print(f"Skipping malformed search index entry for {doc_id}: {e}")
+        for doc_id, signature in signatures:
+            try:
+                self._add_document(doc_id, json.loads(signature), passages.get(doc_id, []))
+            except ValueError as e:
+                print(f"Skipping malformed search index entry for {doc_id}: {e}")
+
+    def _persist(self, changed: typing.Iterable[str]):
+        """Writes the rows of the given documents (deleting those no longer indexed)."""
+        deletes, documents, passages = [], [], []
+        for doc_id in changed:
+            deletes.append((doc_id,))
+            indexed = self._documents.get(doc_id)
+            if indexed is None:
+                continue
+            signature, doc_passages = indexed
+            documents.append((doc_id, json.dumps(signature)))
+            passages.extend((doc_id, number, p.heading, p.line, p.text, json.dumps(p.term_counts, ensure_ascii=False))
+                            for number, p in enumerate(doc_passages))
+        try:
+            connection = self._connect()
+            connection.execute("BEGIN")
+            try:
+                connection.executemany("DELETE FROM documents WHERE doc_id = ?", deletes)
+                connection.executemany("DELETE FROM passages WHERE doc_id = ?", deletes)
+                connection.executemany("INSERT INTO documents VALUES (?, ?)", documents)
+                connection.executemany("INSERT INTO passages VALUES (?, ?, ?, ?, ?, ?)", passages)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            # The index is only a cache; the documents are the source of truth
+            print(f"Warning: Could not save search index {self.index_file}: {e}")
+
+    def refresh(self, sources: dict[str, DocumentSource]) -> bool:
+        """Re-indexes the documents whose signature changed and drops the ones that disappeared.
+
+        Returns:
+            bool: True if the index changed.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load_persisted()
+                self._loaded = True
+            changed = [doc_id for doc_id in self._documents if doc_id not in sources]
+            for doc_id in changed:
+                self._remove_document(doc_id)
+            for doc_id, source in sources.items():
+                signature = _jsonable(source.signature)
+                indexed = self._documents.get(doc_id)
+                if indexed is not None and indexed[0] == signature:
+                    continue
+                try:
+                    content = source.load()
+                except FileNotFoundError:
+                    # Removed between listing and reading; picked up on the next refresh
+                    continue
+                self._remove_document(doc_id)
+                self._index_document(doc_id, signature, content)
+                changed.append(doc_id)
+            if changed:
+                self._persist(changed)
+            return bool(changed)
+
+    # --- queries ---
+
+    def search(self, query: str, limit: int = 5,
+               doc_filter: typing.Optional[typing.Callable[[str], bool]] = None) -> list[tuple[Passage, float, list[str]]]:
+        """Ranks passages against the query with BM25.
+
+        Returns:
+            list: ``(passage, score, matched_terms)`` tuples, best match first.
+        """
+        terms = unique_tokens(query)
+        with self._lock:
+            if not self._passage_count:
+                return []
+            average_length = self._total_length / self._passage_count
+            scores: dict[tuple[str, int], float] = {}
+            matched: dict[tuple[str, int], list[str]] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1 + (self._passage_count - df + 0.5) / (df + 0.5))
+                for key, tf in postings.items():
+                    if doc_filter is not None and not doc_filter(key[0]):
+                        continue
+                    length = self._documents[key[0]][1][key[1]].length
+                    norm = tf + _K1 * (1 - _B + _B * length / average_length)
+                    scores[key] = scores.get(key, 0.0) + idf * tf * (_K1 + 1) / norm
+                    matched.setdefault(key, []).append(term)
+            ranked = heapq.nlargest(limit, scores, key=scores.__getitem__)
+            return [(self._documents[doc_id][1][number], round(scores[(doc_id, number)], 4), matched[(doc_id, number)])
+                    for doc_id, number in ranked]
@@ -0,0 +1,207 @@
+"""Shared write layer for the document tools.
+
+Every tool that modifies a document under ``DOCUMENTS_DIR`` goes through this
+module so that concurrent ADK sessions (threads) and ``adk web`` workers
+(processes) never lose updates or observe half-written files:
+
+* ``file_lock(path)`` serializes read-modify-write cycles on one document using
+  a per-path thread lock plus an advisory ``fcntl.flock`` on a sidecar
+  ``<name>.lock`` file. Locks are per document, so writers to different
+  files never wait on each other.
+* ``atomic_write_text(path, content)`` (and ``atomic_write_bytes``) writes to
+  a temporary file in the same directory and renames it over the target, so
+  readers see either the old or the new content, never a truncated file.
+* ``append_text(path, text)`` appends and fsyncs in a single write.
+
+Every write to a document (not to hidden files such as the indexes) also
+appends a byte to ``DOCUMENTS_WRITE_GENERATION_FILE``; ``write_generation()``
+changes with it, in every process, which is how the response cache notices
+changed documents without walking the documents directory.
+
+On platforms without ``fcntl`` (Windows) the locks only cover threads within
+one process.
+"""
+import os
+import tempfile
+import threading
+import typing
+from contextlib import contextmanager
+from pathlib import Path
+
+from ..config import DOCUMENTS_WRITE_GENERATION_FILE
+from ..tracing import record_io
+
+try:
+    import fcntl
+except ImportError: # Not available on Windows
+    fcntl = None
+
+LOCK_SUFFIX = ".lock"
+# The generation file is truncated once it reaches this size
+WRITE_GENERATION_MAX_BYTES = 4096
+
+
+class _DocumentLock:
+    """Re-entrant lock for one document, shared by all threads in the process."""
+
+    def __init__(self, lock_path: Path):
+        self.lock_path = lock_path
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        self.fd: typing.Optional[int] = None
+
+    def acquire(self):
+        self.thread_lock.acquire()
+        if self.depth == 0 and fcntl is not None:
+            try:
+                self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                except BaseException:
+                    os.close(fd)
+                    raise
+                self.fd = fd
+            except BaseException:
+                self.thread_lock.release()
+                raise
+        self.depth += 1
+
+    def release(self):
+        self.depth -= 1
+        if self.depth == 0 and self.fd is not None:
+            try:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+            finally:
+                os.close(self.fd)
+                self.fd = None
+        self.thread_lock.release()
+
+
+_locks: dict[str, _DocumentLock] = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(path: Path) -> _DocumentLock:
+    lock_path = path.with_name(path.name + LOCK_SUFFIX)
+    key = os.path.abspath(lock_path)
+    with _locks_guard:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = _DocumentLock(lock_path)
+        return lock
+
+
+@contextmanager
+def file_lock(path: typing.Union[str, Path]):
+    """Holds an exclusive lock on one document for a read-modify-write cycle.
+
+    The lock is re-entrant within a thread, and excludes other threads and
+    (where ``fcntl`` is available) other processes locking the same document.
+    """
+    lock = _lock_for(Path(path))
+    lock.acquire()
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def _fsync_directory(directory: Path):
+    """Persists a rename in ``directory`` (no-op where directories cannot be opened)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_generation() -> tuple[int, int, int]:
+    """Changes whenever a document is written through this module, by any process.
+
+    Returns:
+        tuple: Inode, size and mtime of the generation file ((0, 0, 0) before the first write).
+    """
+    try:
+        st = os.stat(DOCUMENTS_WRITE_GENERATION_FILE)
+    except FileNotFoundError:
+        return (0, 0, 0)
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _bump_write_generation(path: Path):
+    if path.name.startswith("."):
+        # Indexes, counters and other derived files
+        return
+    generation_path = Path(DOCUMENTS_WRITE_GENERATION_FILE)
+    generation_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(generation_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if os.fstat(fd).st_size >= WRITE_GENERATION_MAX_BYTES:
+            os.ftruncate(fd, 0)
+        os.write(fd, b".")
+    finally:
+        os.close(fd)
+
+
+def atomic_write_text(path: typing.Union[str, Path], content: str):
+    """Replaces a document's content atomically (write to temp file, fsync, rename)."""
+    _atomic_write(path, content)
+
+
+def atomic_write_bytes(path: typing.Union[str, Path], data: bytes):
+    """Binary counterpart of ``atomic_write_text`` (e.g. for index files)."""
+    _atomic_write(path, data)
+
+
+def _atomic_write(path: typing.Union[str, Path], data: typing.Union[str, bytes]):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        # mkstemp creates the file as 0600; keep the document's permissions
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)
+        else:
+            os.chmod(tmp_name, mode)
+        text = isinstance(data, str)
+        with os.fdopen(fd, 'w' if text else 'wb', encoding='utf-8' if text else None) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            size = os.fstat(f.fileno()).st_size
+        os.replace(tmp_name, path)
+        record_io(bytes_written=size)
+    except BaseException:
+        try:
+            os.remove(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_directory(path.parent)
+    _bump_write_generation(path)
+
+
+def append_text(path: typing.Union[str, Path], text: str) -> int:
+    """Appends text to a document in a single write and fsyncs it.
+
+    Returns:
+        int: The size of the document in bytes after the append.
+    """
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+        record_io(bytes_written=len(text.encode('utf-8')))
+        size = f.tell()
+    _bump_write_generation(Path(path))
+    return size
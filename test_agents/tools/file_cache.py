@@ -0,0 +1,109 @@
+"""Process-wide read-through cache for document contents.
+
+The read tools are called many times per session for documents that rarely
+change. ``read_text(path)`` serves a document from memory as long as its
+``(st_ino, st_mtime_ns, st_size)`` is unchanged, so a repeated read costs a
+single ``stat()``. The inode is part of the key because every tool write goes
+through ``document_io.atomic_write_text`` (a rename), which changes it even
+when mtime granularity is coarse. The cache is a bounded LRU (by entry count
+and total characters) and keeps hit/miss counters.
+"""
+import os
+import stat
+import threading
+import typing
+from collections import OrderedDict
+from pathlib import Path
+
+from ..config import FILE_CACHE_MAX_ENTRIES, FILE_CACHE_MAX_CHARS
+from ..tracing import record_io
+
+
+class FileContentCache:
+    """Bounded LRU of file contents, validated against the file's stat on every read."""
+
+    def __init__(self, max_entries: int = 128, max_chars: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self._entries: "OrderedDict[str, tuple[tuple[int, int, int], str]]" = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._chars > self.max_chars):
+            _, (_, content) = self._entries.popitem(last=False)
+            self._chars -= len(content)
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._chars -= len(entry[1])
+
+    def read_text(self, file_path: typing.Union[str, Path]) -> str:
+        """Returns a file's content (UTF-8), re-reading it only if it changed.
+
+        Raises:
+            FileNotFoundError: If the file does not exist (or is not a regular file).
+        """
+        key = os.path.abspath(file_path)
+        try:
+            st = os.stat(key)
+        except FileNotFoundError:
+            with self._lock:
+                self._drop(key)
+            raise
+        if not stat.S_ISREG(st.st_mode):
+            raise FileNotFoundError(f"Not a file: '{file_path}'")
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                record_io(cache_hit=True)
+                return entry[1]
+            self.misses += 1
+        with open(key, 'r', encoding='utf-8') as f:
+            # Key the content by the stat of what was actually read
+            st = os.fstat(f.fileno())
+            content = f.read()
+        record_io(bytes_read=st.st_size)
+        with self._lock:
+            self._drop(key)
+            if len(content) <= self.max_chars:
+                self._entries[key] = ((st.st_ino, st.st_mtime_ns, st.st_size), content)
+                self._chars += len(content)
+                self._evict()
+        return content
+
+    def invalidate(self, file_path: typing.Optional[typing.Union[str, Path]] = None):
+        """Drops one file (or, without a path, every file) from the cache."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                self._chars = 0
+            else:
+                self._drop(os.path.abspath(file_path))
+
+    def stats(self) -> dict:
+        """Returns the hit/miss counters and the current size of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "chars": self._chars,
+            }
+
+
+# Shared by all read tools
+file_cache = FileContentCache(FILE_CACHE_MAX_ENTRIES, FILE_CACHE_MAX_CHARS)
+
+
+def read_text(file_path: typing.Union[str, Path]) -> str:
+    """Reads a document through the shared cache (see ``FileContentCache.read_text``)."""
+    return file_cache.read_text(file_path)
@@ -1,19 +1,39 @@
 # Human-in-the-Loop (HITL) Tools
-# Implementations will be added in Task 1.3
+#
+# Each tool registers a pending request in the HITL store (see hitl.py) and
+# returns immediately with status 'pending'. They are long-running tools: ADK
+# pauses the session until the answer arrives as the call's function response
+# (from adk web, or from a responder delivering `python -m test_agents hitl
+# answer`), while the server keeps serving other sessions.
 
-from typing import Dict, Any
 from typing import Dict, Any, Optional
+
+from google.adk.tools.long_running_tool import LongRunningFunctionTool
+from google.adk.tools.tool_context import ToolContext
+
+from ..hitl import hitl_store
 from ..models import ToolResult
-import time
 
-def request_user_clarification(question: str, context_info: Optional[Dict[str, Any]] = None) -> ToolResult:
-    """Pauses execution and asks the user a specific question for clarification.
 
-    This tool is intended to interact with an external system (e.g., a web UI)
-    to present a question and optional context to the user, wait for their
-    textual response, and return it.
+def _pending(tool_context: ToolContext, tool: str, payload: Dict[str, Any], waiting_for: str) -> dict:
+    try:
+        request = hitl_store.register(tool_context, tool, payload)
+    except Exception as e:
+        return ToolResult(status="error", error_message=f"Failed to register the request for the user: {e}").model_dump()
+    return ToolResult(status="pending", result={
+        "request_id": request.request_id,
+        "message": f"Waiting for the user's {waiting_for}. Do not call the tool again; the answer will arrive as "
+                   "this tool's response.",
+    }).model_dump()
+
+
+def request_user_clarification(question: str, tool_context: ToolContext,
+                               context_info: Optional[Dict[str, Any]] = None) -> dict:
+    """Asks the user a specific question for clarification.
 
-    (Placeholder implementation uses print/input for simulation).
+    The question is shown to the user (e.g., in the web UI or with
+    `python -m test_agents hitl list`); the conversation pauses until they
+    answer.
 
     Args:
         question: The specific question to ask the user.
@@ -21,33 +41,22 @@ def request_user_clarification(question: str, context_info: Optional[Dict[str, A
                       alongside the question (optional).
 
     Returns:
-        A ToolResult object. On success, the 'result' dictionary contains:
+        dict: A ToolResult. Immediately: status 'pending' with the 'request_id'.
+        When the user answers, the final response has status 'success' and the
+        'result' dictionary contains:
             {'user_response': str} - The text response provided by the user.
         On failure, 'status' is 'error' and 'error_message' provides details.
     """
-    print(f"\n--- Asking User for Clarification ---")
-    print(f"Question: {question}")
-    if context_info:
-        print(f"Context: {context_info}")
-    print("------------------------------------")
-
-    # Placeholder for actual interaction with UI/external system
-    try:
-        user_response = input("Your response: ")
-        return ToolResult(status="success", result={"user_response": user_response})
-    except Exception as e:
-        print(f"Error during placeholder user input: {e}")
-        return ToolResult(status="error", error_message=f"Failed to get user clarification: {e}")
+    return _pending(tool_context, "request_user_clarification",
+                    {"question": question, "context_info": context_info}, "answer")
 
 
-def present_for_review_and_approval(item_type: str, item_content: Dict[str, Any], proposed_action: str) -> ToolResult:
+def present_for_review_and_approval(item_type: str, item_content: Dict[str, Any], proposed_action: str,
+                                    tool_context: ToolContext) -> dict:
     """Presents an item to the user for review and approval before proceeding.
 
-    This tool simulates presenting structured information (e.g., a draft plan,
-    an evaluation summary) to the user via an external UI and capturing their
-    decision and optional comments.
-
-    (Placeholder implementation uses print/input for simulation).
+    The item is shown to the user (e.g., a draft plan, an evaluation summary);
+    the conversation pauses until they decide.
 
     Args:
         item_type: A string describing the type of item being presented
@@ -58,77 +67,44 @@ def present_for_review_and_approval(item_type: str, item_content: Dict[str, Any]
                          (e.g., "Finalize plan", "Save evaluation").
 
     Returns:
-        A ToolResult object. On success, the 'result' dictionary contains:
+        dict: A ToolResult. Immediately: status 'pending' with the 'request_id'.
+        When the user decides, the final response has status 'success' and the
+        'result' dictionary contains:
             {'decision': str} - The user's decision ('approved', 'rejected',
                                or 'approved_with_comments').
             {'comments': str} - Any comments provided by the user (empty string
                                 if none).
         On failure, 'status' is 'error' and 'error_message' provides details.
     """
-    print(f"\n--- User Review Request ---")
-    print(f"Item Type: {item_type}")
-    print(f"Content: {item_content}")
-    print(f"Proposed Action: {proposed_action}")
-    print("---------------------------")
-
-    # Placeholder for actual interaction
-    while True:
-        decision = input("Decision (approved / rejected / approved_with_comments): ").lower().strip()
-        if decision in ["approved", "rejected", "approved_with_comments"]:
-            break
-        else:
-            print("Invalid input. Please enter 'approved', 'rejected', or 'approved_with_comments'.")
-
-    comments = ""
-    if decision in ["rejected", "approved_with_comments"]:
-        comments = input("Comments (optional): ")
-
-    try:
-        return ToolResult(status="success", result={"decision": decision, "comments": comments})
-    except Exception as e:
-        print(f"Error during placeholder user input: {e}")
-        return ToolResult(status="error", error_message=f"Failed to get user review/approval: {e}")
+    return _pending(tool_context, "present_for_review_and_approval",
+                    {"item_type": item_type, "item_content": item_content, "proposed_action": proposed_action},
+                    "review decision")
 
 
-def ask_user_to_choose_option(prompt: str, options: list[str]) -> ToolResult:
+def ask_user_to_choose_option(prompt: str, options: list[str], tool_context: ToolContext) -> dict:
     """Asks the user to select one option from a provided list.
 
-    This tool simulates presenting a prompt and a list of choices to the user
-    via an external UI and returning the selected option.
-
-    (Placeholder implementation uses print/input for simulation).
+    The prompt and options are shown to the user; the conversation pauses
+    until they choose.
 
     Args:
         prompt: The question or instruction prompting the user to choose.
         options: A list of strings representing the available choices.
 
     Returns:
-        A ToolResult object. On success, the 'result' dictionary contains:
+        dict: A ToolResult. Immediately: status 'pending' with the 'request_id'.
+        When the user chooses, the final response has status 'success' and the
+        'result' dictionary contains:
             {'selected_option': str} - The option chosen by the user.
         On failure (e.g., no options provided), 'status' is 'error' and
         'error_message' provides details.
     """
-    print(f"\n--- User Choice Request ---")
-    print(prompt)
     if not options:
-        return ToolResult(status="error", error_message="No options provided for user choice.")
-
-    for i, option in enumerate(options):
-        print(f"{i+1}. {option}")
-    print("-------------------------")
-
-    # Placeholder for actual interaction
-    while True:
-        try:
-            choice_input = input(f"Enter choice number (1-{len(options)}): ")
-            choice_idx = int(choice_input) - 1
-            if 0 <= choice_idx < len(options):
-                selected_option = options[choice_idx]
-                return ToolResult(status="success", result={"selected_option": selected_option})
-            else:
-                print(f"Invalid choice. Please enter a number between 1 and {len(options)}.")
-        except ValueError:
-            print("Invalid input. Please enter a number.")
-        except Exception as e:
-            print(f"Error during placeholder user input: {e}")
-            return ToolResult(status="error", error_message=f"Failed to get user choice: {e}")
+        return ToolResult(status="error", error_message="No options provided for user choice.").model_dump()
+    return _pending(tool_context, "ask_user_to_choose_option", {"prompt": prompt, "options": options}, "choice")
+
+
+# Long-running: ADK pauses the session after the call instead of waiting for the user
+request_user_clarification = LongRunningFunctionTool(request_user_clarification)
+present_for_review_and_approval = LongRunningFunctionTool(present_for_review_and_approval)
+ask_user_to_choose_option = LongRunningFunctionTool(ask_user_to_choose_option)
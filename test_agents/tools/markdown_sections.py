@@ -0,0 +1,140 @@
+"""Heading-indexed section trees for markdown documents.
+
+A document is parsed once into a flat list of ``Section`` entries (in
+document order, each knowing its heading path and line span), so a tool can
+return a single clause instead of the whole file. ``SectionTreeCache`` keeps
+the parsed tree per file and re-parses only when the file's
+content changes (it reads through ``file_cache``, so an unchanged file costs
+a ``stat()``).
+"""
+import re
+import threading
+import typing
+from pathlib import Path
+
+from .file_cache import read_text
+from .text_utils import iter_markdown_headings, unique_tokens
+
+# "5. Conflict Resolution", "2.1 Scope", "Article IV: ..." -> "5", "2.1", "IV"
+# (roman numerals need "Article"/"Section" or trailing punctuation, so "Mix it" is not numbered)
+_SECTION_NUMBER_RE = re.compile(
+    r"^(?:(?:article|section|§)\s*([ivxlcdm]+|\d+(?:\.\d+)*)[.:)]?|(\d+(?:\.\d+)*)[.:)]?|([ivxlcdm]+)[.:)])\s+",
+    re.IGNORECASE,
+)
+
+
+class Section(typing.NamedTuple):
+    """One heading and the lines it covers (including its subsections)."""
+    title: str
+    level: int
+    path: tuple[str, ...]
+    number: typing.Optional[str]
+    start: int  # 0-based index of the heading line
+    end: int  # 0-based index one past the section's last line
+
+    def summary(self) -> dict:
+        return {
+            "section": self.title,
+            "level": self.level,
+            "path": " > ".join(self.path),
+            "line": self.start + 1,
+        }
+
+
+class SectionTree(typing.NamedTuple):
+    """A parsed document: its lines plus the sections in document order."""
+    lines: list[str]
+    sections: list[Section]
+
+    def content(self, section: Section) -> str:
+        return "".join(self.lines[section.start:section.end]).strip() + "\n"
+
+
+def parse_section_tree(content: str) -> SectionTree:
+    """Parses markdown headings into a flat, ordered list of sections."""
+    lines = content.splitlines(keepends=True)
+    headings = []
+    # Checked line by line (with our own fence tracking) to keep each heading's line index
+    in_fence = False
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("```") or stripped.startswith("~~~"):
+            in_fence = not in_fence
+            continue
+        if not in_fence:
+            heading = next(iter_markdown_headings([stripped]), None)
+            if heading is not None:
+                headings.append((index, *heading))
+    sections = []
+    path: list[tuple[int, str]] = []
+    for position, (start, level, title) in enumerate(headings):
+        path = [(lvl, t) for lvl, t in path if lvl < level] + [(level, title)]
+        # A section ends at the next heading of the same or a higher level
+        end = next((other for other, other_level, _ in headings[position + 1:] if other_level <= level), len(lines))
+        match = _SECTION_NUMBER_RE.match(title)
+        sections.append(Section(
+            title=title,
+            level=level,
+            path=tuple(t for _, t in path),
+            number=next(group for group in match.groups() if group).casefold() if match else None,
+            start=start,
+            end=end,
+        ))
+    return SectionTree(lines, sections)
+
+
+def find_sections(tree: SectionTree, query: str) -> list[Section]:
+    """Finds the sections matching ``query``, most specific match kind first.
+
+    Tries, in order: exact title (with or without its number) or heading
+    path, section number (e.g. '5' or
+    '2.1'), title containing the query, then the sections sharing the most
+    words with the query.
+    """
+    wanted = query.strip().casefold()
+    if not wanted:
+        return []
+    sections = tree.sections
+    exact = [s for s in sections
+             if wanted in (s.title.casefold(), _SECTION_NUMBER_RE.sub("", s.title, count=1).casefold(),
+                           " > ".join(s.path).casefold())]
+    if exact:
+        return exact
+    number = wanted.rstrip(".:)").removeprefix("section").removeprefix("article").removeprefix("§").strip()
+    numbered = [s for s in sections if s.number is not None and s.number == number]
+    if numbered:
+        return numbered
+    contained = [s for s in sections if wanted in s.title.casefold()]
+    if contained:
+        return contained
+    words = set(unique_tokens(query))
+    scored = [(len(words & set(unique_tokens(s.title))), s) for s in sections]
+    best = max((score for score, _ in scored), default=0)
+    return [s for score, s in scored if best and score == best]
+
+
+class SectionTreeCache:
+    """Process-wide cache of parsed section trees, one per file."""
+
+    def __init__(self):
+        # path -> (content the tree was parsed from, tree)
+        self._trees: dict[str, tuple[str, SectionTree]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, file_path: typing.Union[str, Path]) -> SectionTree:
+        """Returns the section tree of a file, parsing it only if it changed.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        key = str(file_path)
+        content = read_text(file_path)
+        with self._lock:
+            cached = self._trees.get(key)
+        # file_cache hands out the same string object while the file is unchanged
+        if cached is not None and (cached[0] is content or cached[0] == content):
+            return cached[1]
+        tree = parse_section_tree(content)
+        with self._lock:
+            self._trees[key] = (content, tree)
+        return tree
@@ -0,0 +1,316 @@
+"""Incremental index over the meeting logs in ``MEETINGS_DIR``.
+
+Each ``YYYY-MM-DD.md`` log is parsed once into a ``MeetingEntry`` (date,
+participants, headings, size, mtime and word counts). A query only re-scans
+the directory (``os.scandir``) when its mtime changed, which every new,
+renamed, deleted or atomically rewritten log does, or ``FULL_RESCAN_SECONDS``
+after the last scan (for logs edited in place). A scan re-reads only the
+logs whose ``(mtime_ns, size)`` changed, so listing, "latest meeting" and
+keyword search never read all log files.
+
+The index is persisted to ``MEETING_INDEX_FILE``, an SQLite file with one
+row per log, so a restarted process starts warm and writing one log only
+rewrites that log's row.
+"""
+import datetime
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+import typing
+from collections import Counter
+from pathlib import Path
+
+from ..tracing import record_io
+from .text_utils import iter_markdown_headings, tokenize, unique_tokens
+
+_INDEX_VERSION = 2
+# Seconds after which a query re-scans the directory even if its mtime is unchanged
+FULL_RESCAN_SECONDS = 60.0
+_PARTICIPANT_HEADINGS = {"participants", "attendees"}
+_BULLET_PREFIXES = ("- ", "* ", "+ ")
+
+
+class MeetingEntry(typing.NamedTuple):
+    """Indexed metadata of one meeting log."""
+    date: str
+    participants: tuple[str, ...]
+    headings: tuple[str, ...]
+    size: int
+    mtime_ns: int
+    term_counts: dict[str, int]
+
+    def summary(self) -> dict:
+        """The fields returned by the meeting tools (term counts are internal)."""
+        return {
+            "meeting_date": self.date,
+            "participants": list(self.participants),
+            "headings": list(self.headings),
+            "size": self.size,
+            "modified": datetime.datetime.fromtimestamp(self.mtime_ns / 1e9).isoformat(timespec='seconds'),
+        }
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    date TEXT PRIMARY KEY,
+    participants TEXT NOT NULL,
+    headings TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    term_counts TEXT NOT NULL
+);
+"""
+
+
+def _is_meeting_date(stem: str) -> bool:
+    try:
+        datetime.datetime.strptime(stem, '%Y-%m-%d')
+        return True
+    except ValueError:
+        return False
+
+
+def _clean_participant(line: str) -> str:
+    name = line.strip()[2:].strip()
+    return name.replace("**", "").strip()
+
+
+def parse_meeting_log(date: str, content: str, size: int, mtime_ns: int) -> MeetingEntry:
+    """Extracts the indexed fields from a meeting log's markdown."""
+    lines = content.splitlines()
+    headings = tuple(title for _, title in iter_markdown_headings(lines))
+    participants = []
+    in_participants = False
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            in_participants = stripped.lstrip("#").strip().casefold() in _PARTICIPANT_HEADINGS
+        elif in_participants and stripped.startswith(_BULLET_PREFIXES):
+            name = _clean_participant(stripped)
+            if name:
+                participants.append(name)
+    return MeetingEntry(
+        date=date,
+        participants=tuple(participants),
+        headings=headings,
+        size=size,
+        mtime_ns=mtime_ns,
+        term_counts=dict(Counter(tokenize(content))),
+    )
+
+
+class MeetingIndex:
+    """Process-wide index of the meeting logs in one directory."""
+
+    def __init__(self, meetings_dir: typing.Union[str, Path], index_file: typing.Union[str, Path]):
+        self.meetings_dir = Path(meetings_dir)
+        self.index_file = Path(index_file)
+        self._entries: dict[str, MeetingEntry] = {}
+        # token -> dates of the logs containing it
+        self._postings: dict[str, set[str]] = {}
+        self._sorted_dates: list[str] = []
+        self._loaded = False
+        # mtime of the directory at the last scan, and when that scan ran (time.monotonic)
+        self._scanned_mtime_ns: typing.Optional[int] = None
+        self._scanned_at = 0.0
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    # --- maintenance ---
+
+    def _link(self, entry: MeetingEntry):
+        self._entries[entry.date] = entry
+        for token in entry.term_counts:
+            self._postings.setdefault(token, set()).add(entry.date)
+
+    def _unlink(self, date: str):
+        entry = self._entries.pop(date, None)
+        if entry is None:
+            return
+        for token in entry.term_counts:
+            dates = self._postings.get(token)
+            if dates is not None:
+                dates.discard(date)
+                if not dates:
+                    del self._postings[token]
+
+    def _connect(self) -> sqlite3.Connection:
+        # Called with the lock held
+        if self._connection is None:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.index_file, timeout=30, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            if connection.execute("PRAGMA user_version").fetchone()[0] != _INDEX_VERSION:
+                connection.execute("DROP TABLE IF EXISTS meetings")
+                connection.execute(f"PRAGMA user_version = {_INDEX_VERSION}")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _load_persisted(self):
+        try:
+            rows = self._connect().execute("SELECT * FROM meetings").fetchall()
+        except sqlite3.Error as e:
+            print(f"Ignoring unreadable meeting index {self.index_file}: {e}")
+            return
+        for date, participants, headings, size, mtime_ns, term_counts in rows:
+            try:
+                entry = MeetingEntry(date, tuple(json.loads(participants)), tuple(json.loads(headings)), size,
+                                     mtime_ns, json.loads(term_counts))
+            except ValueError as e:
+                print(f"Skipping malformed meeting index entry: {e}")
+                continue
+            self._link(entry)
+        self._sorted_dates = sorted(self._entries)
+
+    def _persist(self, changed: typing.Iterable[str]):
+        """Writes the rows of the given dates (deleting those no longer indexed)."""
+        upserts, deletes = [], []
+        for date in changed:
+            entry = self._entries.get(date)
+            if entry is None:
+                deletes.append((date,))
+            else:
+                upserts.append((entry.date, json.dumps(entry.participants, ensure_ascii=False),
+                                json.dumps(entry.headings, ensure_ascii=False), entry.size, entry.mtime_ns,
+                                json.dumps(entry.term_counts, ensure_ascii=False)))
+        try:
+            connection = self._connect()
+            connection.execute("BEGIN")
+            try:
+                connection.executemany("DELETE FROM meetings WHERE date = ?", deletes)
+                connection.executemany("INSERT OR REPLACE INTO meetings VALUES (?, ?, ?, ?, ?, ?)", upserts)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            # The index is only a cache; the logs themselves are the source of truth
+            print(f"Warning: Could not save meeting index {self.index_file}: {e}")
+
+    def _read_entry(self, date: str, file_path: Path) -> typing.Optional[MeetingEntry]:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                st = os.fstat(f.fileno())
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        record_io(bytes_read=st.st_size)
+        return parse_meeting_log(date, content, st.st_size, st.st_mtime_ns)
+
+    def refresh(self, force: bool = False) -> bool:
+        """Brings the index in line with the directory, re-reading only changed logs.
+
+        Skips the scan if the directory's mtime is unchanged since the last one
+        (unless ``force`` or the last scan is older than ``FULL_RESCAN_SECONDS``).
+
+        Returns:
+            bool: True if any entry was added, changed or removed.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load_persisted()
+                self._loaded = True
+            try:
+                directory_mtime_ns = os.stat(self.meetings_dir).st_mtime_ns
+            except FileNotFoundError:
+                directory_mtime_ns = None
+            now = time.monotonic()
+            if (not force and directory_mtime_ns == self._scanned_mtime_ns
+                    and now - self._scanned_at < FULL_RESCAN_SECONDS):
+                return False
+            seen: dict[str, os.stat_result] = {}
+            try:
+                with os.scandir(self.meetings_dir) as it:
+                    for dir_entry in it:
+                        name = dir_entry.name
+                        if (name.endswith(".md") and (name[:-3] in self._entries or _is_meeting_date(name[:-3]))
+                                and dir_entry.is_file()):
+                            seen[name[:-3]] = dir_entry.stat()
+            except FileNotFoundError:
+                pass
+            changed = [date for date in self._entries if date not in seen]
+            for date in changed:
+                self._unlink(date)
+            for date, st in seen.items():
+                entry = self._entries.get(date)
+                if entry is not None and (entry.mtime_ns, entry.size) == (st.st_mtime_ns, st.st_size):
+                    continue
+                self._unlink(date)
+                entry = self._read_entry(date, self.meetings_dir / f"{date}.md")
+                if entry is not None:
+                    self._link(entry)
+                changed.append(date)
+            self._scanned_mtime_ns, self._scanned_at = directory_mtime_ns, now
+            if changed:
+                self._sorted_dates = sorted(self._entries)
+                self._persist(changed)
+            return bool(changed)
+
+    def update(self, date: str):
+        """Re-indexes a single log right after it was written (or deleted)."""
+        with self._lock:
+            if not self._loaded:
+                self.refresh()
+                return
+            self._unlink(date)
+            entry = self._read_entry(date, self.meetings_dir / f"{date}.md")
+            if entry is not None:
+                self._link(entry)
+            self._sorted_dates = sorted(self._entries)
+            self._persist([date])
+
+    # --- queries ---
+
+    def meetings(self, start_date: typing.Optional[str] = None, end_date: typing.Optional[str] = None,
+             participant: typing.Optional[str] = None) -> list[MeetingEntry]:
+        """Returns the meetings in [start_date, end_date] (oldest first), optionally filtered by participant."""
+        self.refresh()
+        with self._lock:
+            entries = [self._entries[date] for date in self._sorted_dates
+                       if (start_date is None or date >= start_date) and (end_date is None or date <= end_date)]
+        if participant:
+            wanted = participant.strip().casefold()
+            entries = [entry for entry in entries
+                       if any(wanted in name.casefold() for name in entry.participants)]
+        return entries
+
+    def latest(self) -> typing.Optional[MeetingEntry]:
+        """Returns the most recent meeting, or None if there are no logs."""
+        self.refresh()
+        with self._lock:
+            return self._entries[self._sorted_dates[-1]] if self._sorted_dates else None
+
+    def search(self, query: str, start_date: typing.Optional[str] = None, end_date: typing.Optional[str] = None,
+               limit: int = 10) -> list[tuple[MeetingEntry, float, list[str]]]:
+        """Ranks meetings by the query words they contain.
+
+        Meetings matching more distinct query words rank first, then by a
+        TF-IDF score, then by date (newest first).
+
+        Returns:
+            list: ``(entry, score, matched_terms)`` tuples, best match first.
+        """
+        terms = unique_tokens(query)
+        self.refresh()
+        with self._lock:
+            total = len(self._entries)
+            matched: dict[str, list[str]] = {}
+            scores: dict[str, float] = {}
+            for term in terms:
+                dates = self._postings.get(term, ())
+                if not dates:
+                    continue
+                idf = math.log(1 + total / len(dates))
+                for date in dates:
+                    if (start_date is not None and date < start_date) or (end_date is not None and date > end_date):
+                        continue
+                    tf = self._entries[date].term_counts[term]
+                    scores[date] = scores.get(date, 0.0) + (1 + math.log(tf)) * idf
+                    matched.setdefault(date, []).append(term)
+            ranked = sorted(scores, key=lambda date: (len(matched[date]), scores[date], date), reverse=True)
+            return [(self._entries[date], round(scores[date], 4), matched[date]) for date in ranked[:limit]]
@@ -5,6 +5,9 @@ from pydantic import ValidationError
 
 # Import required models - adjust path relative to this new location
 from ..models import AddPirateArticleInput, EditPirateArticleInput, WriteResult
+from .document_io import append_text, atomic_write_text, file_lock
+from .file_cache import read_text
+from ..tracing import record_io
 
 PIRATE_CODE_PATH = "documents/pirate_code_101.md"
 
@@ -17,8 +20,7 @@ def read_pirate_code():
         dict: A dictionary with status and result (content) or error_message.
     """
     try:
-        with open(PIRATE_CODE_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_text(PIRATE_CODE_PATH)
         return {
             "status": "success",
             "result": {"content": content}
@@ -72,8 +74,8 @@ def write_pirate_code(article_title: str, article_text: str):
         new_article_content = f"\n\n{formatted_title}\n{formatted_text}"
 
         # Append to the file
-        with open(PIRATE_CODE_PATH, 'a', encoding='utf-8') as f:
-            f.write(new_article_content)
+        with file_lock(PIRATE_CODE_PATH):
+            append_text(PIRATE_CODE_PATH, new_article_content)
 
         result_model = WriteResult(message=f"Success! Added '{validated_input.article_title}' to the Pirate Code.")
         return {
@@ -145,52 +147,54 @@ def edit_pirate_code(target_article_title: str, action: str, new_article_text: t
 
     # --- File Processing ---
     try:
-        with open(PIRATE_CODE_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        sections = re.split(r'(\n*\#\#\s)', content)
-        processed_sections = []
-        article_found = False
-
-        if sections[0].strip():
-             processed_sections.append(sections[0])
-
-        for i in range(1, len(sections), 2):
-            delimiter = sections[i]
-            section_content = sections[i+1]
-            full_title_line = section_content.split('\n', 1)[0].strip()
-            current_title = f"## {full_title_line}"
-
-            if current_title == validated_input.target_article_title:
-                article_found = True
-                if validated_input.action == 'modify':
-                    modified_section = f"{delimiter}{full_title_line}\n{current_new_text}"
-                    processed_sections.append(modified_section)
-                elif validated_input.action == 'delete':
-                    pass # Skip section
-            else:
-                processed_sections.append(delimiter + section_content)
-
-        if not article_found:
+        # Hold the lock across read-modify-write so concurrent edits are not lost
+        with file_lock(PIRATE_CODE_PATH):
+            with open(PIRATE_CODE_PATH, 'r', encoding='utf-8') as f:
+                content = f.read()
+            record_io(bytes_read=len(content.encode('utf-8')))
+
+            sections = re.split(r'(\n*\#\#\s)', content)
+            processed_sections = []
+            article_found = False
+
+            if sections[0].strip():
+                 processed_sections.append(sections[0])
+
+            for i in range(1, len(sections), 2):
+                delimiter = sections[i]
+                section_content = sections[i+1]
+                full_title_line = section_content.split('\n', 1)[0].strip()
+                current_title = f"## {full_title_line}"
+
+                if current_title == validated_input.target_article_title:
+                    article_found = True
+                    if validated_input.action == 'modify':
+                        modified_section = f"{delimiter}{full_title_line}\n{current_new_text}"
+                        processed_sections.append(modified_section)
+                    elif validated_input.action == 'delete':
+                        pass # Skip section
+                else:
+                    processed_sections.append(delimiter + section_content)
+
+            if not article_found:
+                return {
+                    "status": "error",
+                    "error_message": f"Article not found: '{validated_input.target_article_title}'.",
+                    "pirate_message": "Blast it! Couldn't find the article."
+                }
+
+            new_content = "".join(processed_sections)
+
+            atomic_write_text(PIRATE_CODE_PATH, new_content)
+
+            # --- Return Success ---
+            action_verb = "modified" if validated_input.action == 'modify' else "deleted"
+            result_model = WriteResult(message=f"Success! {action_verb.capitalize()} article '{validated_input.target_article_title}'.")
             return {
-                "status": "error",
-                "error_message": f"Article not found: '{validated_input.target_article_title}'.",
-                "pirate_message": "Blast it! Couldn't find the article."
+                "status": "success",
+                "result": result_model.model_dump()
             }
 
-        new_content = "".join(processed_sections)
-
-        with open(PIRATE_CODE_PATH, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-
-        # --- Return Success ---
-        action_verb = "modified" if validated_input.action == 'modify' else "deleted"
-        result_model = WriteResult(message=f"Success! {action_verb.capitalize()} article '{validated_input.target_article_title}'.")
-        return {
-            "status": "success",
-            "result": result_model.model_dump()
-        }
-
     except FileNotFoundError:
          return {
             "status": "error",
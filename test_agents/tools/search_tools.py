@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+import typing
+from functools import partial
+from pathlib import Path
+from ..models import ToolResult
+# Import configured paths
+from ..config import DOCUMENTS_BASE_DIR, DOCUMENT_SEARCH_INDEX_FILE
+from .document_index import DocumentSearchIndex, DocumentSource
+from .document_io import write_generation
+from . import task_tools
+
+DocumentType = typing.Literal["meeting", "profile", "partnership", "tasks", "other"]
+
+_DOCUMENTS_BASE_PATH = Path(DOCUMENTS_BASE_DIR)
+# Longest snippet returned per passage (characters)
+_MAX_SNIPPET_CHARS = 600
+# Seconds after which a search re-scans the documents even if nothing was written (for files edited in place)
+FULL_RESCAN_SECONDS = 60.0
+
+# Passage-level BM25 index over every markdown document, refreshed incrementally
+_search_index = DocumentSearchIndex(DOCUMENT_SEARCH_INDEX_FILE)
+
+# The last scan of the documents directory: what it depended on (see _scan_key), the directories it
+# walked and when it ran (time.monotonic)
+_scan_lock = threading.Lock()
+_scanned_key = None
+_scanned_directories: list[str] = []
+_scanned_at = 0.0
+
+def _doc_id(path: Path) -> str:
+    """Identifies a document by its path relative to the documents directory."""
+    try:
+        return path.relative_to(_DOCUMENTS_BASE_PATH).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+def _document_type(doc_id: str) -> str:
+    directory, _, name = doc_id.rpartition("/")
+    if directory == "meetings":
+        return "meeting"
+    if directory == "profiles":
+        return "profile"
+    if task_tools.task_list_user(name) is not None:
+        return "tasks"
+    if name.startswith("partnership_"):
+        return "partnership"
+    return "other"
+
+def _collect_sources() -> tuple[dict[str, DocumentSource], list[str]]:
+    """Lists the markdown documents to index with their current signatures (stat only, no reads).
+
+    Returns:
+        tuple: The sources by document ID, and the directories that were walked.
+    """
+    sources = {}
+    directories = []
+    for dirpath, dirnames, filenames in os.walk(_DOCUMENTS_BASE_PATH):
+        directories.append(dirpath)
+        # Skip hidden directories (e.g. version control metadata)
+        dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+        for name in filenames:
+            if name.startswith(".") or not name.endswith(".md"):
+                continue
+            path = Path(dirpath) / name
+            doc_id = _doc_id(path)
+            if _document_type(doc_id) == "tasks":
+                continue # Added below, together with their journals
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            sources[doc_id] = DocumentSource((st.st_mtime_ns, st.st_size), partial(path.read_text, encoding='utf-8'))
+    # Task lists are indexed from the task store, so journaled edits are searchable right away
+    for user_name in task_tools.list_task_users():
+        sources[_doc_id(task_tools.task_list_path(user_name))] = DocumentSource(
+            task_tools.task_list_signature(user_name), partial(task_tools.render_task_list, user_name))
+    return sources, directories
+
+def _scan_key(directories: list[str]) -> tuple:
+    """Changes when a tool writes a document or a file is added to, removed from or renamed in a directory."""
+    mtimes = []
+    for directory in directories:
+        try:
+            mtimes.append(os.stat(directory).st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(None)
+    return write_generation(), tuple(mtimes)
+
+def _refresh_index():
+    """Brings the index in line with the documents, skipping the directory walk while nothing changed."""
+    global _scanned_key, _scanned_directories, _scanned_at
+    with _scan_lock:
+        key = _scan_key(_scanned_directories)
+        now = time.monotonic()
+        if key == _scanned_key and now - _scanned_at < FULL_RESCAN_SECONDS:
+            return
+        sources, directories = _collect_sources()
+        _search_index.refresh(sources)
+        # Taken before the walk, so a write during it triggers the next scan; a new directory
+        # is not covered by the key yet, so the next search walks again
+        _scanned_key = key if directories == _scanned_directories else None
+        _scanned_directories, _scanned_at = directories, now
+
+def _snippet(text: str, terms: list[str]) -> str:
+    """Shortens a passage to a window around the first matched term."""
+    if len(text) <= _MAX_SNIPPET_CHARS:
+        return text
+    folded = text.casefold()
+    positions = [pos for pos in (folded.find(term) for term in terms) if pos >= 0]
+    start = max(0, min(positions, default=0) - _MAX_SNIPPET_CHARS // 4)
+    end = start + _MAX_SNIPPET_CHARS
+    return ("..." if start else "") + text[start:end].strip() + ("..." if end < len(text) else "")
+
+def search_governance_documents(query: str, document_types: typing.Optional[list[DocumentType]] = None,
+                                limit: int = 5) -> dict:
+    """
+    Searches all governance documents (meeting logs, profiles, partnership agreement/companion and task lists)
+    and returns the best-matching passages instead of whole documents.
+
+    Args:
+        query: The words to search for (e.g., 'decision making conflicts').
+        document_types: Optionally restrict the search to these document types
+            ('meeting', 'profile', 'partnership', 'tasks', 'other').
+        limit: The maximum number of passages to return (1-20).
+
+    Returns:
+        A dictionary containing the status and the ranked passages (document, document type, section heading,
+        line number, snippet, matched terms and score), or an error message.
+    """
+    if not query or not query.strip():
+        return ToolResult(status="error", error_message="A non-empty search query is required.").model_dump()
+    try:
+        _refresh_index()
+        doc_filter = None
+        if document_types:
+            wanted = set(document_types)
+            doc_filter = lambda doc_id: _document_type(doc_id) in wanted
+        hits = _search_index.search(query, limit=max(1, min(int(limit), 20)), doc_filter=doc_filter)
+        results = [
+            {
+                "document": passage.doc_id,
+                "document_type": _document_type(passage.doc_id),
+                "section": passage.heading,
+                "line": passage.line,
+                "snippet": _snippet(passage.text, terms),
+                "matched_terms": terms,
+                "score": score,
+            }
+            for passage, score, terms in hits
+        ]
+        return ToolResult(
+            status="success",
+            result={"results": results, "count": len(results)}
+        ).model_dump()
+    except Exception as e:
+        return ToolResult(
+            status="error",
+            error_message=f"An unexpected error occurred while searching the documents: {str(e)}"
+        ).model_dump()
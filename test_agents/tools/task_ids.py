@@ -0,0 +1,50 @@
+"""Team-wide monotonic task ID allocator.
+
+Task IDs used to be ``max(task_id) + 1`` of a single user's list, so the same
+ID existed in several lists and every write needed a full parse to find the
+maximum. IDs are now handed out from one counter file under ``DOCUMENTS_DIR``
+(``TASK_ID_COUNTER_FILE``), protected by the document lock so every process
+and thread gets distinct IDs without scanning any task list.
+"""
+import typing
+from pathlib import Path
+
+from .document_io import atomic_write_text, file_lock
+
+
+class TaskIdAllocator:
+    """Allocates increasing task IDs from a counter file.
+
+    ``bootstrap()`` is only called when the counter file does not exist yet
+    (or is unreadable) and must return the highest task ID currently in use.
+    """
+
+    def __init__(self, counter_file: typing.Union[str, Path], bootstrap: typing.Callable[[], int]):
+        self.counter_file = Path(counter_file)
+        self._bootstrap = bootstrap
+
+    def _read_counter(self) -> typing.Optional[int]:
+        try:
+            return int(self.counter_file.read_text(encoding='utf-8').strip())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            print(f"Ignoring corrupt task ID counter {self.counter_file}; rebuilding it from the task lists.")
+            return None
+
+    def allocate(self, count: int = 1, floor: int = 0) -> list[int]:
+        """Reserves ``count`` consecutive IDs greater than both the counter and ``floor``.
+
+        Args:
+            count: How many IDs to reserve.
+            floor: A lower bound, typically the largest ID in the target list,
+                so IDs stay unique even if the counter file was lost or a list
+                was edited by hand.
+        """
+        with file_lock(self.counter_file):
+            last = self._read_counter()
+            if last is None:
+                last = self._bootstrap()
+            first = max(last, floor) + 1
+            atomic_write_text(self.counter_file, f"{first + count - 1}\n")
+        return list(range(first, first + count))
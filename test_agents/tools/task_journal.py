@@ -0,0 +1,132 @@
+"""Append-only mutation journal for task files.
+
+Each ``tasks_{user_name}.md`` can have a sibling journal file holding one JSON
+record per line:
+
+    {"op": "add", "task": {...}}
+    {"op": "modify", "task_id": 3, "updates": {"status": "Done"}}
+    {"op": "delete", "task_id": 3}
+    {"op": "batch", "records": [...]}
+
+A batch is written as one line, so a bulk operation is either fully present
+in the journal or (after a torn write) not at all.
+
+Records are replayed on top of the markdown table when the task list is
+loaded, and the journal is removed once its contents have been compacted back
+into the table. Replay is idempotent, so a crash between writing the table and
+removing the journal does not corrupt the list.
+"""
+import json
+import os
+import typing
+from pathlib import Path
+
+from ..config import TASKS_JOURNAL_SUFFIX
+from .document_io import append_text
+from .task_store import TaskRecord, apply_task_updates
+
+
+def journal_path(file_path: Path) -> Path:
+    """Returns the path of the journal belonging to a task file."""
+    return file_path.with_name(file_path.name + TASKS_JOURNAL_SUFFIX)
+
+
+def add_record(task: TaskRecord) -> dict:
+    return {"op": "add", "task": task._asdict()}
+
+
+def modify_record(task_id: int, updates: dict) -> dict:
+    return {"op": "modify", "task_id": task_id, "updates": updates}
+
+
+def delete_record(task_id: int) -> dict:
+    return {"op": "delete", "task_id": task_id}
+
+
+def batch_record(records: list[dict]) -> dict:
+    return {"op": "batch", "records": records}
+
+
+def append_records(file_path: Path, records: list[dict]) -> int:
+    """Appends records to the journal with a single write + fsync.
+
+    Callers must hold ``document_io.file_lock`` on the task file.
+
+    Returns:
+        int: The size of the journal in bytes after the append.
+    """
+    payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    return append_text(journal_path(file_path), payload)
+
+
+def read_records(file_path: Path) -> typing.Iterator[dict]:
+    """Yields the records stored in a task file's journal (if any)."""
+    path = journal_path(file_path)
+    try:
+        f = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            if not line.endswith("\n"):
+                # Torn final write (crash mid-append); the mutation was never acknowledged
+                print(f"Ignoring incomplete trailing record in {path}")
+                break
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"Skipping invalid journal record in {path}: {e}")
+
+
+def replay(tasks: dict[int, TaskRecord], records: typing.Iterable[dict]) -> int:
+    """Applies journal records to ``tasks`` (keyed by task ID) in place.
+
+    Returns:
+        int: The number of records applied.
+    """
+    applied = 0
+    for record in records:
+        op = record.get("op")
+        try:
+            if op == "add":
+                task = TaskRecord(**record["task"])
+                tasks[task.task_id] = task
+            elif op == "modify":
+                task = tasks.get(record["task_id"])
+                if task is not None:
+                    tasks[task.task_id] = apply_task_updates(task, record["updates"])
+            elif op == "delete":
+                tasks.pop(record["task_id"], None)
+            elif op == "batch":
+                replay(tasks, record["records"])
+            else:
+                print(f"Skipping journal record with unknown op: {record}")
+                continue
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Skipping malformed journal record: {record} - Error: {e}")
+            continue
+        applied += 1
+    return applied
+
+
+def max_added_id(records: typing.Iterable[dict]) -> int:
+    """The highest task ID added by the records (0 if none), without replaying them."""
+    highest = 0
+    for record in records:
+        op = record.get("op")
+        try:
+            if op == "add":
+                highest = max(highest, int(record["task"]["task_id"]))
+            elif op == "batch":
+                highest = max(highest, max_added_id(record["records"]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return highest
+
+
+def remove_journal(file_path: Path):
+    """Deletes the journal once it has been compacted into the task file."""
+    try:
+        os.remove(journal_path(file_path))
+    except FileNotFoundError:
+        pass
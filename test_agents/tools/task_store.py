@@ -0,0 +1,228 @@
+"""In-memory, ID-indexed view of the per-user task files.
+
+The markdown task files configured by ``TASKS_FILE_PATTERN`` stay the on-disk
+source of truth. ``TaskStore`` keeps one parsed ``TaskIndex`` per file and only
+re-parses it when the file's ``(inode, mtime, size)`` signature (together with
+that of its mutation journal) changes, so repeated reads and point edits no
+longer pay for a full parse.
+"""
+import bisect
+import os
+import threading
+import typing
+from contextlib import contextmanager
+from pathlib import Path
+
+# (st_ino, st_mtime_ns, st_size) of a task file, or None if it does not exist
+FileSignature = typing.Optional[tuple[int, int, int]]
+
+# Fields that can be changed through edit_task
+EDITABLE_TASK_FIELDS = frozenset({'title', 'assignee', 'deadline', 'description', 'status'})
+
+
+class TaskRecord(typing.NamedTuple):
+    """Compact, immutable row of a task list.
+
+    Used for data the tools wrote themselves (task files and journals), which
+    does not need pydantic validation. Same fields as ``models.Task``;
+    ``_asdict()`` gives the dict a ``Task.model_dump()`` would.
+    """
+    task_id: int
+    title: str
+    assignee: str
+    deadline: str
+    description: str
+    status: str = "Pending"
+
+
+def file_signature(file_path: Path) -> FileSignature:
+    """Returns the cache validation signature for a file, or None if it is missing."""
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def apply_task_updates(task: TaskRecord, updates: dict) -> TaskRecord:
+    """Returns a copy of ``task`` with the editable, non-None fields in ``updates`` applied."""
+    changes = {key: value for key, value in updates.items() if key in EDITABLE_TASK_FIELDS and value is not None}
+    return task._replace(**changes) if changes else task
+
+
+def _index_key(value: str) -> str:
+    """Normalizes assignee/status values so lookups are case-insensitive."""
+    return value.strip().casefold()
+
+
+class TaskIndex:
+    """Parsed task list for one user, indexed by ID, assignee, status and deadline."""
+
+    def __init__(self, tasks: typing.Iterable[TaskRecord], raw_content: typing.Optional[str], signature=None):
+        # None means "render from the tasks on demand" (e.g. after a mutation)
+        self.raw_content = raw_content
+        self.signature = signature
+        self.by_id: dict[int, TaskRecord] = {}
+        self.by_assignee: dict[str, set[int]] = {}
+        self.by_status: dict[str, set[int]] = {}
+        # Sorted (deadline, task_id) pairs for range lookups
+        self.deadlines: list[tuple[str, int]] = []
+        self.max_id = 0
+        # Keep by_id in ascending ID order so tasks() never needs a sort
+        for task in sorted(tasks, key=lambda t: t.task_id):
+            self.add(task)
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self.by_id
+
+    def get(self, task_id: int) -> typing.Optional[TaskRecord]:
+        """Returns the task with the given ID, or None."""
+        return self.by_id.get(task_id)
+
+    def tasks(self) -> list[TaskRecord]:
+        """Returns all tasks in ascending ID order."""
+        return list(self.by_id.values())
+
+    def _link(self, task: TaskRecord):
+        self.by_assignee.setdefault(_index_key(task.assignee), set()).add(task.task_id)
+        self.by_status.setdefault(_index_key(task.status), set()).add(task.task_id)
+        bisect.insort(self.deadlines, (task.deadline, task.task_id))
+
+    def _unlink(self, task: TaskRecord):
+        for index, key in ((self.by_assignee, _index_key(task.assignee)),
+                           (self.by_status, _index_key(task.status))):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(task.task_id)
+                if not ids:
+                    del index[key]
+        pos = bisect.bisect_left(self.deadlines, (task.deadline, task.task_id))
+        if pos < len(self.deadlines) and self.deadlines[pos] == (task.deadline, task.task_id):
+            del self.deadlines[pos]
+
+    def add(self, task: TaskRecord):
+        """Adds a task (replacing any task with the same ID)."""
+        if task.task_id in self.by_id:
+            self._unlink(self.by_id[task.task_id])
+        self.by_id[task.task_id] = task
+        self._link(task)
+        self.max_id = max(self.max_id, task.task_id)
+
+    def update(self, task_id: int, updates: dict) -> TaskRecord:
+        """Replaces a task with an updated copy and re-indexes it."""
+        task = self.by_id[task_id]
+        self._unlink(task)
+        task = self.by_id[task_id] = apply_task_updates(task, updates)
+        self._link(task)
+        return task
+
+    def remove(self, task_id: int) -> TaskRecord:
+        """Removes a task and returns it."""
+        task = self.by_id.pop(task_id)
+        self._unlink(task)
+        return task
+
+    def ids_for_assignee(self, assignee: str) -> set[int]:
+        """Returns the IDs of tasks assigned to ``assignee`` (case-insensitive)."""
+        return set(self.by_assignee.get(_index_key(assignee), ()))
+
+    def ids_for_status(self, status: str) -> set[int]:
+        """Returns the IDs of tasks with ``status`` (case-insensitive)."""
+        return set(self.by_status.get(_index_key(status), ()))
+
+    def ids_in_deadline_range(self, start: typing.Optional[str] = None, end: typing.Optional[str] = None) -> list[int]:
+        """Returns task IDs whose deadline lies in [start, end], ordered by deadline.
+
+        Deadlines are compared as strings, which orders YYYY-MM-DD dates correctly.
+        """
+        lo = 0 if start is None else bisect.bisect_left(self.deadlines, (start,))
+        if end is None:
+            hi = len(self.deadlines)
+        else:
+            # (end, inf) sorts after every (end, task_id) pair
+            hi = bisect.bisect_right(self.deadlines, (end, float('inf')))
+        return [task_id for _, task_id in self.deadlines[lo:hi]]
+
+    def select(self, assignee: typing.Optional[str] = None, status: typing.Optional[str] = None,
+               deadline_from: typing.Optional[str] = None, deadline_to: typing.Optional[str] = None) -> list[int]:
+        """Returns the IDs (ascending) of tasks matching all given filters, using the indexes."""
+        candidates: typing.Optional[set[int]] = None
+        if assignee is not None:
+            candidates = self.ids_for_assignee(assignee)
+        if status is not None:
+            ids = self.ids_for_status(status)
+            candidates = ids if candidates is None else candidates & ids
+        if deadline_from is not None or deadline_to is not None:
+            ids = set(self.ids_in_deadline_range(deadline_from, deadline_to))
+            candidates = ids if candidates is None else candidates & ids
+        if candidates is None:
+            return list(self.by_id)
+        return sorted(candidates)
+
+
+class TaskStore:
+    """Process-wide cache of ``TaskIndex`` objects, one per task file.
+
+    ``loader(file_path, user_name)`` must return ``(tasks, raw_content)`` for a
+    file. Cached indexes are validated against ``signature(file_path)`` (by
+    default the file signature) on every access, so edits made by other
+    processes (or by hand) are picked up.
+    """
+
+    def __init__(self, loader: typing.Callable[[Path, str], tuple[list[TaskRecord], typing.Optional[str]]],
+                 signature: typing.Callable[[Path], typing.Any] = file_signature):
+        self._loader = loader
+        self._signature = signature
+        self._indexes: dict[str, TaskIndex] = {}
+        self._locks: dict[str, threading.RLock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _path_lock(self, file_path: Path) -> threading.RLock:
+        key = str(file_path)
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.RLock()
+            return lock
+
+    @contextmanager
+    def locked(self, file_path: Path):
+        """Serializes access to one task file within this process."""
+        with self._path_lock(file_path):
+            yield
+
+    def load(self, file_path: Path, user_name: str) -> TaskIndex:
+        """Returns the index for a task file, re-parsing it only if it changed on disk."""
+        with self._path_lock(file_path):
+            key = str(file_path)
+            signature = self._signature(file_path)
+            index = self._indexes.get(key)
+            if index is not None and index.signature == signature:
+                return index
+            tasks, raw_content = self._loader(file_path, user_name)
+            index = TaskIndex(tasks, raw_content, signature)
+            self._indexes[key] = index
+            return index
+
+    def mark_synced(self, file_path: Path, raw_content: typing.Optional[str] = None):
+        """Records that the cached index now matches the files on disk (call after writing them).
+
+        ``raw_content`` is the new markdown content if it is known; otherwise it
+        is rendered on demand the next time it is needed.
+        """
+        with self._path_lock(file_path):
+            index = self._indexes.get(str(file_path))
+            if index is not None:
+                index.signature = self._signature(file_path)
+                index.raw_content = raw_content
+
+    def invalidate(self, file_path: typing.Optional[Path] = None):
+        """Drops the cached index for one file, or for all files if no path is given."""
+        with self._locks_guard:
+            if file_path is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(str(file_path), None)
@@ -1,17 +1,37 @@
 import typing
 import os
 import csv
-import io
+import argparse
+import re
+import threading
 from pathlib import Path
 from pydantic import ValidationError
 
 # Import required models and configuration
-from ..models import Task, TaskListResult, WriteTaskInput, EditTaskInput, TaskOperationResult
-from ..config import TASKS_FILE_PATTERN # Import the configured path pattern
+from ..models import (
+    WriteTaskInput, TaskOperationResult,
+    NewTaskInput, WriteTasksBulkInput, TaskEditOperation, EditTasksBulkInput,
+    BulkTaskItemResult, BulkTaskOperationResult,
+    TaskFilterInput, QueryTasksInput, QueryTeamTasksInput, TaskQueryResult,
+)
+from ..config import ( # Import the configured path pattern
+    TASKS_COMPACT_IDLE_SECONDS, TASKS_FILE_PATTERN, TASKS_JOURNAL_MAX_BYTES, TASKS_JOURNAL_SUFFIX,
+    TASK_ID_COUNTER_FILE,
+)
+from .task_store import TaskStore, TaskRecord, EDITABLE_TASK_FIELDS, file_signature
+from . import task_journal
+from .document_io import atomic_write_text, file_lock
+from .file_cache import read_text
+from .task_ids import TaskIdAllocator
+from ..tracing import record_io
 
 # Define the table header structure (remains constant)
 TASK_TABLE_HEADER = "| ID | Title | Assignee | Deadline | Description | Status |\n|---|---|---|---|---|---|\n"
 
+# Split the pattern so task files can be recognized when listing the documents directory
+_TASKS_DIR = Path(TASKS_FILE_PATTERN).parent
+_TASKS_FILE_PREFIX, _TASKS_FILE_SUFFIX = Path(TASKS_FILE_PATTERN).name.split("{user_name}")
+
 def _get_task_file_path(user_name: str) -> Path:
     """Constructs the path to the user's task file using the configured pattern."""
     # Basic validation, could be expanded if needed
@@ -20,72 +40,276 @@ def _get_task_file_path(user_name: str) -> Path:
     # Use the configured pattern directly
     return Path(TASKS_FILE_PATTERN.format(user_name=user_name))
 
-def _read_tasks_from_file(file_path: Path, user_name: str) -> tuple[list[Task], str]:
-    """Reads tasks from the markdown file, returning Task objects and raw content."""
+# The two header lines, matched one line at a time while streaming
+_TASK_TABLE_HEADER_LINES = TASK_TABLE_HEADER.splitlines(keepends=True)
+
+def _iter_table_lines(lines: typing.Iterable[str]) -> typing.Iterator[str]:
+    """Yields the cleaned table lines (outer pipes stripped) following the task table header."""
+    header, separator = _TASK_TABLE_HEADER_LINES
+    lines = iter(lines)
+    for line in lines:
+        # endswith() mirrors the previous substring search for the header
+        if line.endswith(header) and next(lines, None) == separator:
+            break
+    else:
+        return # Header not found
+    for line in lines:
+        stripped = line.strip()
+        if stripped:
+            yield stripped.strip('|').strip() + "\n"
+
+def _iter_task_rows(lines: typing.Iterable[str]) -> typing.Iterator[list[str]]:
+    """Lazily parses task table rows into lists of cell strings, one input line at a time."""
+    for row in csv.reader(_iter_table_lines(lines), delimiter='|', skipinitialspace=True):
+        yield [cell.strip() for cell in row]
+
+def _iter_tasks(rows: typing.Iterable[list[str]]) -> typing.Iterator[TaskRecord]:
+    """Builds task records from parsed rows, skipping invalid rows.
+
+    On-disk rows are trusted data, so only the ID is converted; pydantic
+    validation is reserved for tool inputs coming from the LLM.
+    """
+    for row in rows:
+        if len(row) == 6:
+            try:
+                yield TaskRecord(int(row[0]), row[1], row[2], row[3], row[4], row[5])
+            except (ValueError, IndexError) as e:
+                print(f"Skipping invalid task row: {row} - Error: {e}")
+                continue
+        else:
+             print(f"Skipping row with incorrect column count: {row}")
+
+def _read_tasks_from_file(file_path: Path, user_name: str) -> tuple[list[TaskRecord], typing.Optional[str]]:
+    """Streams tasks from the markdown file in a single pass over its lines.
+
+    The raw content is not kept (None is returned in its place); it is read or
+    rendered on demand by _index_raw_content, since most callers never need it.
+    """
     tasks = []
-    # Use the user_name passed to the function for the header
-    default_header = f"# Task List for {user_name}\n\n{TASK_TABLE_HEADER}"
-    raw_content = default_header # Default content if file doesn't exist
-
     # Use the file_path directly as it's now correctly constructed by _get_task_file_path
     if not file_path.exists():
-        return tasks, raw_content # Return empty list and default header
+        return tasks, None
 
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            raw_content = f.read()
-            # Find the table content after the header and separator
-            table_start = raw_content.find(TASK_TABLE_HEADER)
-            if table_start == -1:
-                 return tasks, raw_content # Header not found, return raw content
-
-            table_content_start = table_start + len(TASK_TABLE_HEADER)
-            table_lines = raw_content[table_content_start:].strip().splitlines()
-
-            cleaned_lines = [line.strip().strip('|').strip() for line in table_lines if line.strip()]
-            if not cleaned_lines:
-                 return tasks, raw_content # No task rows
-
-            csv_data = io.StringIO("\n".join(cleaned_lines))
-            reader = csv.reader(csv_data, delimiter='|', skipinitialspace=True)
-
-            for row in reader:
-                cleaned_row = [cell.strip() for cell in row]
-                if len(cleaned_row) == 6:
-                    try:
-                        task = Task(
-                            task_id=int(cleaned_row[0]),
-                            title=cleaned_row[1],
-                            assignee=cleaned_row[2],
-                            deadline=cleaned_row[3],
-                            description=cleaned_row[4],
-                            status=cleaned_row[5]
-                        )
-                        tasks.append(task)
-                    except (ValueError, IndexError) as e:
-                        print(f"Skipping invalid task row: {row} - Error: {e}")
-                        continue
-                else:
-                     print(f"Skipping row with incorrect column count: {row}")
+            tasks.extend(_iter_tasks(_iter_task_rows(f)))
+            record_io(bytes_read=os.fstat(f.fileno()).st_size)
     except Exception as e:
         print(f"Error reading task file {file_path}: {e}")
-        # Return potentially partial raw_content read before error, or default header
-        return tasks, raw_content
+        # Return the tasks parsed before the error
+    return tasks, None
 
-    return tasks, raw_content
 
+def _render_tasks_markdown(tasks: list[TaskRecord], user_name: str) -> str:
+    """Renders tasks (in ascending ID order) as the canonical task list markdown."""
+    rows = [
+        f"| {task.task_id} | {task.title} | {task.assignee} | {task.deadline} | {task.description} | {task.status} |\n"
+        for task in tasks
+    ]
+    return f"# Task List for {user_name}\n\n{TASK_TABLE_HEADER}{''.join(rows)}"
 
-def _write_tasks_to_file(file_path: Path, tasks: list[Task], user_name: str):
-    """Writes the list of tasks back to the markdown file."""
-    # Directory creation is handled in config.py on import
+def _write_tasks_to_file(file_path: Path, tasks: list[TaskRecord], user_name: str) -> str:
+    """Writes the list of tasks back to the markdown file and returns the written content."""
+    # atomic_write_text creates the parent directory if needed
     # Use file_path directly
     tasks.sort(key=lambda t: t.task_id)
 
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(f"# Task List for {user_name}\n\n")
-        f.write(TASK_TABLE_HEADER)
-        for task in tasks:
-            f.write(f"| {task.task_id} | {task.title} | {task.assignee} | {task.deadline} | {task.description} | {task.status} |\n")
+    content = _render_tasks_markdown(tasks, user_name)
+    atomic_write_text(file_path, content)
+    return content
+
+def _load_task_list(file_path: Path, user_name: str) -> tuple[list[TaskRecord], typing.Optional[str]]:
+    """Reads the markdown table and replays any pending journal records on top of it."""
+    tasks, raw_content = _read_tasks_from_file(file_path, user_name)
+    by_id = {task.task_id: task for task in tasks}
+    if task_journal.replay(by_id, task_journal.read_records(file_path)):
+        # The file content is stale; let the store render it from the tasks when needed
+        return list(by_id.values()), None
+    return tasks, raw_content
+
+def _task_list_signature(file_path: Path):
+    """A task list changes whenever its markdown file or its journal changes."""
+    return file_signature(file_path), file_signature(task_journal.journal_path(file_path))
+
+# Parsed, ID-indexed task lists, re-validated against each file's (and journal's) mtime/size
+_task_store = TaskStore(_load_task_list, signature=_task_list_signature)
+
+def _compact_task_list(file_path: Path, index, user_name: str) -> str:
+    """Folds the journal back into the markdown table and removes it.
+
+    The table is written before the journal is removed; since replay is
+    idempotent, a crash in between leaves the list intact.
+    """
+    content = _write_tasks_to_file(file_path, index.tasks(), user_name)
+    task_journal.remove_journal(file_path)
+    return content
+
+def _record_task_mutations(file_path: Path, index, user_name: str, records: list[dict]):
+    """Persists mutations already applied to ``index`` as one journal append.
+
+    Must be called while holding ``file_lock(file_path)``.
+
+    Compacts the journal into the markdown file right away if it exceeds
+    TASKS_JOURNAL_MAX_BYTES or the markdown file does not exist yet (a new
+    list), and otherwise once the list has been idle for
+    TASKS_COMPACT_IDLE_SECONDS. Drops the cache entry if anything fails so
+    the next read re-parses from disk.
+    """
+    try:
+        content = None
+        journal_size = task_journal.append_records(file_path, records)
+        if journal_size >= TASKS_JOURNAL_MAX_BYTES or not file_path.exists():
+            content = _compact_task_list(file_path, index, user_name)
+    except Exception:
+        _task_store.invalidate(file_path)
+        raise
+    _task_store.mark_synced(file_path, raw_content=content)
+    if content is None:
+        _schedule_idle_compaction(file_path, user_name)
+
+def compact_task_list(user_name: str) -> bool:
+    """Compacts a user's task journal into the markdown table.
+
+    Returns:
+        bool: False if there was no journal to compact.
+    """
+    file_path = _get_task_file_path(user_name)
+    with file_lock(file_path), _task_store.locked(file_path):
+        if not task_journal.journal_path(file_path).exists():
+            return False
+        index = _task_store.load(file_path, user_name)
+        try:
+            content = _compact_task_list(file_path, index, user_name)
+        except Exception:
+            _task_store.invalidate(file_path)
+            raise
+        _task_store.mark_synced(file_path, raw_content=content)
+    return True
+
+# Pending idle compactions: task file -> the timer that compacts it
+_idle_compactions: dict[Path, threading.Timer] = {}
+_idle_compactions_lock = threading.Lock()
+
+def _schedule_idle_compaction(file_path: Path, user_name: str):
+    """(Re)starts the timer compacting a list once it has had no writes for TASKS_COMPACT_IDLE_SECONDS."""
+    if TASKS_COMPACT_IDLE_SECONDS <= 0:
+        return
+    timer = threading.Timer(TASKS_COMPACT_IDLE_SECONDS, _compact_when_idle, (file_path, user_name))
+    # A journal left behind at exit is replayed on the next load
+    timer.daemon = True
+    with _idle_compactions_lock:
+        previous = _idle_compactions.get(file_path)
+        if previous is not None:
+            previous.cancel()
+        _idle_compactions[file_path] = timer
+    timer.start()
+
+def _compact_when_idle(file_path: Path, user_name: str):
+    with _idle_compactions_lock:
+        if _idle_compactions.get(file_path) is not threading.current_thread():
+            return # A later write rescheduled it
+        del _idle_compactions[file_path]
+    try:
+        compact_task_list(user_name)
+    except Exception as e:
+        # The journal stays and is replayed; the next write schedules another attempt
+        print(f"Warning: Could not compact the task list of {user_name}: {e}")
+
+def task_list_user(file_name: str) -> typing.Optional[str]:
+    """The user a task list file (``tasks_<user>.md``, or its journal) belongs to, or None for other files."""
+    if file_name.endswith(TASKS_JOURNAL_SUFFIX):
+        file_name = file_name[:-len(TASKS_JOURNAL_SUFFIX)]
+    if (file_name.startswith(_TASKS_FILE_PREFIX) and file_name.endswith(_TASKS_FILE_SUFFIX)
+            and len(file_name) > len(_TASKS_FILE_PREFIX) + len(_TASKS_FILE_SUFFIX)):
+        return file_name[len(_TASKS_FILE_PREFIX):len(file_name) - len(_TASKS_FILE_SUFFIX)]
+    return None
+
+def list_task_users() -> list[str]:
+    """Returns the users that have a task list (or a pending journal) in the documents directory."""
+    users = set()
+    try:
+        entries = os.scandir(_TASKS_DIR)
+    except FileNotFoundError:
+        return []
+    with entries:
+        for entry in entries:
+            user_name = task_list_user(entry.name)
+            if user_name is not None:
+                users.add(user_name)
+    return sorted(users)
+
+def task_list_path(user_name: str) -> Path:
+    """The markdown file of a user's task list."""
+    return _get_task_file_path(user_name)
+
+def task_list_signature(user_name: str):
+    """Changes whenever a user's task list changes (its markdown file or its pending journal)."""
+    return _task_list_signature(_get_task_file_path(user_name))
+
+def render_task_list(user_name: str) -> str:
+    """The current markdown of a user's task list, including mutations still in the journal."""
+    file_path = _get_task_file_path(user_name)
+    with _task_store.locked(file_path):
+        return _render_tasks_markdown(_task_store.load(file_path, user_name).tasks(), user_name)
+
+# The ID cell of a task table row, e.g. "| 12 | Title | ..."
+_TASK_ROW_ID_RE = re.compile(r"^\|?\s*(\d+)\s*\|")
+
+def _max_task_id(file_path: Path) -> int:
+    """Highest task ID in a list, reading only the ID column and the journal.
+
+    Takes no lock: it runs while a writer holds its own list's locks, so
+    locking another list here could deadlock with that list's writer.
+    """
+    highest = 0
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                match = _TASK_ROW_ID_RE.match(line)
+                if match:
+                    highest = max(highest, int(match.group(1)))
+    except FileNotFoundError:
+        pass
+    return max(highest, task_journal.max_added_id(task_journal.read_records(file_path)))
+
+def _max_task_id_across_lists() -> int:
+    """Highest task ID in any list; only needed to seed a missing ID counter."""
+    return max((_max_task_id(_get_task_file_path(user)) for user in list_task_users()), default=0)
+
+# Team-wide task IDs, so an ID identifies one task across every list
+_task_ids = TaskIdAllocator(TASK_ID_COUNTER_FILE, bootstrap=_max_task_id_across_lists)
+
+def _index_raw_content(index, file_path: Path, user_name: str) -> str:
+    """Returns the raw markdown for an index, reading or rendering (and caching) it if needed.
+
+    The file itself is only returned when it is known to match the index (it
+    exists, no journal is pending and it has not changed since it was parsed);
+    otherwise the content is rendered from the tasks.
+    """
+    if index.raw_content is None:
+        file_signature_at_load, journal_signature_at_load = index.signature
+        raw_content = None
+        if (file_signature_at_load is not None and journal_signature_at_load is None
+                and _task_list_signature(file_path) == index.signature):
+            try:
+                raw_content = read_text(file_path)
+            except OSError as e:
+                print(f"Error reading task file {file_path}: {e}")
+        if raw_content is None:
+            raw_content = _render_tasks_markdown(index.tasks(), user_name)
+        index.raw_content = raw_content
+    return index.raw_content
+
+def _validate_edit_request(action: str, updates: typing.Optional[dict]):
+    """Raises ValueError if an edit action/updates combination is invalid."""
+    if action not in ['modify', 'delete']:
+        raise ValueError("Invalid action specified. Must be 'modify' or 'delete'.")
+    if action == 'modify':
+        if updates is None or not isinstance(updates, dict) or not updates:
+             raise ValueError("Modification action requires a non-empty 'updates' dictionary.")
+        invalid_keys = set(updates.keys()) - EDITABLE_TASK_FIELDS
+        if invalid_keys:
+             raise ValueError(f"Invalid keys found in 'updates' dictionary: {', '.join(invalid_keys)}")
 
 # Removed incorrect @tool decorator
 def read_task_list(user_name: str):
@@ -100,12 +324,17 @@ def read_task_list(user_name: str):
     """
     try:
         file_path = _get_task_file_path(user_name)
-        # Pass user_name to _read_tasks_from_file for correct header generation if file is new/empty
-        tasks, raw_content = _read_tasks_from_file(file_path, user_name)
-        result_model = TaskListResult(tasks=tasks, raw_content=raw_content)
+        # The store passes user_name on to _read_tasks_from_file; the header for a new/empty list is rendered from it
+        with _task_store.locked(file_path):
+            index = _task_store.load(file_path, user_name)
+            # Serialized directly (same shape as TaskListResult) to skip re-validating every row
+            result = {
+                "tasks": [task._asdict() for task in index.tasks()],
+                "raw_content": _index_raw_content(index, file_path, user_name),
+            }
         return {
             "status": "success",
-            "result": result_model.model_dump()
+            "result": result
         }
     except ValueError as e: # Catch specific error from _get_task_file_path
          return {"status": "error", "error_message": str(e)}
@@ -115,6 +344,185 @@ def read_task_list(user_name: str):
             "error_message": f"Failed to read task list for {user_name}: {str(e)}"
         }
 
+def _cursor_offset(cursor: typing.Optional[str]) -> int:
+    """Decodes a pagination cursor (the offset of the next page)."""
+    if not cursor:
+        return 0
+    if not cursor.isdigit():
+        raise ValueError(f"Invalid cursor: '{cursor}'.")
+    return int(cursor)
+
+def _matching_tasks(index, query: TaskFilterInput) -> list[TaskRecord]:
+    """Returns the tasks in ``index`` matching the query filters, in ascending ID order."""
+    matches = [index.by_id[task_id] for task_id in index.select(
+        assignee=query.assignee, status=query.status,
+        deadline_from=query.deadline_from, deadline_to=query.deadline_to,
+    )]
+    if query.text:
+        needle = query.text.casefold()
+        matches = [task for task in matches
+                   if needle in task.title.casefold() or needle in task.description.casefold()]
+    return matches
+
+def _project_task(task: TaskRecord, fields: typing.Optional[list[str]]) -> dict:
+    """Converts a task to a dict, keeping only the requested fields (plus task_id)."""
+    if fields:
+        keep = {"task_id", *fields}
+        return {name: value for name, value in zip(TaskRecord._fields, task) if name in keep}
+    return task._asdict()
+
+def query_tasks(
+    user_name: str,
+    assignee: typing.Optional[str] = None,
+    status: typing.Optional[str] = None,
+    deadline_from: typing.Optional[str] = None,
+    deadline_to: typing.Optional[str] = None,
+    text: typing.Optional[str] = None,
+    sort_by: str = "task_id",
+    descending: bool = False,
+    limit: int = 20,
+    cursor: typing.Optional[str] = None,
+    fields: typing.Optional[list[str]] = None,
+    include_raw_content: bool = False,
+):
+    """
+    Finds tasks in the specified user's list by filter, returning one page of results.
+
+    Prefer this over 'read_task_list' when looking for specific tasks: it returns
+    only the matching tasks (and only the requested fields) instead of the whole list.
+
+    Args:
+        user_name (str): The name of the user whose list to query ('Philipp' or 'Guillaume').
+        assignee (typing.Optional[str]): Only tasks assigned to this person (case-insensitive).
+        status (typing.Optional[str]): Only tasks with this status, e.g. 'Pending' or 'Done' (case-insensitive).
+        deadline_from (typing.Optional[str]): Only tasks due on or after this date (YYYY-MM-DD).
+        deadline_to (typing.Optional[str]): Only tasks due on or before this date (YYYY-MM-DD).
+        text (typing.Optional[str]): Only tasks whose title or description contains this text (case-insensitive).
+        sort_by (str): 'task_id' (default), 'title', 'assignee', 'deadline' or 'status'.
+        descending (bool): Sort in descending order.
+        limit (int): Maximum number of tasks to return (1-200, default 20).
+        cursor (typing.Optional[str]): The 'next_cursor' from a previous call, to get the next page.
+        fields (typing.Optional[list[str]]): Task fields to return; 'task_id' is always included.
+        include_raw_content (bool): Also return the raw markdown of the whole list (large; off by default).
+
+    Returns:
+        dict: A dictionary with status and result (TaskQueryResult) or error_message.
+    """
+    try:
+        query = QueryTasksInput(
+            user_name=user_name, assignee=assignee, status=status,
+            deadline_from=deadline_from, deadline_to=deadline_to, text=text,
+            sort_by=sort_by, descending=descending, limit=limit, cursor=cursor,
+            fields=fields, include_raw_content=include_raw_content,
+        )
+        offset = _cursor_offset(query.cursor)
+
+        file_path = _get_task_file_path(query.user_name)
+        with _task_store.locked(file_path):
+            index = _task_store.load(file_path, query.user_name)
+            matches = _matching_tasks(index, query)
+            # Matches are already in ascending ID order
+            if query.sort_by != "task_id":
+                matches.sort(key=lambda task: (getattr(task, query.sort_by), task.task_id), reverse=query.descending)
+            elif query.descending:
+                matches.reverse()
+
+            page = matches[offset:offset + query.limit]
+            next_offset = offset + len(page)
+            # Built from trusted data, so model_construct skips re-validating every task
+            result = TaskQueryResult.model_construct(
+                tasks=[_project_task(task, query.fields) for task in page],
+                total_matches=len(matches),
+                next_cursor=str(next_offset) if next_offset < len(matches) else None,
+                raw_content=_index_raw_content(index, file_path, query.user_name) if query.include_raw_content else None,
+            ).model_dump()
+        return {
+            "status": "success",
+            "result": result
+        }
+    except (ValidationError, ValueError) as e:
+        return {"status": "error", "error_message": f"Invalid query: {str(e)}"}
+    except Exception as e:
+        return {
+            "status": "error",
+            "error_message": f"Failed to query task list for {user_name}: {str(e)}"
+        }
+
+def query_team_tasks(
+    assignee: typing.Optional[str] = None,
+    status: typing.Optional[str] = None,
+    deadline_from: typing.Optional[str] = None,
+    deadline_to: typing.Optional[str] = None,
+    text: typing.Optional[str] = None,
+    user_names: typing.Optional[list[str]] = None,
+    sort_by: str = "deadline",
+    descending: bool = False,
+    limit: int = 20,
+    cursor: typing.Optional[str] = None,
+    fields: typing.Optional[list[str]] = None,
+):
+    """
+    Finds tasks across the task lists of the whole team in a single call.
+
+    Use this for team-wide questions such as "everything due this week" instead
+    of querying each user's list separately. Each returned task includes the
+    'user_name' of the list it belongs to (needed for 'edit_task').
+
+    Args:
+        assignee (typing.Optional[str]): Only tasks assigned to this person (case-insensitive).
+        status (typing.Optional[str]): Only tasks with this status, e.g. 'Pending' or 'Done' (case-insensitive).
+        deadline_from (typing.Optional[str]): Only tasks due on or after this date (YYYY-MM-DD).
+        deadline_to (typing.Optional[str]): Only tasks due on or before this date (YYYY-MM-DD).
+        text (typing.Optional[str]): Only tasks whose title or description contains this text (case-insensitive).
+        user_names (typing.Optional[list[str]]): Only search these users' lists; all lists if omitted.
+        sort_by (str): 'deadline' (default), 'task_id', 'title', 'assignee' or 'status'.
+        descending (bool): Sort in descending order.
+        limit (int): Maximum number of tasks to return (1-200, default 20).
+        cursor (typing.Optional[str]): The 'next_cursor' from a previous call, to get the next page.
+        fields (typing.Optional[list[str]]): Task fields to return; 'task_id' and 'user_name' are always included.
+
+    Returns:
+        dict: A dictionary with status and result (TaskQueryResult) or error_message.
+    """
+    try:
+        query = QueryTeamTasksInput(
+            assignee=assignee, status=status,
+            deadline_from=deadline_from, deadline_to=deadline_to, text=text,
+            user_names=user_names, sort_by=sort_by, descending=descending,
+            limit=limit, cursor=cursor, fields=fields,
+        )
+        offset = _cursor_offset(query.cursor)
+
+        matches: list[tuple[str, TaskRecord]] = []
+        for user in (query.user_names if query.user_names is not None else list_task_users()):
+            file_path = _get_task_file_path(user)
+            with _task_store.locked(file_path):
+                index = _task_store.load(file_path, user)
+                matches.extend((user, task) for task in _matching_tasks(index, query))
+        matches.sort(key=lambda item: (getattr(item[1], query.sort_by), item[1].task_id, item[0]),
+                     reverse=query.descending)
+
+        page = matches[offset:offset + query.limit]
+        next_offset = offset + len(page)
+        # Built from trusted data, so model_construct skips re-validating every task
+        result = TaskQueryResult.model_construct(
+            tasks=[{"user_name": user, **_project_task(task, query.fields)} for user, task in page],
+            total_matches=len(matches),
+            next_cursor=str(next_offset) if next_offset < len(matches) else None,
+            raw_content=None,
+        ).model_dump()
+        return {
+            "status": "success",
+            "result": result
+        }
+    except (ValidationError, ValueError) as e:
+        return {"status": "error", "error_message": f"Invalid query: {str(e)}"}
+    except Exception as e:
+        return {
+            "status": "error",
+            "error_message": f"Failed to query team task lists: {str(e)}"
+        }
+
 # Removed incorrect @tool decorator
 def write_task(task_title: str, assignee: str, deadline: str, description: str, user_name: str):
     """
@@ -140,22 +548,21 @@ def write_task(task_title: str, assignee: str, deadline: str, description: str,
         )
 
         file_path = _get_task_file_path(validated_input.user_name)
-        # Pass user_name to _read_tasks_from_file
-        tasks, _ = _read_tasks_from_file(file_path, validated_input.user_name)
-
-        next_id = (max(task.task_id for task in tasks) + 1) if tasks else 1
-
-        new_task = Task(
-            task_id=next_id,
-            title=validated_input.task_title,
-            assignee=validated_input.assignee,
-            deadline=validated_input.deadline,
-            description=validated_input.description,
-            status="Pending"
-        )
-        tasks.append(new_task)
-
-        _write_tasks_to_file(file_path, tasks, validated_input.user_name)
+        # Hold the cross-process lock so the load below sees every other writer's changes
+        with file_lock(file_path), _task_store.locked(file_path):
+            index = _task_store.load(file_path, validated_input.user_name)
+
+            new_task = TaskRecord(
+                task_id=_task_ids.allocate(floor=index.max_id)[0],
+                title=validated_input.task_title,
+                assignee=validated_input.assignee,
+                deadline=validated_input.deadline,
+                description=validated_input.description,
+                status="Pending"
+            )
+            index.add(new_task)
+
+            _record_task_mutations(file_path, index, validated_input.user_name, [task_journal.add_record(new_task)])
 
         result_model = TaskOperationResult(
             status="success",
@@ -188,42 +595,25 @@ def edit_task(task_id: int, action: str, user_name: str, updates: typing.Optiona
     """
     try:
         # --- Input Validation ---
-        if action not in ['modify', 'delete']:
-            raise ValueError("Invalid action specified. Must be 'modify' or 'delete'.")
-        if action == 'modify':
-            if updates is None or not isinstance(updates, dict) or not updates:
-                 raise ValueError("Modification action requires a non-empty 'updates' dictionary.")
-            valid_keys = {'title', 'assignee', 'deadline', 'description', 'status'}
-            invalid_keys = set(updates.keys()) - valid_keys
-            if invalid_keys:
-                 raise ValueError(f"Invalid keys found in 'updates' dictionary: {', '.join(invalid_keys)}")
+        _validate_edit_request(action, updates)
 
         file_path = _get_task_file_path(user_name)
-        # Pass user_name to _read_tasks_from_file
-        tasks, _ = _read_tasks_from_file(file_path, user_name)
-
-        task_found = False
-        updated_tasks = []
-        affected_task_title = ""
-
-        for task in tasks:
-            if task.task_id == task_id:
-                task_found = True
-                affected_task_title = task.title
-                if action == 'modify':
-                    for key, value in updates.items():
-                         if hasattr(task, key) and value is not None:
-                             setattr(task, key, value)
-                    updated_tasks.append(task)
-                elif action == 'delete':
-                    pass # Skip task
-            else:
-                updated_tasks.append(task)
-
-        if not task_found:
-            return TaskOperationResult(status="error", message=f"Task with ID {task_id} not found in {user_name}'s list.", task_id=task_id).model_dump()
-
-        _write_tasks_to_file(file_path, updated_tasks, user_name)
+        with file_lock(file_path), _task_store.locked(file_path):
+            index = _task_store.load(file_path, user_name)
+
+            task = index.get(task_id)
+            if task is None:
+                return TaskOperationResult(status="error", message=f"Task with ID {task_id} not found in {user_name}'s list.", task_id=task_id).model_dump()
+
+            affected_task_title = task.title
+            if action == 'modify':
+                index.update(task_id, updates)
+                record = task_journal.modify_record(task_id, updates)
+            elif action == 'delete':
+                index.remove(task_id)
+                record = task_journal.delete_record(task_id)
+
+            _record_task_mutations(file_path, index, user_name, [record])
 
         action_verb = "modified" if action == 'modify' else "deleted"
         result_model = TaskOperationResult(
@@ -237,3 +627,184 @@ def edit_task(task_id: int, action: str, user_name: str, updates: typing.Optiona
          return TaskOperationResult(status="error", message=f"Operation error: {str(e)}", task_id=task_id).model_dump()
     except Exception as e:
         return TaskOperationResult(status="error", message=f"Failed to {action} task {task_id} for {user_name}: {str(e)}", task_id=task_id).model_dump()
+
+
+def _rejected_batch(results: list[BulkTaskItemResult], summary: str) -> dict:
+    """Builds the result for a batch that was rolled back because some items failed."""
+    for item in results:
+        if item.status == "success":
+            item.status = "not_applied"
+            item.message = "Valid, but not applied because other items in the batch failed."
+    failed = sum(1 for item in results if item.status == "error")
+    return BulkTaskOperationResult(
+        status="error",
+        message=f"{summary}: {failed} of {len(results)} items failed, no changes were made.",
+        results=results
+    ).model_dump()
+
+def write_tasks_bulk(user_name: str, tasks: list[dict]):
+    """
+    Adds several tasks to the specified user's task list in one operation.
+
+    All tasks are added or none are: if any item is invalid, nothing is written
+    and the per-item results show which items failed.
+
+    Args:
+        user_name (str): The name of the user whose list to modify ('Philipp' or 'Guillaume').
+        tasks (list[dict]): The tasks to add. Each dictionary needs 'task_title',
+            'assignee', 'deadline' (YYYY-MM-DD) and 'description'.
+
+    Returns:
+        dict: A dictionary representing BulkTaskOperationResult.
+    """
+    try:
+        file_path = _get_task_file_path(user_name)
+
+        # --- Validate every item before touching the list ---
+        results = []
+        validated_items = []
+        for i, item in enumerate(tasks):
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("Each task must be a dictionary.")
+                validated_items.append(NewTaskInput(**item))
+                results.append(BulkTaskItemResult(index=i, status="success", message="Valid."))
+            except (ValidationError, ValueError) as e:
+                results.append(BulkTaskItemResult(index=i, status="error", message=f"Invalid input: {str(e)}"))
+        if any(item.status == "error" for item in results):
+            return _rejected_batch(results, f"Failed to add tasks to {user_name}'s list")
+        # The items are valid; this checks the request as a whole (e.g. that it is not empty)
+        request = WriteTasksBulkInput(user_name=user_name, tasks=validated_items)
+
+        with file_lock(file_path), _task_store.locked(file_path):
+            index = _task_store.load(file_path, user_name)
+            new_ids = _task_ids.allocate(len(request.tasks), floor=index.max_id)
+            records = []
+            for task_id, item_result, validated_input in zip(new_ids, results, request.tasks):
+                new_task = TaskRecord(
+                    task_id=task_id,
+                    title=validated_input.task_title,
+                    assignee=validated_input.assignee,
+                    deadline=validated_input.deadline,
+                    description=validated_input.description,
+                    status="Pending"
+                )
+                index.add(new_task)
+                records.append(task_journal.add_record(new_task))
+                item_result.task_id = new_task.task_id
+                item_result.message = f"Added task '{new_task.title}' (ID: {new_task.task_id})."
+
+            # One journal line for the whole batch keeps it all-or-nothing on disk
+            _record_task_mutations(file_path, index, user_name, [task_journal.batch_record(records)])
+
+        return BulkTaskOperationResult(
+            status="success",
+            message=f"Successfully added {len(results)} tasks to {user_name}'s list.",
+            results=results
+        ).model_dump()
+
+    except (ValidationError, ValueError) as e:
+        return BulkTaskOperationResult(status="error", message=f"Invalid input: {str(e)}").model_dump()
+    except Exception as e:
+        return BulkTaskOperationResult(status="error", message=f"Failed to add tasks for {user_name}: {str(e)}").model_dump()
+
+def edit_tasks_bulk(user_name: str, operations: list[dict]):
+    """
+    Modifies and/or deletes several tasks in the specified user's list in one operation.
+
+    All operations are applied or none are: if any operation is invalid or
+    targets a task that does not exist, nothing is changed and the per-item
+    results show which operations failed. Operations apply in order, so a task
+    deleted earlier in the batch cannot be modified later in it.
+
+    Args:
+        user_name (str): The name of the user whose list to modify ('Philipp' or 'Guillaume').
+        operations (list[dict]): The operations to apply. Each dictionary needs
+            'task_id' and 'action' ('modify' or 'delete'); 'modify' also needs an
+            'updates' dictionary (valid keys: 'title', 'assignee', 'deadline',
+            'description', 'status').
+
+    Returns:
+        dict: A dictionary representing BulkTaskOperationResult.
+    """
+    try:
+        file_path = _get_task_file_path(user_name)
+
+        # --- Validate the shape of every operation first ---
+        results = []
+        validated_ops = []
+        for i, item in enumerate(operations):
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("Each operation must be a dictionary.")
+                operation = TaskEditOperation(**item)
+                _validate_edit_request(operation.action, operation.updates)
+                validated_ops.append(operation)
+                results.append(BulkTaskItemResult(index=i, status="success", message="Valid.", task_id=operation.task_id))
+            except (ValidationError, ValueError) as e:
+                results.append(BulkTaskItemResult(index=i, status="error", message=f"Invalid input: {str(e)}",
+                                                  task_id=item.get("task_id") if isinstance(item, dict) else None))
+        if any(item.status == "error" for item in results):
+            return _rejected_batch(results, f"Failed to edit tasks in {user_name}'s list")
+        # The operations are valid; this checks the request as a whole (e.g. that it is not empty)
+        request = EditTasksBulkInput(user_name=user_name, operations=validated_ops)
+
+        with file_lock(file_path), _task_store.locked(file_path):
+            index = _task_store.load(file_path, user_name)
+
+            # --- Check every target exists (accounting for deletes earlier in the batch) ---
+            deleted_ids = set()
+            for item_result, operation in zip(results, request.operations):
+                if operation.task_id not in index or operation.task_id in deleted_ids:
+                    item_result.status = "error"
+                    item_result.message = f"Task with ID {operation.task_id} not found in {user_name}'s list."
+                elif operation.action == 'delete':
+                    deleted_ids.add(operation.task_id)
+            if any(item.status == "error" for item in results):
+                return _rejected_batch(results, f"Failed to edit tasks in {user_name}'s list")
+
+            # --- Apply ---
+            records = []
+            for item_result, operation in zip(results, request.operations):
+                title = index.get(operation.task_id).title
+                if operation.action == 'modify':
+                    index.update(operation.task_id, operation.updates)
+                    records.append(task_journal.modify_record(operation.task_id, operation.updates))
+                    item_result.message = f"Modified task '{title}' (ID: {operation.task_id})."
+                else:
+                    index.remove(operation.task_id)
+                    records.append(task_journal.delete_record(operation.task_id))
+                    item_result.message = f"Deleted task '{title}' (ID: {operation.task_id})."
+
+            _record_task_mutations(file_path, index, user_name, [task_journal.batch_record(records)])
+
+        return BulkTaskOperationResult(
+            status="success",
+            message=f"Successfully applied {len(results)} operations to {user_name}'s list.",
+            results=results
+        ).model_dump()
+
+    except (ValidationError, ValueError) as e:
+        return BulkTaskOperationResult(status="error", message=f"Operation error: {str(e)}").model_dump()
+    except Exception as e:
+        return BulkTaskOperationResult(status="error", message=f"Failed to edit tasks for {user_name}: {str(e)}").model_dump()
+
+
+def compact_all_task_lists() -> list[str]:
+    """Compacts every task list with a pending journal; returns the users whose list was compacted."""
+    return [user for user in list_task_users() if compact_task_list(user)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m test_agents tasks",
+                                     description="Maintain the task lists.")
+    parser.add_argument("command", choices=("compact",),
+                        help="Fold pending mutation journals back into the markdown tables")
+    parser.add_argument("--user", help="Only this user's list (default: every list)")
+    args = parser.parse_args(argv)
+    if args.user:
+        users = [args.user] if compact_task_list(args.user) else []
+    else:
+        users = compact_all_task_lists()
+    print(f"Compacted {len(users)} task lists" + (f": {', '.join(users)}" if users else ""))
+    return 0
@@ -3,7 +3,13 @@ import datetime
 from pathlib import Path # Use pathlib
 from ..models import ToolResult
 # Import configured directory paths
-from ..config import MEETINGS_DIR, PROFILES_DIR
+from ..config import MEETINGS_DIR, PROFILES_DIR, MEETING_INDEX_FILE
+from .document_io import atomic_write_text, file_lock
+from .file_cache import read_text
+from .meeting_index import MeetingIndex
+
+# Metadata/keyword index of the meeting logs, refreshed incrementally on each query
+_meeting_index = MeetingIndex(MEETINGS_DIR, MEETING_INDEX_FILE)
 
 def _validate_date_format(date_str: str) -> bool:
     """Helper to validate YYYY-MM-DD format."""
@@ -33,13 +39,9 @@ def read_meeting_log(meeting_date: str) -> dict:
     file_path = MEETINGS_DIR / f"{meeting_date}.md"
 
     try:
-        # Directory creation handled in config.py
-        # Check if file exists before reading
-        if not file_path.is_file():
-            raise FileNotFoundError(f"Meeting log for date '{meeting_date}' not found at '{file_path}'.")
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Runtime directories are created by config.ensure_document_dirs()
+        # Served from memory unless the log changed since it was last read
+        content = read_text(file_path)
         return ToolResult(
             status="success",
             result={"log_content": content}
@@ -47,7 +49,7 @@ def read_meeting_log(meeting_date: str) -> dict:
     except FileNotFoundError:
         return ToolResult(
             status="error",
-            error_message=str(e) # Use error message from FileNotFoundError
+            error_message=f"Meeting log for date '{meeting_date}' not found at '{file_path}'."
         ).model_dump()
     except Exception as e:
         return ToolResult(
@@ -83,9 +85,11 @@ def write_meeting_log(meeting_date: str, participants: list[str], content: str)
                    f"## Notes\n{content}\n"
 
     try:
-        # Directory creation handled in config.py
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(full_content)
+        # Runtime directories are created by config.ensure_document_dirs()
+        # Readers see either the previous log or the new one, never a truncated file
+        with file_lock(file_path):
+            atomic_write_text(file_path, full_content)
+        _meeting_index.update(meeting_date)
         return ToolResult(
             status="success",
             result={"message": f"Meeting log for {meeting_date} saved successfully."}
@@ -96,6 +100,104 @@ def write_meeting_log(meeting_date: str, participants: list[str], content: str)
             error_message=f"An unexpected error occurred while writing meeting log '{file_path.name}': {str(e)}"
         ).model_dump()
 
+def _invalid_optional_date(name: str, value: typing.Optional[str]) -> typing.Optional[dict]:
+    """Returns an error result if an optional date argument is set but not YYYY-MM-DD."""
+    if value is not None and not _validate_date_format(value):
+        return ToolResult(
+            status="error",
+            error_message=f"Invalid date format for {name}: '{value}'. Please use YYYY-MM-DD."
+        ).model_dump()
+    return None
+
+def list_meetings(start_date: typing.Optional[str] = None, end_date: typing.Optional[str] = None,
+                  participant: typing.Optional[str] = None) -> dict:
+    """
+    Lists the recorded meetings (oldest first) without reading the log contents.
+
+    Args:
+        start_date: Only meetings on or after this date (format: YYYY-MM-DD).
+        end_date: Only meetings on or before this date (format: YYYY-MM-DD).
+        participant: Only meetings this person attended (case-insensitive, partial names match).
+
+    Returns:
+        A dictionary containing the status and, per meeting, its date, participants, section headings,
+        size and last modification time, or an error message.
+    """
+    for name, value in (("start_date", start_date), ("end_date", end_date)):
+        error = _invalid_optional_date(name, value)
+        if error:
+            return error
+    try:
+        meetings = [entry.summary() for entry in _meeting_index.meetings(start_date, end_date, participant)]
+        return ToolResult(
+            status="success",
+            result={"meetings": meetings, "count": len(meetings)}
+        ).model_dump()
+    except Exception as e:
+        return ToolResult(
+            status="error",
+            error_message=f"An unexpected error occurred while listing meeting logs: {str(e)}"
+        ).model_dump()
+
+def latest_meeting() -> dict:
+    """
+    Reads the most recent meeting log. Use this when the user refers to 'the last meeting'.
+
+    Returns:
+        A dictionary containing the status, the meeting's date, participants and log content, or an error message.
+    """
+    try:
+        entry = _meeting_index.latest()
+        if entry is None:
+            return ToolResult(
+                status="error",
+                error_message=f"No meeting logs found in '{MEETINGS_DIR}'."
+            ).model_dump()
+        content = read_text(MEETINGS_DIR / f"{entry.date}.md")
+        return ToolResult(
+            status="success",
+            result={**entry.summary(), "log_content": content}
+        ).model_dump()
+    except Exception as e:
+        return ToolResult(
+            status="error",
+            error_message=f"An unexpected error occurred while reading the latest meeting log: {str(e)}"
+        ).model_dump()
+
+def search_meetings(query: str, start_date: typing.Optional[str] = None, end_date: typing.Optional[str] = None,
+                    limit: int = 5) -> dict:
+    """
+    Finds the meeting logs that mention the given keywords, best match first.
+
+    Args:
+        query: The keywords to look for (e.g., 'budget hiring').
+        start_date: Only meetings on or after this date (format: YYYY-MM-DD).
+        end_date: Only meetings on or before this date (format: YYYY-MM-DD).
+        limit: The maximum number of meetings to return (1-50).
+
+    Returns:
+        A dictionary containing the status and the matching meetings (date, participants, headings,
+        matched keywords and score), or an error message. Use `read_meeting_log` to read a match in full.
+    """
+    if not query or not query.strip():
+        return ToolResult(status="error", error_message="A non-empty search query is required.").model_dump()
+    for name, value in (("start_date", start_date), ("end_date", end_date)):
+        error = _invalid_optional_date(name, value)
+        if error:
+            return error
+    try:
+        hits = _meeting_index.search(query, start_date, end_date, limit=max(1, min(int(limit), 50)))
+        meetings = [{**entry.summary(), "matched_terms": terms, "score": score} for entry, score, terms in hits]
+        return ToolResult(
+            status="success",
+            result={"meetings": meetings, "count": len(meetings)}
+        ).model_dump()
+    except Exception as e:
+        return ToolResult(
+            status="error",
+            error_message=f"An unexpected error occurred while searching meeting logs: {str(e)}"
+        ).model_dump()
+
 def read_team_profile(member_name: typing.Literal["Philipp", "Guillaume"]) -> dict:
     """
     Reads the profile content for a specific team member using paths defined in config.py.
@@ -110,17 +212,15 @@ def read_team_profile(member_name: typing.Literal["Philipp", "Guillaume"]) -> di
     file_path = PROFILES_DIR / f"{member_name}.md"
 
     try:
-        # Directory creation handled in config.py
-        # Check if file exists before reading
-        if not file_path.is_file():
-             # If profile doesn't exist, return default content instead of error
-             content = f"# Profile: {member_name}\n\n(No details added yet.)"
-        else:
-             with open(file_path, 'r', encoding='utf-8') as f:
-                 content = f.read()
-             # Add default content if file exists but is empty
-             if not content.strip():
-                 content = f"# Profile: {member_name}\n\n(No details added yet.)"
+        # Runtime directories are created by config.ensure_document_dirs()
+        try:
+            content = read_text(file_path)
+        except FileNotFoundError:
+            # If profile doesn't exist, return default content instead of error
+            content = ""
+        # Add default content if the file is missing or empty
+        if not content.strip():
+            content = f"# Profile: {member_name}\n\n(No details added yet.)"
 
         return ToolResult(
             status="success",
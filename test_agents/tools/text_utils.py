@@ -0,0 +1,38 @@
+"""Small text helpers shared by the document indexes."""
+import re
+import typing
+
+_WORD_RE = re.compile(r"[^\W_]+(?:['’-][^\W_]+)*")
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+
+
+def tokenize(text: str) -> list[str]:
+    """Splits text into casefolded word tokens (letters/digits, keeping inner ' and -)."""
+    return [match.group(0).casefold() for match in _WORD_RE.finditer(text)]
+
+
+def unique_tokens(text: str) -> list[str]:
+    """Tokens of ``text`` without duplicates, in order of first occurrence."""
+    return list(dict.fromkeys(tokenize(text)))
+
+
+def strip_html_comments(text: str) -> str:
+    """Removes ``<!-- -->`` comments (e.g. template guidance), keeping line numbers stable."""
+    return _HTML_COMMENT_RE.sub(lambda m: "\n" * m.group(0).count("\n"), text)
+
+
+def iter_markdown_headings(lines: typing.Iterable[str]) -> typing.Iterator[tuple[int, str]]:
+    """Yields ``(level, title)`` for each ATX heading (``# Title``) outside code fences."""
+    in_fence = False
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("```") or stripped.startswith("~~~"):
+            in_fence = not in_fence
+            continue
+        if in_fence or not stripped.startswith("#"):
+            continue
+        level = len(stripped) - len(stripped.lstrip("#"))
+        title = stripped[level:]
+        # "#hashtag" is not a heading; "#" alone is an empty one
+        if level <= 6 and (not title or title[0].isspace()):
+            yield level, title.strip().rstrip("#").strip()
@@ -0,0 +1,194 @@
+"""Vector index over the partnership document sections for value-alignment lookups.
+
+Every section of the partnership agreement and companion (its own text, up to
+the next heading) is turned into a hashed TF-IDF vector: word unigrams and
+bigrams are hashed into ``DIMENSIONS`` buckets, weighted by sublinear term
+frequency and inverse document frequency, and L2-normalized. The vectors are
+stored as a float32 NumPy matrix in ``VALUE_INDEX_DIR`` and memory-mapped, so
+finding the principles relevant to a plan is a single matrix-vector product
+(cosine similarity) instead of sending the whole constitution to the LLM.
+
+The matrix is rebuilt only when one of the source documents changes (by
+``(inode, mtime, size)``); other processes pick up the rebuilt files on their
+next lookup.
+"""
+import io
+import json
+import threading
+import typing
+import zlib
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from .document_io import atomic_write_bytes, atomic_write_text, file_lock
+from .file_cache import read_text
+from .markdown_sections import parse_section_tree
+from .task_store import file_signature
+from .text_utils import strip_html_comments, tokenize
+
+_INDEX_VERSION = 1
+# Number of hash buckets (columns of the matrix)
+DIMENSIONS = 2 ** 13
+
+# Too common to say anything about which value a text relates to
+_STOPWORDS = frozenset("""
+a an and are as at be been but by can could do does for from had has have how i if in into is it its
+may might must no not of on or our ours shall should so such than that the their them then there these
+they this those to us was we were what when where which while who will with would you your
+""".split())
+
+
+class ValueSection(typing.NamedTuple):
+    """A row of the index: one section of a partnership document."""
+    document_type: str
+    title: str
+    path: str
+    line: int
+    content: str
+
+
+def _features(text: str) -> Counter:
+    """Hashed unigram + bigram counts of a text (stable across processes, unlike ``hash()``)."""
+    tokens = [token for token in tokenize(text) if token not in _STOPWORDS]
+    grams = tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+    return Counter(zlib.crc32(gram.encode('utf-8')) % DIMENSIONS for gram in grams)
+
+
+def _weighted(features: Counter, idf: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sublinear TF-IDF weights of a feature count, as (bucket indices, values)."""
+    indices = np.fromiter(features.keys(), dtype=np.int64, count=len(features))
+    counts = np.fromiter(features.values(), dtype=np.float32, count=len(features))
+    return indices, (1 + np.log(counts)) * idf[indices]
+
+
+def extract_sections(document_type: str, content: str) -> list[ValueSection]:
+    """Splits a document into sections holding only their own text (up to the next heading)."""
+    tree = parse_section_tree(strip_html_comments(content))
+    sections = []
+    for position, section in enumerate(tree.sections):
+        end = tree.sections[position + 1].start if position + 1 < len(tree.sections) else len(tree.lines)
+        body = "".join(tree.lines[section.start + 1:end]).strip()
+        if body:
+            sections.append(ValueSection(
+                document_type=document_type,
+                title=section.title,
+                path=" > ".join(section.path),
+                line=section.start + 1,
+                content=f"{tree.lines[section.start].strip()}\n{body}\n",
+            ))
+    return sections
+
+
+class ValueIndex:
+    """Memory-mapped hashed TF-IDF matrix over the sections of a set of documents."""
+
+    def __init__(self, index_dir: typing.Union[str, Path], documents: dict[str, typing.Union[str, Path]]):
+        self.index_dir = Path(index_dir)
+        self.documents = {document_type: Path(path) for document_type, path in documents.items()}
+        self._meta_path = self.index_dir / "meta.json"
+        self._vectors_path = self.index_dir / "vectors.npy"
+        self._idf_path = self.index_dir / "idf.npy"
+        self._meta: typing.Optional[dict] = None
+        self._sections: list[ValueSection] = []
+        self._vectors: typing.Optional[np.ndarray] = None
+        self._idf: typing.Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    def _source_signatures(self) -> dict[str, typing.Any]:
+        # JSON round trip form (lists), so it compares equal to what meta.json holds
+        return {document_type: list(signature) if signature else None
+                for document_type, signature in ((t, file_signature(p)) for t, p in self.documents.items())}
+
+    def _load(self) -> bool:
+        """Loads (memory-maps) the index files written by ``_build``; False if missing or unusable."""
+        try:
+            with open(self._meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get("version") != _INDEX_VERSION or meta.get("dimensions") != DIMENSIONS:
+                return False
+            sections = [ValueSection(**section) for section in meta["sections"]]
+            if sections:
+                vectors = np.load(self._vectors_path, mmap_mode='r')
+            else:
+                # An empty .npy cannot be memory-mapped
+                vectors = np.zeros((0, DIMENSIONS), dtype=np.float32)
+            idf = np.load(self._idf_path)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Ignoring unusable value index in {self.index_dir}: {e}")
+            return False
+        if vectors.shape != (len(sections), DIMENSIONS) or idf.shape != (DIMENSIONS,):
+            # Written by a concurrent rebuild that has not finished yet
+            return False
+        self._meta, self._sections, self._vectors, self._idf = meta, sections, vectors, idf
+        return True
+
+    def _build(self, signatures: dict[str, typing.Any]):
+        """Recomputes the matrix from the documents and writes it (meta.json last)."""
+        sections: list[ValueSection] = []
+        for document_type, path in self.documents.items():
+            try:
+                sections.extend(extract_sections(document_type, read_text(path)))
+            except FileNotFoundError:
+                continue
+        features = [_features(f"{section.title}\n{section.content}") for section in sections]
+        document_frequency = np.zeros(DIMENSIONS, dtype=np.float32)
+        for counts in features:
+            document_frequency[list(counts)] += 1
+        idf = (np.log((1 + len(sections)) / (1 + document_frequency)) + 1).astype(np.float32)
+        vectors = np.zeros((len(sections), DIMENSIONS), dtype=np.float32)
+        for row, counts in enumerate(features):
+            if counts:
+                indices, values = _weighted(counts, idf)
+                vectors[row, indices] = values / np.linalg.norm(values)
+
+        def npy_bytes(array: np.ndarray) -> bytes:
+            buffer = io.BytesIO()
+            np.save(buffer, array)
+            return buffer.getvalue()
+
+        atomic_write_bytes(self._vectors_path, npy_bytes(vectors))
+        atomic_write_bytes(self._idf_path, npy_bytes(idf))
+        meta = {
+            "version": _INDEX_VERSION,
+            "dimensions": DIMENSIONS,
+            "sources": signatures,
+            "sections": [section._asdict() for section in sections],
+        }
+        atomic_write_text(self._meta_path, json.dumps(meta, ensure_ascii=False))
+
+    def _ensure_current(self):
+        signatures = self._source_signatures()
+        if self._meta is not None and self._meta["sources"] == signatures:
+            return
+        # Another process may already have rebuilt it
+        if self._load() and self._meta["sources"] == signatures:
+            return
+        with file_lock(self._meta_path):
+            if self._load() and self._meta["sources"] == signatures:
+                return
+            self._build(signatures)
+            if not self._load():
+                raise RuntimeError(f"Could not load the value index written to {self.index_dir}")
+
+    def search(self, text: str, k: int = 3,
+               document_type: typing.Optional[str] = None) -> list[tuple[ValueSection, float]]:
+        """Returns the ``k`` sections most similar to ``text`` (cosine similarity), best first."""
+        with self._lock:
+            self._ensure_current()
+            sections, vectors, idf = self._sections, self._vectors, self._idf
+        features = _features(text)
+        if not sections or not features:
+            return []
+        indices, values = _weighted(features, idf)
+        query = np.zeros(DIMENSIONS, dtype=np.float32)
+        query[indices] = values / np.linalg.norm(values)
+        scores = vectors @ query
+        if document_type is not None:
+            mask = np.fromiter((s.document_type == document_type for s in sections), dtype=bool, count=len(sections))
+            scores = np.where(mask, scores, 0.0)
+        top = np.argsort(-scores, kind='stable')[:k]
+        return [(sections[i], round(float(scores[i]), 4)) for i in top if scores[i] > 0]
@@ -2,7 +2,21 @@ import typing
 from pathlib import Path # Use pathlib for consistency, though config provides strings
 from ..models import ToolResult
 # Import the configured paths
-from ..config import PARTNERSHIP_AGREEMENT_FILE, PARTNERSHIP_COMPANION_FILE
+from ..config import PARTNERSHIP_AGREEMENT_FILE, PARTNERSHIP_COMPANION_FILE, VALUE_INDEX_DIR
+from .file_cache import read_text
+from .markdown_sections import SectionTreeCache, find_sections
+from .value_index import ValueIndex
+
+_PARTNERSHIP_FILES = {
+    "agreement": PARTNERSHIP_AGREEMENT_FILE,
+    "companion": PARTNERSHIP_COMPANION_FILE,
+}
+
+# Parsed heading trees of the partnership documents, re-parsed only when a file changes
+_section_trees = SectionTreeCache()
+
+# Hashed TF-IDF vectors of every partnership section, rebuilt only when a document changes
+_value_index = ValueIndex(VALUE_INDEX_DIR, _PARTNERSHIP_FILES)
 
 def read_partnership_documents(document_type: typing.Literal["agreement", "companion"]) -> dict:
     """
@@ -30,12 +44,8 @@ def read_partnership_documents(document_type: typing.Literal["agreement", "compa
     file_path = Path(file_path_str) # Convert string from config to Path object
 
     try:
-        # Check if file exists before attempting to open
-        if not file_path.is_file():
-             raise FileNotFoundError(f"The document '{file_path.name}' was not found at '{file_path}'.")
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Served from memory unless the document changed since it was last read
+        content = read_text(file_path)
         return ToolResult(
             status="success",
             result={"document_content": content}
@@ -43,10 +53,131 @@ def read_partnership_documents(document_type: typing.Literal["agreement", "compa
     except FileNotFoundError:
         return ToolResult(
             status="error",
-            error_message=str(e) # Use the error message from FileNotFoundError
+            error_message=f"The document '{file_path.name}' was not found at '{file_path}'."
         ).model_dump()
     except Exception as e:
         return ToolResult(
             status="error",
             error_message=f"An unexpected error occurred while reading '{file_path.name}': {str(e)}"
         ).model_dump()
+
+def _partnership_file(document_type: str) -> Path:
+    """Resolves a document type to its configured path."""
+    if document_type not in _PARTNERSHIP_FILES:
+        raise ValueError(f"Invalid document type specified: {document_type}. Must be 'agreement' or 'companion'.")
+    return Path(_PARTNERSHIP_FILES[document_type])
+
+def list_partnership_sections(document_type: typing.Literal["agreement", "companion"]) -> dict:
+    """
+    Lists the section headings of the Partnership Agreement or the Companion Document
+    without returning their content.
+
+    Args:
+        document_type: Specifies which document to inspect ('agreement' or 'companion').
+
+    Returns:
+        A dictionary containing the status and the sections (title, heading level, heading path and line),
+        or an error message.
+    """
+    try:
+        file_path = _partnership_file(document_type)
+        tree = _section_trees.get(file_path)
+        return ToolResult(
+            status="success",
+            result={"sections": [section.summary() for section in tree.sections]}
+        ).model_dump()
+    except ValueError as e:
+        return ToolResult(status="error", error_message=str(e)).model_dump()
+    except FileNotFoundError:
+        return ToolResult(
+            status="error",
+            error_message=f"The document '{file_path.name}' was not found at '{file_path}'."
+        ).model_dump()
+    except Exception as e:
+        return ToolResult(
+            status="error",
+            error_message=f"An unexpected error occurred while reading the sections of '{document_type}': {str(e)}"
+        ).model_dump()
+
+def read_partnership_section(document_type: typing.Literal["agreement", "companion"], section: str) -> dict:
+    """
+    Reads a single section (including its subsections) of the Partnership Agreement or the Companion Document.
+
+    Args:
+        document_type: Specifies which document to read from ('agreement' or 'companion').
+        section: The section to read: its title (e.g., 'Conflict Resolution'), its number (e.g., '5')
+            or a few words from its heading.
+
+    Returns:
+        A dictionary containing the status and the section content, or an error message listing the
+        available sections if none (or several) match.
+    """
+    try:
+        file_path = _partnership_file(document_type)
+        tree = _section_trees.get(file_path)
+        matches = find_sections(tree, section)
+        if len(matches) != 1:
+            candidates = matches or tree.sections
+            problem = "matches several sections" if matches else "does not match any section"
+            return ToolResult(
+                status="error",
+                error_message=f"'{section}' {problem} of the {document_type}. "
+                              f"Available: {', '.join(repr(s.title) for s in candidates)}."
+            ).model_dump()
+        match = matches[0]
+        return ToolResult(
+            status="success",
+            result={**match.summary(), "section_content": tree.content(match)}
+        ).model_dump()
+    except ValueError as e:
+        return ToolResult(status="error", error_message=str(e)).model_dump()
+    except FileNotFoundError:
+        return ToolResult(
+            status="error",
+            error_message=f"The document '{file_path.name}' was not found at '{file_path}'."
+        ).model_dump()
+    except Exception as e:
+        return ToolResult(
+            status="error",
+            error_message=f"An unexpected error occurred while reading section '{section}' of '{document_type}': {str(e)}"
+        ).model_dump()
+
+def find_relevant_values(text: str, k: int = 3,
+                         document_type: typing.Optional[typing.Literal["agreement", "companion"]] = None) -> dict:
+    """
+    Finds the partnership principles (sections of the agreement/companion) most relevant to a plan,
+    decision or situation, so it can be checked against them without reading the whole documents.
+
+    Args:
+        text: The plan, decision or situation to check (a sentence or a short paragraph works best).
+        k: How many sections to return (1-10).
+        document_type: Optionally restrict the lookup to the 'agreement' or the 'companion'.
+
+    Returns:
+        A dictionary containing the status and the most similar sections (document type, section title,
+        heading path, line, similarity score and section content), or an error message.
+    """
+    if not text or not text.strip():
+        return ToolResult(status="error", error_message="A non-empty 'text' to compare against the values is required.").model_dump()
+    try:
+        hits = _value_index.search(text, k=max(1, min(int(k), 10)), document_type=document_type)
+        values = [
+            {
+                "document_type": section.document_type,
+                "section": section.title,
+                "path": section.path,
+                "line": section.line,
+                "score": score,
+                "section_content": section.content,
+            }
+            for section, score in hits
+        ]
+        return ToolResult(
+            status="success",
+            result={"values": values, "count": len(values)}
+        ).model_dump()
+    except Exception as e:
+        return ToolResult(
+            status="error",
+            error_message=f"An unexpected error occurred while looking up relevant values: {str(e)}"
+        ).model_dump()
@@ -0,0 +1,404 @@
+"""Latency, token and I/O tracing of the agent tree.
+
+With ``TRACING_ENABLED``, every agent run, model call and tool call becomes a
+span, nested orchestrator -> agent -> model call / tool (and the agents of a
+``run_parallel_workflow`` under that tool call):
+
+* agent spans: wall time, and the callback that answered without running the
+  agent (e.g. a command message),
+* model spans: wall time, prompt/completion/cached tokens, ``cache.hit`` when
+  the response cache answered, or the callback that answered instead of the
+  LLM (e.g. the local context router),
+* tool spans: wall time, errors, and the document bytes read and written
+  (``record_io`` in ``file_cache``/``document_io``), file cache hits.
+
+The tool functions of ``test_agents.tools`` are wrapped by ``traced_tool``
+(see ``tools/__init__.py``), so tools run without an agent, e.g. by
+``python -m test_agents command``, are traced too.
+
+Finished spans are appended to ``TRACE_FILE`` as JSON lines with the field
+names of OpenTelemetry's JSON span format (``traceId``, ``spanId``,
+``parentSpanId``, ``startTimeUnixNano``, ...). The report shows p50/p95 per
+component:
+
+    python -m test_agents trace report [--kind tool] [--file traces.jsonl]
+    python -m test_agents trace clear
+"""
+import argparse
+import contextvars
+import functools
+import inspect
+import json
+import threading
+import time
+import typing
+import uuid
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .config import TRACE_FILE, TRACING_ENABLED
+
+# Agent runs kept to find a sub-agent's parent span (agent runs that never finish are dropped)
+MAX_TRACKED_SPANS = 1024
+
+
+@dataclass
+class Span:
+    """One timed operation; ``kind`` is 'agent', 'model' or 'tool'."""
+    kind: str
+    name: str
+    trace_id: str
+    parent_id: typing.Optional[str] = None
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: typing.Optional[int] = None
+    attributes: dict = field(default_factory=dict)
+    error: typing.Optional[str] = None
+    # The current span before this one was entered (restored when it ends)
+    previous: typing.Optional["Span"] = field(default=None, repr=False)
+
+    @property
+    def component(self) -> str:
+        return f"{self.kind}:{self.name}"
+
+    def add(self, key: str, amount: typing.Union[int, float]):
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def to_json(self) -> dict:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.component,
+            "kind": "SPAN_KIND_CLIENT" if self.kind == "model" else "SPAN_KIND_INTERNAL",
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": {"component.kind": self.kind, "component.name": self.name, **self.attributes},
+            "status": {"code": "STATUS_CODE_ERROR", "message": self.error} if self.error
+            else {"code": "STATUS_CODE_OK"},
+        }
+
+
+# The agent run or tool call the current code runs in
+_current_span: contextvars.ContextVar[typing.Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+
+
+def current_span() -> typing.Optional[Span]:
+    return _current_span.get()
+
+
+def record_io(bytes_read: int = 0, bytes_written: int = 0, cache_hit: bool = False):
+    """Adds document I/O to the current span (no-op when nothing is traced)."""
+    span = _current_span.get()
+    if span is None:
+        return
+    if bytes_read:
+        span.add("file.bytes_read", bytes_read)
+    if bytes_written:
+        span.add("file.bytes_written", bytes_written)
+    if cache_hit:
+        span.add("file.cache_hits", 1)
+
+
+def _callback_name(callback) -> str:
+    owner = getattr(callback, "__self__", None)
+    name = getattr(callback, "__name__", type(callback).__name__)
+    return f"{type(owner).__name__}.{name}" if owner is not None else name
+
+
+class Tracer:
+    """Creates spans from ADK callbacks and tool calls and appends them to a JSONL file."""
+
+    def __init__(self, path: typing.Union[str, Path], enabled: bool = True):
+        self.path = Path(path)
+        self.enabled = enabled
+        self._file: typing.Optional[typing.TextIO] = None
+        self._lock = threading.Lock()
+        # (invocation_id, agent name) -> agent span; ('model', ...) -> model span; function call id -> tool span
+        self._spans: "OrderedDict[typing.Hashable, Span]" = OrderedDict()
+
+    def _track(self, key, span: Span):
+        with self._lock:
+            self._spans[key] = span
+            self._spans.move_to_end(key)
+            while len(self._spans) > MAX_TRACKED_SPANS:
+                self._spans.popitem(last=False)
+
+    def _lookup(self, key, pop: bool = False) -> typing.Optional[Span]:
+        with self._lock:
+            return self._spans.pop(key, None) if pop else self._spans.get(key)
+
+    def start(self, kind: str, name: str, parent: typing.Optional[Span] = None, **attributes) -> Span:
+        return Span(kind, name, parent.trace_id if parent else uuid.uuid4().hex,
+                    parent.span_id if parent else None, attributes=attributes)
+
+    def finish(self, span: Span, error: typing.Optional[str] = None):
+        """Ends a span and appends it to the trace file."""
+        if span.end_ns is not None:
+            return
+        span.end_ns = time.time_ns()
+        span.error = span.error or error
+        line = json.dumps(span.to_json(), default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+
+    def _enter(self, span: Span):
+        span.previous = _current_span.get()
+        _current_span.set(span)
+
+    def _exit(self, span: Span):
+        if _current_span.get() is span:
+            _current_span.set(span.previous)
+
+    # --- Agent runs ---
+
+    def before_agent_callback(self, callback_context) -> None:
+        agent = callback_context.get_invocation_context().agent
+        invocation_id = callback_context.invocation_id
+        parent = None
+        if agent.parent_agent is not None:
+            parent = self._lookup((invocation_id, agent.parent_agent.name))
+        if parent is None:
+            # The agent of a nested run (e.g. a workflow step) belongs to the tool call that started it
+            current = _current_span.get()
+            parent = current if current is not None and current.kind == "tool" else None
+        span = self.start("agent", agent.name, parent, **{"invocation.id": invocation_id})
+        self._track((invocation_id, agent.name), span)
+        self._enter(span)
+        return None
+
+    def after_agent_callback(self, callback_context, answered_by: typing.Optional[str] = None) -> None:
+        agent = callback_context.get_invocation_context().agent
+        span = self._lookup((callback_context.invocation_id, agent.name))
+        if span is not None and answered_by:
+            span.attributes["agent.answered_by"] = answered_by
+        # An agent that transferred to a sub-agent gets no after-callback; its run ends with the sub-agent's
+        while agent is not None:
+            span = self._lookup((callback_context.invocation_id, agent.name))
+            if span is not None and span.end_ns is None:
+                self._exit(span)
+                self.finish(span)
+            agent = agent.parent_agent
+        return None
+
+    # --- Model calls ---
+
+    def before_model_callback(self, callback_context, llm_request) -> None:
+        parent = self._lookup((callback_context.invocation_id, callback_context.agent_name))
+        span = self.start("model", callback_context.agent_name, parent, **{"llm.model": llm_request.model or ""})
+        self._track(("model", callback_context.invocation_id, callback_context.agent_name), span)
+        return None
+
+    def after_model_callback(self, callback_context, llm_response, answered_by: typing.Optional[str] = None) -> None:
+        if llm_response.partial:
+            return None
+        span = self._lookup(("model", callback_context.invocation_id, callback_context.agent_name), pop=True)
+        if span is None:
+            return None
+        usage = llm_response.usage_metadata
+        if usage is not None:
+            span.attributes.update({
+                "llm.prompt_tokens": usage.prompt_token_count or 0,
+                "llm.completion_tokens": usage.candidates_token_count or 0,
+                "llm.cached_tokens": usage.cached_content_token_count or 0,
+            })
+        span.attributes["cache.hit"] = (llm_response.custom_metadata or {}).get("response_cache") == "hit"
+        if answered_by:
+            span.attributes["llm.answered_by"] = answered_by
+        self.finish(span, llm_response.error_message)
+        return None
+
+    # --- Tool calls ---
+
+    def before_tool_callback(self, tool, args, tool_context) -> None:
+        parent = self._lookup((tool_context.invocation_id, tool_context.agent_name))
+        span = self.start("tool", tool.name, parent, **{"agent.name": tool_context.agent_name})
+        self._track(tool_context.function_call_id, span)
+        self._enter(span)
+        return None
+
+    def after_tool_callback(self, tool, args, tool_context, tool_response) -> None:
+        span = self._lookup(tool_context.function_call_id, pop=True)
+        if span is not None:
+            status = tool_response.get("status") if isinstance(tool_response, dict) else None
+            if status == "error":
+                span.error = str(tool_response.get("error_message"))
+            elif status:
+                span.attributes["tool.status"] = status
+            self._exit(span)
+            self.finish(span)
+        return None
+
+    def on_tool_error_callback(self, tool, args, tool_context, error) -> None:
+        span = self._lookup(tool_context.function_call_id, pop=True)
+        if span is not None:
+            self._exit(span)
+            self.finish(span, f"{type(error).__name__}: {error}")
+        return None
+
+    # --- Layering onto an agent's callbacks (see agent_factory.PooledAgent) ---
+
+    def _answering(self, callback, finish: typing.Callable) -> typing.Callable:
+        """Wraps a before-callback: if it answers (skipping the agent or model), the span ends with it."""
+        async def answering(*args, **kwargs):
+            result = callback(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            if result:
+                finish(result, _callback_name(callback), **kwargs)
+            return result
+        return answering
+
+    def before_agent_callbacks(self, callbacks: list) -> list:
+        if not self.enabled:
+            return callbacks
+        finish = lambda result, name, callback_context: self.after_agent_callback(callback_context, name)
+        return [self.before_agent_callback, *(self._answering(callback, finish) for callback in callbacks)]
+
+    def after_agent_callbacks(self, callbacks: list) -> list:
+        return [self.after_agent_callback, *callbacks] if self.enabled else callbacks
+
+    def before_model_callbacks(self, callbacks: list) -> list:
+        if not self.enabled:
+            return callbacks
+        finish = lambda result, name, callback_context, llm_request: self.after_model_callback(
+            callback_context, result, name)
+        return [self.before_model_callback, *(self._answering(callback, finish) for callback in callbacks)]
+
+    def after_model_callbacks(self, callbacks: list) -> list:
+        return [self.after_model_callback, *callbacks] if self.enabled else callbacks
+
+    def before_tool_callbacks(self, callbacks: list) -> list:
+        return [self.before_tool_callback, *callbacks] if self.enabled else callbacks
+
+    def after_tool_callbacks(self, callbacks: list) -> list:
+        return [self.after_tool_callback, *callbacks] if self.enabled else callbacks
+
+    def on_tool_error_callbacks(self, callbacks: list) -> list:
+        return [self.on_tool_error_callback, *callbacks] if self.enabled else callbacks
+
+    # --- Tool functions ---
+
+    def traced_tool(self, func: typing.Callable) -> typing.Callable:
+        """Wraps a tool function so its document I/O is recorded.
+
+        Called by an agent, the I/O is added to the span of the tool call;
+        called directly (e.g. command mode), the function gets its own span.
+        """
+        if not self.enabled or not inspect.isfunction(func):
+            return func
+
+        @functools.wraps(func)
+        def traced(*args, **kwargs):
+            current = _current_span.get()
+            if current is not None and current.kind == "tool" and current.name == func.__name__:
+                return func(*args, **kwargs)
+            span = self.start("tool", func.__name__, current)
+            self._enter(span)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                span.error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                self._exit(span)
+                self.finish(span)
+            if isinstance(result, dict) and result.get("status") == "error":
+                span.error = str(result.get("error_message"))
+            return result
+
+        return traced
+
+
+# Used by every PooledAgent (agent_factory.py) and the tool functions (tools/__init__.py)
+tracer = Tracer(TRACE_FILE, TRACING_ENABLED)
+
+
+def traced_tool(func: typing.Callable) -> typing.Callable:
+    """Wraps a tool function with the shared tracer (see ``Tracer.traced_tool``)."""
+    return tracer.traced_tool(func)
+
+
+# --- Report ---
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def read_spans(path: typing.Union[str, Path]) -> list[dict]:
+    """The spans of a trace file (lines that are not valid JSON are skipped)."""
+    spans = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+
+def summarize(spans: list[dict]) -> list[dict]:
+    """One row per component: count, p50/p95/max and total milliseconds, tokens, cache hits, I/O."""
+    groups = defaultdict(list)
+    for span in spans:
+        groups[span["name"]].append(span)
+    rows = []
+    for component, members in groups.items():
+        durations = sorted((span["endTimeUnixNano"] - span["startTimeUnixNano"]) / 1e6 for span in members)
+        total = lambda key: sum(span["attributes"].get(key) or 0 for span in members)
+        rows.append({
+            "component": component,
+            "count": len(members),
+            "errors": sum(span["status"]["code"] == "STATUS_CODE_ERROR" for span in members),
+            "p50_ms": round(_percentile(durations, 0.5), 2),
+            "p95_ms": round(_percentile(durations, 0.95), 2),
+            "max_ms": round(durations[-1], 2),
+            "total_ms": round(sum(durations), 2),
+            "prompt_tokens": total("llm.prompt_tokens"),
+            "completion_tokens": total("llm.completion_tokens"),
+            "cache_hits": total("cache.hit") + total("file.cache_hits"),
+            "bytes_read": total("file.bytes_read"),
+            "bytes_written": total("file.bytes_written"),
+        })
+    return sorted(rows, key=lambda row: -row["total_ms"])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m test_agents trace",
+                                     description="Summarize or clear the traces written with TRACING_ENABLED.")
+    parser.add_argument("--file", default=TRACE_FILE, help="Trace file (JSON lines)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    report = commands.add_parser("report", help="p50/p95 latency, tokens, cache hits and I/O per component")
+    report.add_argument("--kind", choices=("agent", "model", "tool"), help="Only this kind of component")
+    report.add_argument("--json", action="store_true", help="Print the rows as JSON")
+    commands.add_parser("clear", help="Delete the trace file")
+    args = parser.parse_args(argv)
+
+    path = Path(args.file)
+    if args.command == "clear":
+        path.unlink(missing_ok=True)
+        print(f"Removed {path}")
+        return 0
+    if not path.exists():
+        print(f"No traces at {path} (set TRACING_ENABLED=true)")
+        return 1
+    spans = [span for span in read_spans(path)
+             if args.kind is None or span["attributes"].get("component.kind") == args.kind]
+    rows = summarize(spans)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"{'component':<42} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'total ms':>10} "
+          f"{'tokens in/out':>15} {'hits':>5} {'read/written B':>16}")
+    for row in rows:
+        print(f"{row['component'][:42]:<42} {row['count']:>6} {row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} "
+              f"{row['total_ms']:>10.1f} {row['prompt_tokens']:>7}/{row['completion_tokens']:<7} "
+              f"{row['cache_hits']:>5} {row['bytes_read']:>7}/{row['bytes_written']:<8}")
+    return 0
@@ -1,24 +1,40 @@
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
 from . import tools  # Import the tools package
+from .agent_factory import AgentSpec, DEFAULT_MODEL_NAME
 
-# Define the model for this agent (consistent with others)
-# Use 'model' argument instead of 'model_name'
-AGENT_MODEL = LiteLlm(model="openai/gpt-4.1-mini")
+# Define the model for this agent (shared with the other agents)
+AGENT_MODEL = DEFAULT_MODEL_NAME
 
 # Define the BASE Value Soul Agent definition
-# This can be used to instantiate multiple instances if needed.
-value_soul_agent_base = Agent(
+# Use value_soul_agent_spec.build() to instantiate it as many times as needed.
+value_soul_agent_spec = AgentSpec(
     name="ValueSoulAgent", # Keep the functional name
     description="Evaluates plans and decisions against core values defined in partnership agreements",
     model=AGENT_MODEL,
-    tools=[
-        tools.read_partnership_documents, # Assign the specific tool
-    ],
+    tools=(
+        tools.find_relevant_values,
+        tools.list_partnership_sections,
+        tools.read_partnership_section,
+        tools.search_governance_documents,
+        tools.read_partnership_documents, # Full documents, only when really needed
+    ),
     instruction=(
         "Your role is to consult the partnership documents (agreement or companion) "
-        "when requested. Use the 'read_partnership_documents' tool to fetch the "
-        "content of the specified document ('agreement' or 'companion'). "
+        "when requested, pulling in only the parts that matter for the question. "
+        "To evaluate a plan, decision or situation against the values, FIRST call 'find_relevant_values' with "
+        "a short description of it as 'text' (and 'k', default 3): it returns the most relevant principles with "
+        "their content. Base the alignment check on those; read further sections only if they are not enough. "
+        "To check something against a specific value or clause, use 'read_partnership_section' with the "
+        "'document_type' ('agreement' or 'companion') and the 'section' title or number (e.g., 'Core Values' or '2'). "
+        "If you do not know which section applies, call 'list_partnership_sections' first, then read the relevant "
+        "section in your next turn. "
+        "When you are looking for a topic rather than a section (e.g., 'what do we say about conflicts?'), "
+        "use the 'search_governance_documents' tool with a short keyword 'query' and "
+        "document_types ['partnership']: it returns the most relevant passages instead of the whole document. "
+        "Use 'read_partnership_documents' to fetch an entire document ONLY when the whole document is "
+        "explicitly requested or needs to be reviewed as a whole. "
         "Present the retrieved information clearly. If the tool fails, report the error."
     )
 )
+
+# Standalone instance of the spec
+value_soul_agent_base = value_soul_agent_spec.build()
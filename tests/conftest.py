@@ -0,0 +1,37 @@
+"""Shared test setup: every test runs against a throwaway DOCUMENTS_DIR.
+
+``test_agents.config`` resolves the document paths when it is imported, so
+the directory is set here, before any test module imports the package, and
+the ``documents_dir`` fixture empties it between tests.
+"""
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_DOCUMENTS_DIR = Path(tempfile.mkdtemp(prefix="test_documents_"))
+os.environ["DOCUMENTS_DIR"] = str(_DOCUMENTS_DIR)
+# Journals are only compacted when a test asks for it
+os.environ["TASKS_COMPACT_IDLE_SECONDS"] = "0"
+# No network access for LiteLLM's model price list
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+
+@pytest.fixture
+def documents_dir() -> Path:
+    """The (empty) documents directory, with the in-memory task lists dropped."""
+    from test_agents.tools import task_tools
+
+    for entry in _DOCUMENTS_DIR.iterdir():
+        if entry.is_dir():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
+    task_tools._task_store.invalidate()
+    return _DOCUMENTS_DIR
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_DOCUMENTS_DIR, ignore_errors=True)
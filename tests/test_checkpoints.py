@@ -0,0 +1,115 @@
+"""Resuming, compacting and pruning workflow checkpoints."""
+import types as pytypes
+
+import pytest
+from google.genai import types
+
+from test_agents.checkpoints import WORKFLOW_ID_KEY, CheckpointStore
+
+ORCHESTRATOR = "PlanningOrchestrator"
+REQUEST = "Plan the Q4 offsite"
+
+
+def _context(session_id: str, invocation_id: str = "inv-1", state: dict = None):
+    """Stands in for the callback context of an orchestrator's model call."""
+    session = pytypes.SimpleNamespace(app_name="app", user_id="user", id=session_id, events=[])
+    return pytypes.SimpleNamespace(
+        session=session, state=state or {}, agent_name=ORCHESTRATOR, invocation_id=invocation_id,
+        user_content=types.Content(role="user", parts=[types.Part(text=REQUEST)]))
+
+
+def _conversation(length: int) -> list[types.Content]:
+    return [types.Content(role="user" if i % 2 == 0 else "model", parts=[types.Part(text=f"message {i}")])
+            for i in range(length)]
+
+
+def _text(content: types.Content) -> str:
+    return "".join(part.text or "" for part in content.parts)
+
+
+@pytest.fixture
+def store(tmp_path) -> CheckpointStore:
+    return CheckpointStore(tmp_path / "checkpoints.sqlite3", compact_after=8, keep_recent=4, max_steps=50)
+
+
+def _record_drafts(store: CheckpointStore, context, drafts: int = 3):
+    store.before_model_callback(context, pytypes.SimpleNamespace(contents=_conversation(1)))
+    for i in range(drafts):
+        store.record(context, ORCHESTRATOR, "BusinessAgent", "result", "BusinessAgent", {"text": f"draft {i}"})
+
+
+def test_a_new_session_resumes_the_workflow_from_a_summary(store):
+    _record_drafts(store, _context("first"))
+
+    request = pytypes.SimpleNamespace(contents=_conversation(1))
+    store.before_model_callback(_context("second", "inv-2", {WORKFLOW_ID_KEY: "first"}), request)
+    summary = _text(request.contents[0])
+    assert len(request.contents) == 2
+    assert summary.startswith(f"The user's original request: {REQUEST}")
+    assert "Result from BusinessAgent: draft 2" in summary
+    assert _text(request.contents[1]) == "message 0"
+
+
+def test_the_workflows_own_session_gets_no_summary(store):
+    context = _context("first")
+    _record_drafts(store, context)
+
+    request = pytypes.SimpleNamespace(contents=_conversation(3))
+    store.before_model_callback(context, request)
+    assert [_text(content) for content in request.contents] == ["message 0", "message 1", "message 2"]
+
+
+def test_the_request_is_recorded_once_per_turn(store):
+    context = _context("first")
+    for _ in range(3):
+        store.before_model_callback(context, pytypes.SimpleNamespace(contents=_conversation(1)))
+    assert [checkpoint.kind for checkpoint in store.checkpoints("first")] == ["request"]
+
+
+def test_a_long_conversation_stays_within_the_compaction_bound(store):
+    context = _context("first")
+    _record_drafts(store, context)
+
+    contents = _conversation(1)
+    for _ in range(20):
+        request = pytypes.SimpleNamespace(contents=contents + _conversation(2))
+        store.before_model_callback(context, request)
+        contents = request.contents
+        assert len(contents) <= store.compact_after + 2
+    assert len(contents) <= store.keep_recent + 1 + 2
+    assert _text(contents[0]).startswith(f"The user's original request: {REQUEST}")
+    # The kept part starts at a user message
+    assert contents[1].role == "user"
+
+
+def test_prune_deletes_idle_workflows(store):
+    _record_drafts(store, _context("idle"))
+    _record_drafts(store, _context("active", "inv-2"))
+    with store._lock:
+        store._connect().execute("UPDATE checkpoints SET created = created - ? WHERE workflow_id = 'idle'",
+                                 (31 * 86400,))
+
+    assert store.prune() == 4
+    assert store.checkpoints("idle") == []
+    assert len(store.checkpoints("active")) == 4
+
+
+def test_prune_keeps_the_newest_steps(store):
+    context = _context("first")
+    for i in range(store.max_steps + 10):
+        store.record(context, ORCHESTRATOR, "BusinessAgent", "result", "BusinessAgent", {"text": f"draft {i}"})
+
+    assert store.prune() == 10
+    kept = store.checkpoints("first")
+    assert len(kept) == store.max_steps
+    assert kept[0].content == {"text": "draft 10"}
+
+
+def test_recording_prunes_at_most_once_per_interval(store, monkeypatch):
+    calls = []
+    prune = store._prune
+    monkeypatch.setattr(store, "_prune", lambda: calls.append(1) or prune())
+    context = _context("first")
+    for _ in range(5):
+        store.record(context, ORCHESTRATOR, "BusinessAgent", "result", "BusinessAgent", {"text": "draft"})
+    assert len(calls) == 1
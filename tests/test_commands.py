@@ -0,0 +1,22 @@
+"""Parsing of command-mode messages."""
+from test_agents.commands import Command, _parse_line
+
+
+def test_optional_list_parameters_accept_comma_separated_values():
+    command = _parse_line("/query_tasks user_name=Philipp fields=task_id,owner")
+    assert command == Command("query_tasks", {"user_name": "Philipp", "fields": ["task_id", "owner"]})
+
+
+def test_optional_list_parameters_accept_a_single_value():
+    assert _parse_line("/query_team_tasks user_names=Philipp").args == {"user_names": ["Philipp"]}
+    assert _parse_line("/query_team_tasks user_names=Philipp,Guillaume").args == {
+        "user_names": ["Philipp", "Guillaume"]}
+
+
+def test_list_parameters_still_accept_json():
+    assert _parse_line('/query_team_tasks user_names=\'["Philipp"]\'').args == {"user_names": ["Philipp"]}
+
+
+def test_non_list_values_are_parsed_as_json_or_kept_as_strings():
+    assert _parse_line("/query_tasks user_name=Philipp limit=5 text=budget").args == {
+        "user_name": "Philipp", "limit": 5, "text": "budget"}
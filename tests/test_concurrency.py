@@ -0,0 +1,51 @@
+"""Concurrent writers do not lose each other's updates."""
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from test_agents.config import ensure_document_dirs
+from test_agents.tools import pirate_tools, team_spirit_tools
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ARTICLES = 8
+
+
+def test_stress_task_writes_across_processes(tmp_path):
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT), "TMPDIR": str(tmp_path)}
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.stress_task_writes", "--processes", "3", "--tasks-per-process", "15",
+         "--journal-max-bytes", "1024"],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=300,
+    )
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+    assert "OK: no lost updates" in completed.stdout
+
+
+def test_concurrent_pirate_code_edits_and_meeting_logs(documents_dir, tmp_path, monkeypatch):
+    # The pirate code path is relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    Path("documents").mkdir()
+    Path(pirate_tools.PIRATE_CODE_PATH).write_text(
+        "# Pirate Code\n" + "".join(f"\n## Article {i}\n- Original rule {i}\n" for i in range(ARTICLES)),
+        encoding="utf-8")
+    ensure_document_dirs()
+
+    def edit(i):
+        return pirate_tools.edit_pirate_code(f"## Article {i}", "modify", f"- Amended rule {i}")
+
+    def log(i):
+        return team_spirit_tools.write_meeting_log(f"2026-10-{i + 1:02d}", ["Philipp", "Guillaume"], f"Notes {i}")
+
+    with ThreadPoolExecutor(max_workers=2 * ARTICLES) as pool:
+        futures = [pool.submit(job, i) for i in range(ARTICLES) for job in (edit, log)]
+        results = [future.result() for future in futures]
+
+    assert all(result["status"] == "success" for result in results), results
+    code = Path(pirate_tools.PIRATE_CODE_PATH).read_text(encoding="utf-8")
+    for i in range(ARTICLES):
+        assert f"- Amended rule {i}" in code
+        assert f"Original rule {i}" not in code
+        log_result = team_spirit_tools.read_meeting_log(f"2026-10-{i + 1:02d}")
+        assert f"Notes {i}" in str(log_result["result"])
@@ -0,0 +1,91 @@
+"""Pausing a session on a HITL request and resuming it with the answer."""
+import asyncio
+import uuid
+
+import pytest
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from benchmarks.bench_hitl import _scripted_model
+from test_agents.agent import root_agent
+from test_agents.config import LLM_MODEL
+from test_agents.hitl import FakeResponder, HitlResponder, function_response_message, hitl_store
+from test_agents.llm import register_model
+
+
+@pytest.fixture
+def runner() -> InMemoryRunner:
+    """A runner on the scripted model, under an app name of its own in the shared store."""
+    register_model(LLM_MODEL, _scripted_model(0))
+    return InMemoryRunner(agent=root_agent, app_name=f"test_hitl_{uuid.uuid4().hex[:8]}")
+
+
+@pytest.fixture
+def deliveries(monkeypatch) -> dict:
+    """Records the calls of mark_delivered and mark_call_delivered on the shared store."""
+    calls = {"mark_delivered": [], "mark_call_delivered": []}
+    for name in calls:
+        method = getattr(hitl_store, name)
+
+        def record(*args, _name=name, _method=method):
+            calls[_name].append(args)
+            return _method(*args)
+
+        monkeypatch.setattr(hitl_store, name, record)
+    return calls
+
+
+async def _pause(runner) -> str:
+    """Starts a conversation that ends paused on ask_user_to_choose_option; returns its session id."""
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id="tester")
+    message = types.Content(role="user", parts=[types.Part(text="Help us choose a hosting provider")])
+    async for _ in runner.run_async(user_id="tester", session_id=session.id, new_message=message):
+        pass
+    return session.id
+
+
+async def _texts(runner, session_id: str) -> str:
+    session = await runner.session_service.get_session(app_name=runner.app_name, user_id="tester",
+                                                       session_id=session_id)
+    return "".join(part.text or "" for event in session.events if event.content
+                   for part in event.content.parts or [])
+
+
+def test_answered_request_is_delivered_by_the_responder(runner, deliveries):
+    async def scenario():
+        session_id = await _pause(runner)
+        [pending] = hitl_store.requests(status="pending", app_name=runner.app_name)
+        assert (pending.session_id, pending.tool) == (session_id, "ask_user_to_choose_option")
+
+        [answered] = FakeResponder().answer_pending(app_name=runner.app_name)
+        assert answered.answer["result"] == {"selected_option": "AWS"}
+        assert await HitlResponder(runner).deliver_answered() == 1
+        return session_id, pending
+
+    session_id, pending = asyncio.run(scenario())
+    assert hitl_store.get(pending.request_id).status == "delivered"
+    assert deliveries["mark_delivered"] == [(pending.request_id,)]
+    assert (session_id, pending.function_call_id) in [call[:2] for call in deliveries["mark_call_delivered"]]
+    assert '"selected_option": "AWS"' in asyncio.run(_texts(runner, session_id))
+    assert hitl_store.requests(status="answered", app_name=runner.app_name) == []
+
+
+def test_answer_sent_in_the_session_marks_the_call_delivered(runner, deliveries):
+    async def scenario():
+        session_id = await _pause(runner)
+        [pending] = hitl_store.requests(status="pending", app_name=runner.app_name)
+        # As adk web does: the answer goes straight to the session, not through the store
+        answer = {"status": "success", "result": {"selected_option": "GCP"}, "error_message": None}
+        async for _ in runner.run_async(user_id="tester", session_id=session_id,
+                                        new_message=function_response_message(pending._replace(answer=answer))):
+            pass
+        return session_id, pending
+
+    session_id, pending = asyncio.run(scenario())
+    delivered = hitl_store.get(pending.request_id)
+    assert delivered.status == "delivered"
+    assert delivered.answer["result"] == {"selected_option": "GCP"}
+    assert deliveries["mark_delivered"] == []
+    assert [call[:2] for call in deliveries["mark_call_delivered"]] == [(session_id, pending.function_call_id)]
+    # It can no longer be answered from the CLI
+    assert FakeResponder().answer_pending(app_name=runner.app_name) == []
@@ -0,0 +1,87 @@
+"""Cache keys, cacheability and invalidation of the LLM response cache."""
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from test_agents.response_cache import ResponseCache, is_cacheable, request_key
+
+
+def _request(*contents: types.Content, instruction: str = "You route requests.",
+             tools: tuple = ("read_task_list",), model: str = "stub") -> LlmRequest:
+    declarations = [types.FunctionDeclaration(name=name) for name in tools]
+    return LlmRequest(model=model, contents=list(contents), config=types.GenerateContentConfig(
+        system_instruction=instruction, tools=[types.Tool(function_declarations=declarations)]))
+
+
+def _user(text: str) -> types.Content:
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+def _call(name: str, args: dict, call_id: str) -> types.Content:
+    return types.Content(role="model", parts=[types.Part(function_call=types.FunctionCall(id=call_id, name=name, args=args))])
+
+
+def _result(name: str, response: dict, call_id: str) -> types.Content:
+    return types.Content(role="user", parts=[types.Part(
+        function_response=types.FunctionResponse(id=call_id, name=name, response=response))])
+
+
+def _response(*parts: types.Part, partial: bool = False) -> LlmResponse:
+    return LlmResponse(content=types.Content(role="model", parts=list(parts)), partial=partial)
+
+
+def test_key_ignores_case_punctuation_and_spacing():
+    assert (request_key("Root", _request(_user("Show my tasks!")))
+            == request_key("Root", _request(_user("  show MY tasks"))))
+
+
+def test_key_ignores_call_ids():
+    first = _request(_user("Show my tasks"), _call("read_task_list", {"user_name": "Philipp"}, "adk-1"),
+                     _result("read_task_list", {"status": "success"}, "adk-1"))
+    second = _request(_user("Show my tasks"), _call("read_task_list", {"user_name": "Philipp"}, "adk-2"),
+                      _result("read_task_list", {"status": "success"}, "adk-2"))
+    assert request_key("Root", first) == request_key("Root", second)
+
+
+def test_key_changes_with_what_the_model_sees():
+    base = request_key("Root", _request(_user("Show my tasks")))
+    assert request_key("Other", _request(_user("Show my tasks"))) != base
+    assert request_key("Root", _request(_user("Show my tasks"), instruction="Be brief.")) != base
+    assert request_key("Root", _request(_user("Show my tasks"), tools=("write_task",))) != base
+    assert request_key("Root", _request(_user("Show my tasks"), model="other")) != base
+    assert request_key("Root", _request(_user("Show your tasks"))) != base
+    assert (request_key("Root", _request(_user("Show my tasks"), _result("read_task_list", {"n": 1}, "a")))
+            != request_key("Root", _request(_user("Show my tasks"), _result("read_task_list", {"n": 2}, "a"))))
+
+
+def test_only_complete_side_effect_free_responses_are_cacheable():
+    read = types.Part(function_call=types.FunctionCall(name="read_task_list", args={"user_name": "Philipp"}))
+    write = types.Part(function_call=types.FunctionCall(name="write_task", args={}))
+    assert is_cacheable(_response(types.Part(text="Here are your tasks.")))
+    assert is_cacheable(_response(read))
+    assert not is_cacheable(_response(write))
+    assert not is_cacheable(_response(read, write))
+    assert not is_cacheable(_response(types.Part(text="Here"), partial=True))
+    assert not is_cacheable(LlmResponse(error_code="500"))
+
+
+def test_entries_are_dropped_when_the_documents_change(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    response = _response(types.Part(text="Here are your tasks."))
+    cache.put("key", "Root", "generation-1", response)
+    assert cache.get("key", "generation-1").content.parts[0].text == "Here are your tasks."
+    assert cache.get("key", "generation-2") is None
+    assert cache.get("key", "generation-1") is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_entries_expire_and_are_evicted(tmp_path):
+    expired = ResponseCache(tmp_path / "expired.sqlite3", ttl=-1)
+    expired.put("key", "Root", "generation", _response(types.Part(text="Old")))
+    assert expired.get("key", "generation") is None
+
+    small = ResponseCache(tmp_path / "small.sqlite3", max_entries=2)
+    for key in ("a", "b", "c"):
+        small.put(key, "Root", "generation", _response(types.Part(text=key)))
+    assert small.get("a", "generation") is None
+    assert small.stats()["entries"] == 2
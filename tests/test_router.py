@@ -0,0 +1,68 @@
+"""Rules and classifier thresholds of the local context router."""
+import pytest
+
+from test_agents.router import RULE_EXAMPLES, ContextRouter, LinearRouterModel, check_rules, rule_context
+
+
+@pytest.mark.parametrize("text, expected", RULE_EXAMPLES)
+def test_rule_examples(text, expected):
+    assert rule_context(text) == expected
+
+
+def test_check_rules_reports_mismatches():
+    assert check_rules() == []
+    assert check_rules([("Mark task 1 as done", "Planning")]) == [
+        {"text": "Mark task 1 as done", "expected": "Planning", "routed": "Execution"}]
+
+
+class _FixedModel:
+    """Stands in for LinearRouterModel with fixed probabilities."""
+
+    def __init__(self, ranked):
+        self.ranked = ranked
+
+    def rank(self, text):
+        return self.ranked
+
+
+def _router(ranked, min_confidence=0.5, min_margin=0.3) -> ContextRouter:
+    router = ContextRouter(None, min_confidence=min_confidence, min_margin=min_margin)
+    router._model, router._model_loaded = _FixedModel(ranked), True
+    return router
+
+
+def test_rules_route_without_the_classifier():
+    decision = _router([("Planning", 0.99), ("Execution", 0.01)]).classify("Mark task 12 as done")
+    assert (decision.context, decision.source, decision.agent_name) == ("Execution", "rule", "ExecutionOrchestrator")
+
+
+def test_classifier_routes_a_confident_clear_winner():
+    decision = _router([("Planning", 0.9), ("Execution", 0.05)]).classify("Sketch out next year")
+    assert (decision.context, decision.source) == ("Planning", "model")
+
+
+def test_classifier_needs_a_margin_over_the_runner_up():
+    decision = _router([("Planning", 0.55), ("Execution", 0.4)]).classify("Sketch out next year")
+    assert decision.context is None
+
+
+def test_classifier_needs_the_minimum_confidence():
+    decision = _router([("Planning", 0.45), ("Execution", 0.1)]).classify("Sketch out next year")
+    assert decision.context is None
+
+
+def test_without_a_model_uncertain_requests_fall_through():
+    decision = ContextRouter(None).classify("Can you help me?")
+    assert (decision.context, decision.source) == (None, "none")
+
+
+def test_trained_model_ranks_its_training_examples(tmp_path):
+    pytest.importorskip("numpy")
+    examples = [(text, context) for text, context in RULE_EXAMPLES if context is not None]
+    model = LinearRouterModel.train(examples, epochs=100)
+    assert sum(model.predict(text)[0] == context for text, context in examples) >= 0.9 * len(examples)
+    model.save(tmp_path / "model.npz")
+    loaded = LinearRouterModel.load(tmp_path / "model.npz")
+    ranked = loaded.rank(examples[0][0])
+    assert ranked[0][0] == model.predict(examples[0][0])[0]
+    assert ranked == sorted(ranked, key=lambda item: item[1], reverse=True)
@@ -0,0 +1,123 @@
+"""Journal replay and compaction of the task lists."""
+import time
+
+from test_agents.tools import task_journal, task_tools
+from test_agents.tools.task_store import TaskRecord
+
+
+def _task(task_id: int, title: str = "Task") -> TaskRecord:
+    return TaskRecord(task_id, title, "Philipp", "2026-11-01", "Description")
+
+
+def _add(user_name: str, title: str) -> int:
+    result = task_tools.write_task(title, "Philipp", "2026-11-01", "Description", user_name)
+    assert result["status"] == "success", result
+    return result["task_id"]
+
+
+def _titles(user_name: str) -> list[str]:
+    return [task["title"] for task in task_tools.read_task_list(user_name)["result"]["tasks"]]
+
+
+def test_replay_applies_records_in_order():
+    tasks = {1: _task(1, "Old")}
+    records = [
+        task_journal.add_record(_task(2, "Added")),
+        task_journal.modify_record(1, {"status": "Done"}),
+        task_journal.batch_record([task_journal.add_record(_task(3)), task_journal.delete_record(2)]),
+    ]
+    assert task_journal.replay(tasks, records) == 3
+    assert sorted(tasks) == [1, 3]
+    assert tasks[1].status == "Done"
+
+
+def test_replay_is_idempotent():
+    records = [task_journal.add_record(_task(1)), task_journal.modify_record(1, {"title": "Renamed"})]
+    once, twice = {}, {}
+    task_journal.replay(once, records)
+    task_journal.replay(twice, records)
+    task_journal.replay(twice, records)
+    assert once == twice
+
+
+def test_replay_skips_malformed_records():
+    tasks = {}
+    assert task_journal.replay(tasks, [{"op": "add"}, {"op": "rename"}, task_journal.add_record(_task(4))]) == 1
+    assert list(tasks) == [4]
+
+
+def test_torn_trailing_record_is_ignored(documents_dir):
+    file_path = documents_dir / "tasks_Torn.md"
+    task_journal.append_records(file_path, [task_journal.add_record(_task(1))])
+    with open(task_journal.journal_path(file_path), 'a', encoding='utf-8') as f:
+        f.write('{"op": "add", "task": {"task_id": 2')
+    assert [record["task"]["task_id"] for record in task_journal.read_records(file_path)] == [1]
+
+
+def test_max_added_id_looks_into_batches():
+    records = [task_journal.add_record(_task(3)),
+               task_journal.batch_record([task_journal.add_record(_task(9)), task_journal.delete_record(3)])]
+    assert task_journal.max_added_id(records) == 9
+    assert task_journal.max_added_id([]) == 0
+
+
+def test_first_write_creates_the_markdown_file(documents_dir):
+    _add("Philipp", "First")
+    file_path = documents_dir / "tasks_Philipp.md"
+    assert file_path.exists()
+    assert not task_journal.journal_path(file_path).exists()
+    assert "| First |" in file_path.read_text(encoding='utf-8')
+
+
+def test_later_writes_are_journaled_and_replayed(documents_dir):
+    _add("Philipp", "First")
+    task_id = _add("Philipp", "Second")
+    task_tools.edit_task(task_id, "modify", "Philipp", {"status": "Done"})
+    file_path = documents_dir / "tasks_Philipp.md"
+    assert task_journal.journal_path(file_path).exists()
+    assert "Second" not in file_path.read_text(encoding='utf-8')
+
+    # Another process sees the journaled changes too
+    task_tools._task_store.invalidate()
+    tasks = task_tools.read_task_list("Philipp")["result"]["tasks"]
+    assert [(task["title"], task["status"]) for task in tasks] == [("First", "Pending"), ("Second", "Done")]
+
+
+def test_journal_is_compacted_at_the_size_threshold(documents_dir, monkeypatch):
+    monkeypatch.setattr(task_tools, "TASKS_JOURNAL_MAX_BYTES", 1)
+    _add("Philipp", "First")
+    _add("Philipp", "Second")
+    file_path = documents_dir / "tasks_Philipp.md"
+    assert not task_journal.journal_path(file_path).exists()
+    assert "| Second |" in file_path.read_text(encoding='utf-8')
+
+
+def test_compact_task_list(documents_dir):
+    _add("Philipp", "First")
+    _add("Philipp", "Second")
+    assert task_tools.compact_task_list("Philipp") is True
+    file_path = documents_dir / "tasks_Philipp.md"
+    assert not task_journal.journal_path(file_path).exists()
+    assert "| Second |" in file_path.read_text(encoding='utf-8')
+    assert task_tools.compact_task_list("Philipp") is False
+    assert _titles("Philipp") == ["First", "Second"]
+
+
+def test_compact_all_task_lists(documents_dir):
+    for user_name in ("Philipp", "Guillaume"):
+        _add(user_name, "First")
+        _add(user_name, "Second")
+    assert task_tools.compact_all_task_lists() == ["Guillaume", "Philipp"]
+    assert task_tools.compact_all_task_lists() == []
+
+
+def test_idle_compaction(documents_dir, monkeypatch):
+    monkeypatch.setattr(task_tools, "TASKS_COMPACT_IDLE_SECONDS", 0.05)
+    _add("Philipp", "First")
+    _add("Philipp", "Second")
+    journal = task_journal.journal_path(documents_dir / "tasks_Philipp.md")
+    deadline = time.monotonic() + 5
+    while journal.exists() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert not journal.exists()
+    assert _titles("Philipp") == ["First", "Second"]
@@ -0,0 +1,195 @@
+"""Bulk operations, task IDs and queries of the task tools."""
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from test_agents.config import TASK_ID_COUNTER_FILE
+from test_agents.models import TaskQueryResult
+from test_agents.tools import task_tools
+from test_agents.tools.task_ids import TaskIdAllocator
+
+
+def _new_task(title: str, assignee: str = "Philipp", deadline: str = "2026-11-01",
+              description: str = "Description") -> dict:
+    return {"task_title": title, "assignee": assignee, "deadline": deadline, "description": description}
+
+
+def _add(user_name: str, title: str, **fields) -> int:
+    task = _new_task(title, **fields)
+    result = task_tools.write_task(task["task_title"], task["assignee"], task["deadline"], task["description"],
+                                   user_name)
+    assert result["status"] == "success", result
+    return result["task_id"]
+
+
+def _tasks(user_name: str) -> list[dict]:
+    return task_tools.read_task_list(user_name)["result"]["tasks"]
+
+
+# --- Bulk operations ---
+
+def test_bulk_write_adds_every_task(documents_dir):
+    result = task_tools.write_tasks_bulk("Philipp", [_new_task("A"), _new_task("B")])
+    assert result["status"] == "success"
+    assert [task["title"] for task in _tasks("Philipp")] == ["A", "B"]
+
+
+def test_bulk_write_with_an_invalid_item_writes_nothing(documents_dir):
+    invalid = {"task_title": "No deadline", "assignee": "Philipp", "description": "Description"}
+    result = task_tools.write_tasks_bulk("Philipp", [_new_task("A"), invalid])
+    assert result["status"] == "error"
+    assert [item["status"] for item in result["results"]] == ["not_applied", "error"]
+    assert _tasks("Philipp") == []
+    assert not (documents_dir / "tasks_Philipp.md").exists()
+
+
+def test_bulk_edit_with_a_missing_task_changes_nothing(documents_dir):
+    task_id = _add("Philipp", "Keep")
+    result = task_tools.edit_tasks_bulk("Philipp", [
+        {"task_id": task_id, "action": "modify", "updates": {"status": "Done"}},
+        {"task_id": task_id + 100, "action": "delete"},
+    ])
+    assert result["status"] == "error"
+    assert [(task["title"], task["status"]) for task in _tasks("Philipp")] == [("Keep", "Pending")]
+
+
+def test_bulk_edit_applies_every_operation(documents_dir):
+    first, second = _add("Philipp", "First"), _add("Philipp", "Second")
+    result = task_tools.edit_tasks_bulk("Philipp", [
+        {"task_id": first, "action": "modify", "updates": {"status": "Done"}},
+        {"task_id": second, "action": "delete"},
+    ])
+    assert result["status"] == "success"
+    assert [(task["title"], task["status"]) for task in _tasks("Philipp")] == [("First", "Done")]
+
+
+def test_bulk_edit_with_an_invalid_operation_changes_nothing(documents_dir):
+    task_id = _add("Philipp", "Keep")
+    result = task_tools.edit_tasks_bulk("Philipp", [
+        {"task_id": task_id, "action": "delete"},
+        {"task_id": task_id, "action": "rename"},
+    ])
+    assert result["status"] == "error"
+    assert [item["status"] for item in result["results"]] == ["not_applied", "error"]
+    assert [task["title"] for task in _tasks("Philipp")] == ["Keep"]
+
+
+def test_empty_bulk_requests_are_rejected(documents_dir):
+    assert task_tools.write_tasks_bulk("Philipp", [])["status"] == "error"
+    assert task_tools.edit_tasks_bulk("Philipp", [])["status"] == "error"
+    assert task_tools.write_tasks_bulk("", [_new_task("A")])["status"] == "error"
+    assert not (documents_dir / "tasks_Philipp.md").exists()
+
+
+# --- Task IDs ---
+
+def test_task_ids_are_unique_across_lists(documents_dir):
+    ids = [_add("Philipp", "A"), _add("Guillaume", "B"), _add("Philipp", "C")]
+    ids += [item["task_id"] for item in task_tools.write_tasks_bulk("Guillaume", [_new_task("D"), _new_task("E")])["results"]]
+    assert ids == sorted(set(ids))
+
+
+def test_missing_counter_is_seeded_from_the_lists(documents_dir):
+    _add("Philipp", "A")
+    highest = _add("Guillaume", "B")
+    _add("Guillaume", "C") # Journaled, not yet in the markdown table
+    highest += 1
+    task_tools._task_store.invalidate()
+    Path(TASK_ID_COUNTER_FILE).unlink()
+    assert task_tools._max_task_id_across_lists() == highest
+    assert _add("Philipp", "D") == highest + 1
+
+
+def test_allocator_respects_the_counter_and_the_floor(tmp_path):
+    bootstraps = []
+    allocator = TaskIdAllocator(tmp_path / "counter", bootstrap=lambda: bootstraps.append(1) or 10)
+    assert allocator.allocate() == [11]
+    assert allocator.allocate(3) == [12, 13, 14]
+    assert allocator.allocate(floor=20) == [21]
+    assert len(bootstraps) == 1
+
+
+def test_allocator_rebuilds_a_corrupt_counter(tmp_path):
+    counter = tmp_path / "counter"
+    counter.write_text("garbage\n", encoding='utf-8')
+    assert TaskIdAllocator(counter, bootstrap=lambda: 5).allocate() == [6]
+
+
+def test_concurrent_first_writes_with_a_missing_counter(documents_dir, monkeypatch):
+    _add("Philipp", "A")
+    _add("Guillaume", "B")
+    Path(TASK_ID_COUNTER_FILE).unlink()
+    bootstrap = task_tools._task_ids._bootstrap
+
+    def slow_bootstrap():
+        # Widens the window in which the other writer holds its list's locks
+        time.sleep(0.2)
+        return bootstrap()
+
+    monkeypatch.setattr(task_tools._task_ids, "_bootstrap", slow_bootstrap)
+    results = {}
+    threads = [threading.Thread(target=lambda user=user: results.setdefault(user, _add(user, "C")), daemon=True)
+               for user in ("Philipp", "Guillaume")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    assert not any(thread.is_alive() for thread in threads), "writers deadlocked"
+    assert sorted(results.values()) == [3, 4]
+
+
+
+# --- Queries ---
+
+@pytest.fixture
+def team_tasks(documents_dir):
+    _add("Philipp", "Draft budget", assignee="Philipp", deadline="2026-11-01", description="Q4 numbers")
+    _add("Philipp", "Review contract", assignee="Guillaume", deadline="2026-11-15", description="Legal")
+    _add("Philipp", "Plan offsite", assignee="Philipp", deadline="2026-12-01", description="Team event")
+    _add("Guillaume", "Hire designer", assignee="Guillaume", deadline="2026-11-10", description="Budget approved")
+    first = task_tools.query_tasks("Philipp", text="budget")["result"]["tasks"][0]["task_id"]
+    task_tools.edit_task(first, "modify", "Philipp", {"status": "Done"})
+
+
+def _query_titles(**filters) -> list[str]:
+    result = task_tools.query_tasks("Philipp", **filters)
+    assert result["status"] == "success", result
+    return [task["title"] for task in result["result"]["tasks"]]
+
+
+def test_query_filters(team_tasks):
+    assert _query_titles(assignee="philipp") == ["Draft budget", "Plan offsite"]
+    assert _query_titles(status="done") == ["Draft budget"]
+    assert _query_titles(deadline_from="2026-11-02", deadline_to="2026-11-30") == ["Review contract"]
+    assert _query_titles(text="TEAM") == ["Plan offsite"]
+    assert _query_titles(assignee="Philipp", status="Pending") == ["Plan offsite"]
+
+
+def test_query_sorting_pagination_and_fields(team_tasks):
+    assert _query_titles(sort_by="deadline", descending=True) == ["Plan offsite", "Review contract", "Draft budget"]
+    first_page = task_tools.query_tasks("Philipp", limit=2, fields=["title"])["result"]
+    assert first_page["total_matches"] == 3
+    assert all(set(task) == {"task_id", "title"} for task in first_page["tasks"])
+    second_page = task_tools.query_tasks("Philipp", limit=2, cursor=first_page["next_cursor"])["result"]
+    assert [task["title"] for task in second_page["tasks"]] == ["Plan offsite"]
+    assert second_page["next_cursor"] is None
+
+
+def test_query_result_has_the_model_shape(team_tasks):
+    for result in (task_tools.query_tasks("Philipp")["result"], task_tools.query_team_tasks()["result"]):
+        assert result == TaskQueryResult.model_validate(result).model_dump()
+
+
+def test_invalid_query_is_an_error(team_tasks):
+    assert task_tools.query_tasks("Philipp", cursor="abc")["status"] == "error"
+    assert task_tools.query_tasks("Philipp", sort_by="priority")["status"] == "error"
+
+
+def test_team_query_searches_every_list(team_tasks):
+    result = task_tools.query_team_tasks(text="budget")["result"]
+    assert [(task["user_name"], task["title"]) for task in result["tasks"]] == [
+        ("Philipp", "Draft budget"), ("Guillaume", "Hire designer")]
+    only_guillaume = task_tools.query_team_tasks(user_names=["Guillaume"])["result"]["tasks"]
+    assert [task["title"] for task in only_guillaume] == ["Hire designer"]
@@ -0,0 +1,105 @@
+"""Scheduling of parallel workflow steps, with stub step runners."""
+import asyncio
+
+import pytest
+
+from test_agents.context_orchestrators.specialists import specialist_specs
+from test_agents.context_orchestrators.workflows import (
+    WORKFLOWS,
+    Workflow,
+    WorkflowStep,
+    execute_workflow,
+    read_only_specs,
+)
+from test_agents.tools import WRITE_TOOLS
+
+
+class _StubRunner:
+    """Answers every step after a short delay and records the order and overlap of the calls."""
+
+    def __init__(self, delay: float = 0.02, failing: tuple[str, ...] = ()):
+        self.delay = delay
+        self.failing = failing
+        self.events: list[tuple[str, str]] = []
+        self.prompts: dict[str, str] = {}
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, step: WorkflowStep, prompt: str) -> str:
+        self.events.append(("start", step.name))
+        self.prompts[step.name] = prompt
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if step.name in self.failing:
+                raise RuntimeError(f"{step.name} failed")
+            return f"output of {step.name}"
+        finally:
+            self.running -= 1
+            self.events.append(("end", step.name))
+
+
+def _independent(count: int) -> Workflow:
+    return Workflow("independent", "Independent steps", tuple(
+        WorkflowStep(f"step{i}", "BusinessAgent", f"Task {i}") for i in range(count)))
+
+
+def test_steps_start_after_their_dependencies():
+    workflow = WORKFLOWS["Evaluation"]["value_alignment"]
+    runner = _StubRunner()
+    result = asyncio.run(execute_workflow(workflow, "Are we on track?", runner))
+
+    assert all(step["status"] == "success" for step in result["steps"].values())
+    assert list(result["steps"]) == ["values", "project_status", "alignment_check"]
+    start = runner.events.index(("start", "alignment_check"))
+    assert runner.events.index(("end", "values")) < start
+    assert runner.events.index(("end", "project_status")) < start
+    # The independent steps overlap
+    assert runner.events[:2] == [("start", "values"), ("start", "project_status")]
+    prompt = runner.prompts["alignment_check"]
+    assert "Request: Are we on track?" in prompt
+    assert "[values]\noutput of values" in prompt and "[project_status]\noutput of project_status" in prompt
+    assert workflow.stages == [["values", "project_status"], ["alignment_check"]]
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 2, 5])
+def test_the_semaphore_bounds_concurrent_steps(max_concurrency):
+    runner = _StubRunner()
+    result = asyncio.run(execute_workflow(_independent(5), "request", runner, max_concurrency=max_concurrency))
+
+    assert runner.max_running == max_concurrency
+    assert all(step["status"] == "success" for step in result["steps"].values())
+
+
+def test_a_failed_step_skips_its_dependents_only():
+    workflow = WORKFLOWS["Planning"]["meeting_analysis"]
+    runner = _StubRunner(failing=("extracted_items",))
+    steps = asyncio.run(execute_workflow(workflow, "request", runner))["steps"]
+
+    assert steps["extracted_items"]["status"] == "error"
+    assert steps["extracted_items"]["output"] == "RuntimeError: extracted_items failed"
+    assert steps["value_alignment"] == {"agent": "ValueSoulAgent", "status": "skipped", "output": None,
+                                        "seconds": 0.0}
+    assert steps["interaction_analysis"]["status"] == "success"
+    assert "value_alignment" not in runner.prompts
+
+
+def test_workflows_reject_unknown_agents_and_forward_dependencies():
+    with pytest.raises(ValueError, match="unknown agent"):
+        Workflow("bad", "", (WorkflowStep("a", "NoSuchAgent", "Task"),))
+    with pytest.raises(ValueError, match="unknown or later"):
+        Workflow("bad", "", (WorkflowStep("a", "BusinessAgent", "Task", after=("b",)),
+                             WorkflowStep("b", "BusinessAgent", "Task")))
+
+
+def test_read_only_specs_leave_out_the_write_tools():
+    specs, read_only = specialist_specs(), read_only_specs()
+
+    assert set(read_only) == set(specs)
+    for name, spec in read_only.items():
+        names = {tool.__name__ for tool in spec.tools}
+        assert not names & WRITE_TOOLS
+        assert names == {tool.__name__ for tool in specs[name].tools} - WRITE_TOOLS
+        assert "you can only read documents" in spec.instruction
+    assert any(tool.__name__ in WRITE_TOOLS for spec in specs.values() for tool in spec.tools)